@@ -0,0 +1,459 @@
+"""
+AI Notes Summarizer - HTTP API
+A headless ASGI service that summarizes PDF files and text content.
+
+Run with:
+    python api.py
+or:
+    uvicorn api:app --host 0.0.0.0 --port 8000
+"""
+
+import asyncio
+import contextvars
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Optional, Union
+from urllib.parse import parse_qs
+
+from modules.batch_scheduler import BatchScheduler
+from modules.cache import ExtractionCache, SummaryCache
+from modules.cpu_scheduler import CPUScheduler
+from modules.errors import SummarizerError
+from modules.metrics import Metrics
+from modules.model_registry import ModelRegistry
+from modules.pdf_processor import PDFProcessor, SpooledUpload, UploadedBytes
+from modules.text_summarizer import TextSummarizer
+
+
+class SummarizerAPI:
+    """ASGI application serving one shared model to many clients"""
+
+    def __init__(self):
+        self.metrics = Metrics(
+            enabled=os.getenv("METRICS_ENABLED", "false").lower() == "true"
+        )
+
+        cache_dir = os.getenv("SUMMARY_CACHE_DIR")
+        self.pdf_processor = PDFProcessor(
+            metrics=self.metrics,
+            backend=os.getenv("PDF_BACKEND", "auto"),
+            extraction_cache=(
+                ExtractionCache(
+                    os.path.join(cache_dir, "extractions.sqlite3"),
+                    max_disk_bytes=int(os.getenv("EXTRACTION_CACHE_MAX_MB", "200"))
+                    * 1024
+                    * 1024,
+                )
+                if cache_dir
+                else None
+            ),
+        )
+        self.pdf_processor.max_file_size = (
+            int(os.getenv("MAX_FILE_SIZE_MB", "10")) * 1024 * 1024
+        )
+        large_file_mb = os.getenv("MAX_LARGE_FILE_SIZE_MB")
+        if large_file_mb:
+            self.pdf_processor.max_large_file_size = int(large_file_mb) * 1024 * 1024
+            self.pdf_processor.spool_dir = os.getenv("SPOOL_DIR") or None
+
+        # Largest JSON body accepted by /summarize/text
+        self.max_text_body = int(os.getenv("API_MAX_TEXT_MB", "10")) * 1024 * 1024
+
+        self.text_summarizer = TextSummarizer(
+            model_name=os.getenv("DEFAULT_MODEL", "facebook/bart-large-cnn"),
+            backend=os.getenv("INFERENCE_BACKEND", "torch"),
+            cache=SummaryCache(
+                disk_path=(
+                    os.path.join(cache_dir, "summaries.sqlite3") if cache_dir else None
+                ),
+                max_disk_bytes=int(os.getenv("SUMMARY_CACHE_MAX_MB", "100"))
+                * 1024
+                * 1024,
+            ),
+            registry=ModelRegistry(
+                max_models=1,
+                onnx_cache_dir=os.getenv("ONNX_CACHE_DIR"),
+                artifact_dir=os.getenv("MODEL_ARTIFACT_DIR"),
+            ),
+            metrics=self.metrics,
+            # The batch scheduler runs one batch at a time, on the whole core budget
+            cpu_scheduler=CPUScheduler(
+                cores=int(os.getenv("CPU_CORE_BUDGET", "0")) or None,
+                slots=1,
+                metrics=self.metrics,
+            ),
+        )
+        extractive_ratio = os.getenv("EXTRACTIVE_RATIO")
+        self.text_summarizer.extractive_ratio = (
+            float(extractive_ratio) if extractive_ratio else None
+        )
+
+        self.scheduler = BatchScheduler(
+            self.text_summarizer,
+            max_batch_size=int(os.getenv("API_MAX_BATCH_SIZE", "8")),
+            max_wait=float(os.getenv("API_MAX_BATCH_WAIT_MS", "50")) / 1000,
+        )
+
+        self.ready = False  # Set once the model is loaded and warmed up
+
+        # Requests run their CPU-light stages here while the scheduler owns the model
+        self.executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv("API_WORKERS", "16")),
+            thread_name_prefix="api-request",
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+
+        if scope["type"] != "http":
+            return
+
+        route = (scope["method"], scope["path"].rstrip("/") or "/")
+        if route == ("GET", "/health"):
+            # Not ready until the warm-up generation has run, so load balancers
+            # and container health checks hold traffic back until then
+            status, payload = (200 if self.ready else 503), {
+                "status": "ok" if self.ready else "starting",
+                "ready": self.ready,
+                "model_loaded": self.text_summarizer.summarizer is not None,
+                "pdf_backend": self.pdf_processor.backend.name,
+            }
+        elif route == ("GET", "/metrics"):
+            await self._send(
+                send,
+                200,
+                self.metrics.prometheus_text().encode("utf-8"),
+                b"text/plain; version=0.0.4; charset=utf-8",
+            )
+            return
+        elif route == ("POST", "/summarize/text"):
+            body = await self._read_body(scope, receive, self.max_text_body)
+            if body is None:
+                status, payload = self._too_large(self.max_text_body)
+            else:
+                status, payload = await self._summarize_text(scope, body)
+        elif route == ("POST", "/summarize/pdf"):
+            upload = await self._read_pdf(scope, receive)
+            if upload is None:
+                status, payload = self._too_large(self.pdf_processor.size_limit)
+            else:
+                try:
+                    status, payload = await self._summarize_pdf(scope, upload)
+                finally:
+                    if isinstance(upload, SpooledUpload):
+                        upload.remove()
+        else:
+            status, payload = 404, {"error": "Not found"}
+
+        await self._send_json(send, status, payload)
+
+    async def _lifespan(self, receive, send):
+        """Load and warm up the model and start the scheduler before serving requests"""
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    await self._run(self.text_summarizer.load_model)
+                    await self._run(
+                        self.text_summarizer.registry.warm_up,
+                        self.text_summarizer.model_name,
+                        self.text_summarizer.backend,
+                    )
+                except SummarizerError as e:
+                    await send({"type": "lifespan.startup.failed", "message": str(e)})
+                    return
+                self.scheduler.start()
+                self.ready = True
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.scheduler.stop()
+                self.executor.shutdown(wait=False)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _summarize_text(self, scope, body: bytes):
+        """
+        Handle POST /summarize/text with a JSON body of the form
+        {"text": "...", "incremental": false}
+        """
+        try:
+            request = json.loads(body or b"{}")
+            text = request.get("text")
+        except (ValueError, AttributeError):
+            return 400, {"error": "Request body must be a JSON object"}
+
+        if not isinstance(text, str):
+            return 422, {"error": "Field 'text' must be a string"}
+
+        incremental = self._parse_flag(request.get("incremental", False))
+        if incremental is None:
+            return 422, {"error": "Field 'incremental' must be true or false"}
+
+        with self._trace(scope) as trace:
+            try:
+                result = await self._run(
+                    self.text_summarizer.summarize, text, incremental
+                )
+            except SummarizerError as e:
+                return 422, {"error": str(e)}
+
+        payload = {
+            "summary": result.summary,
+            "chunks": result.chunk_count,
+            "failed_chunks": result.failed_chunks,
+            "cached": result.cached,
+        }
+        if trace is not None:
+            payload["trace"] = trace.to_dict()
+        return 200, payload
+
+    async def _summarize_pdf(self, scope, upload: Union[UploadedBytes, SpooledUpload]):
+        """
+        Handle POST /summarize/pdf with the raw PDF file as the request body
+
+        Spooled uploads are summarized page by page, like large documents
+        in the web UI, so their text is never held in memory as a whole.
+        """
+        with self._trace(scope) as trace:
+            try:
+                self.pdf_processor.check_pdf(upload)
+                if isinstance(upload, SpooledUpload):
+                    result, page_count, failed_pages = await self._run(
+                        self._summarize_pages, upload
+                    )
+                else:
+                    extraction = await self._run(self.pdf_processor.process, upload)
+                    result = await self._run(
+                        self.text_summarizer.summarize, extraction.text
+                    )
+                    page_count = extraction.page_count
+                    failed_pages = extraction.failed_pages
+            except SummarizerError as e:
+                return 422, {"error": str(e)}
+
+        payload = {
+            "summary": result.summary,
+            "pages": page_count,
+            "failed_pages": failed_pages,
+            "chunks": result.chunk_count,
+            "failed_chunks": result.failed_chunks,
+            "cached": result.cached,
+        }
+        if trace is not None:
+            payload["trace"] = trace.to_dict()
+        return 200, payload
+
+    def _summarize_pages(self, upload: SpooledUpload):
+        """
+        Extract, clean and summarize a spooled PDF page by page
+
+        Returns:
+            Tuple: SummaryResult, page count and numbers of the failed pages
+        """
+        page_count = 0
+        failed_pages = []
+
+        def pages():
+            nonlocal page_count
+            for page_number, page_text in self.pdf_processor.iter_pages(upload):
+                page_count = page_number
+                if page_text is None:
+                    failed_pages.append(page_number)
+                    continue
+                processed_text = self.pdf_processor.preprocess_text(page_text)
+                if processed_text:
+                    yield processed_text
+
+        result = self.text_summarizer.summarize_stream(pages())
+        return result, page_count, failed_pages
+
+    async def _read_pdf(
+        self, scope, receive
+    ) -> Optional[Union[UploadedBytes, SpooledUpload]]:
+        """
+        Read a PDF request body
+
+        Bodies up to max_file_size are kept in memory. In large-document mode,
+        longer bodies are spooled to a temporary file in spool_dir as they
+        arrive, up to max_large_file_size; the caller removes the file.
+
+        Returns:
+            The upload, or None if the body is too large
+        """
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        headers = dict(scope.get("headers", []))
+        name = query.get("filename", ["upload.pdf"])[0]
+        content_type = headers.get(b"content-type", b"application/pdf").decode(
+            "latin-1"
+        )
+
+        processor = self.pdf_processor
+        if processor.max_large_file_size is None:
+            body = await self._read_body(scope, receive, processor.max_file_size)
+            if body is None:
+                return None
+            return UploadedBytes(body, name=name, type=content_type)
+
+        limit = processor.size_limit
+        if self._declared_length(scope) > limit:
+            return None  # Rejected before any of it is read
+
+        parts = []
+        size = 0
+        spool = None
+        digest = hashlib.sha256()
+        complete = False
+        try:
+            more_body = True
+            while more_body:
+                message = await receive()
+                part = message.get("body", b"")
+                size += len(part)
+                if size > limit:
+                    return None
+                if spool is None and size > processor.max_file_size:
+                    # Too large to buffer: move what has arrived so far to disk
+                    spool = tempfile.NamedTemporaryFile(
+                        prefix="upload-",
+                        suffix=".pdf",
+                        dir=processor.spool_dir,
+                        delete=False,
+                    )
+                    parts.append(part)
+                    part = b"".join(parts)
+                    parts = []
+                if spool is None:
+                    parts.append(part)
+                else:
+                    digest.update(part)
+                    await self._run(spool.write, part)
+                more_body = message.get("more_body", False)
+            complete = True
+        finally:
+            if spool is not None:
+                spool.close()
+                if not complete:
+                    os.remove(spool.name)
+
+        if spool is None:
+            return UploadedBytes(b"".join(parts), name=name, type=content_type)
+        return SpooledUpload(
+            spool.name, name, content_type, sha256=digest.hexdigest()
+        )
+
+    def _trace(self, scope):
+        """Trace the request if its query string asks for it with trace=1"""
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        if query.get("trace", ["0"])[0] in ("1", "true"):
+            return self.metrics.trace()
+        return nullcontext()
+
+    async def _run(self, func, *args):
+        """Run a blocking call on the request thread pool in the caller's context"""
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(self.executor, context.run, func, *args)
+
+    @staticmethod
+    def _parse_flag(value) -> Optional[bool]:
+        """Parse a JSON boolean, also accepting "true"/"false" and 1/0 (None if invalid)"""
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, int) and value in (0, 1):
+            return bool(value)
+        if isinstance(value, str) and value.strip().lower() in ("true", "1"):
+            return True
+        if isinstance(value, str) and value.strip().lower() in ("false", "0"):
+            return False
+        return None
+
+    @staticmethod
+    async def _read_body(scope, receive, limit: int) -> Optional[bytes]:
+        """
+        Read the request body, giving up as soon as it is known to exceed limit
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive callable
+            limit: Largest accepted body in bytes
+
+        Returns:
+            Optional[bytes]: The body, or None if it is too large
+        """
+        if SummarizerAPI._declared_length(scope) > limit:
+            return None  # Rejected before any of it is read
+
+        parts = []
+        size = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            part = message.get("body", b"")
+            size += len(part)
+            if size > limit:
+                return None
+            parts.append(part)
+            more_body = message.get("more_body", False)
+        return b"".join(parts)
+
+    @staticmethod
+    def _declared_length(scope) -> int:
+        """Body size from the Content-Length header (0 if missing or invalid)"""
+        headers = dict(scope.get("headers", []))
+        try:
+            return int(headers.get(b"content-length", b"0"))
+        except ValueError:
+            return 0
+
+    @staticmethod
+    def _too_large(limit: int):
+        """Response for a request body over the size limit"""
+        return 413, {
+            "error": f"Request body exceeds limit ({limit / 1024 / 1024:.0f}MB)"
+        }
+
+    @staticmethod
+    async def _send_json(send, status: int, payload: dict):
+        """Send a JSON response"""
+        await SummarizerAPI._send(
+            send, status, json.dumps(payload).encode("utf-8"), b"application/json"
+        )
+
+    @staticmethod
+    async def _send(send, status: int, body: bytes, content_type: bytes):
+        """Send a response"""
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", content_type),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+app = SummarizerAPI()
+
+
+def main():
+    """Serve the API with uvicorn"""
+    import uvicorn
+
+    uvicorn.run(
+        app,
+        host=os.getenv("API_HOST", "0.0.0.0"),
+        port=int(os.getenv("API_PORT", "8000")),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,27 +4,380 @@ A Streamlit web application for summarizing PDF files and text content using AI.
 """
 
 import streamlit as st
+import copy
+import io
+import itertools
 import os
+import threading
+import time
+import zipfile
+from functools import partial
 from pathlib import Path
+from typing import List, Optional, Union
 
 # Import custom modules
-from modules.pdf_processor import PDFProcessor
-from modules.text_summarizer import TextSummarizer
+from modules.jobs import CANCELLED, DONE, FAILED, QUEUED, JobExecutor, JobReporter
+from modules.pdf_processor import (
+    ExtractionResult,
+    PDFProcessor,
+    SpooledUpload,
+    UploadedBytes,
+)
+from modules.text_summarizer import SummaryResult, TextSummarizer
+from modules.cache import ExtractionCache, SummaryCache
+from modules.cpu_scheduler import CPUScheduler
+from modules.generation_policy import DEFAULT_PRESET, PRESETS
+from modules.model_registry import shared_registry
+from modules.metrics import Metrics
+from modules.streamlit_adapter import (
+    StreamlitReporter,
+    display_job_status,
+    display_summary_stats,
+)
 from modules.utils import (
     setup_logging,
     validate_input,
-    display_summary_stats,
     format_file_size,
 )
 
 
+JOB_POLL_INTERVAL = 0.5  # Seconds between refreshes while jobs are running
+PREVIEW_CHARS = 1000  # Extracted text kept for the preview
+
+
+def model_registry_settings() -> dict:
+    """Get the model registry settings from the environment"""
+    # Keep recently used models resident so switching models does not reload them
+    budget_mb = os.getenv("MODEL_MEMORY_BUDGET_MB")
+    return {
+        "max_models": int(os.getenv("MODEL_REGISTRY_MAX_MODELS", "2")),
+        "memory_budget_mb": int(budget_mb) if budget_mb else None,
+        "onnx_cache_dir": os.getenv("ONNX_CACHE_DIR"),
+        "artifact_dir": os.getenv("MODEL_ARTIFACT_DIR"),
+    }
+
+
+def preload_model_names() -> List[str]:
+    """Get the models to load and warm up at startup from the environment"""
+    return [
+        name.strip()
+        for name in os.getenv("PRELOAD_MODELS", "").split(",")
+        if name.strip()
+    ]
+
+
 # Initialize components
 @st.cache_resource
 def initialize_components():
     """Initialize PDF processor and text summarizer"""
-    pdf_processor = PDFProcessor()
-    text_summarizer = TextSummarizer()
-    return pdf_processor, text_summarizer
+    reporter = StreamlitReporter()
+    metrics = Metrics(enabled=os.getenv("METRICS_ENABLED", "false").lower() == "true")
+    # Persist summaries and extracted pages across restarts when a cache directory is configured
+    cache_dir = os.getenv("SUMMARY_CACHE_DIR")
+    extraction_cache = (
+        ExtractionCache(
+            os.path.join(cache_dir, "extractions.sqlite3"),
+            max_disk_bytes=int(os.getenv("EXTRACTION_CACHE_MAX_MB", "200")) * 1024 * 1024,
+        )
+        if cache_dir
+        else None
+    )
+    pdf_processor = PDFProcessor(
+        reporter=reporter,
+        metrics=metrics,
+        extraction_cache=extraction_cache,
+        backend=os.getenv("PDF_BACKEND", "auto"),
+    )
+    pdf_processor.max_file_size = int(os.getenv("MAX_FILE_SIZE_MB", "10")) * 1024 * 1024
+
+    # Larger files are spooled to disk and extracted page by page
+    large_file_mb = os.getenv("MAX_LARGE_FILE_SIZE_MB")
+    if large_file_mb:
+        pdf_processor.max_large_file_size = int(large_file_mb) * 1024 * 1024
+        pdf_processor.spool_dir = os.getenv("SPOOL_DIR") or None
+
+    summary_cache = SummaryCache(
+        disk_path=os.path.join(cache_dir, "summaries.sqlite3") if cache_dir else None,
+        max_disk_bytes=int(os.getenv("SUMMARY_CACHE_MAX_MB", "100")) * 1024 * 1024,
+    )
+
+    # Models preloaded by serve.py are already resident in the shared registry
+    model_registry = shared_registry(**model_registry_settings())
+
+    # Warm configured models in the background while the UI starts
+    preload_models = preload_model_names()
+    if preload_models:
+        threading.Thread(
+            target=model_registry.preload,
+            args=(preload_models, os.getenv("INFERENCE_BACKEND", "torch"), True),
+            name="model-preload",
+            daemon=True,
+        ).start()
+
+    # Sessions share the cores instead of each generating on all of them
+    core_budget = os.getenv("CPU_CORE_BUDGET")
+    generation_slots = os.getenv("GENERATION_SLOTS")
+    cpu_scheduler = CPUScheduler(
+        cores=int(core_budget) if core_budget else None,
+        slots=int(generation_slots) if generation_slots else None,
+        metrics=metrics,
+    )
+
+    text_summarizer = TextSummarizer(
+        cache=summary_cache,
+        reporter=reporter,
+        registry=model_registry,
+        backend=os.getenv("INFERENCE_BACKEND", "torch"),
+        metrics=metrics,
+        cpu_scheduler=cpu_scheduler,
+    )
+
+    # Summaries run here so reruns and other sessions are never blocked by them
+    job_executor = JobExecutor(max_workers=int(os.getenv("JOB_WORKERS", "2")))
+    return pdf_processor, text_summarizer, job_executor
+
+
+def summarize_pdf_job(
+    pdf_processor: PDFProcessor,
+    text_summarizer: TextSummarizer,
+    upload: Union[UploadedBytes, SpooledUpload],
+    reporter: JobReporter,
+) -> Optional[dict]:
+    """Extract and summarize a PDF file in a background job"""
+    pdf_processor = pdf_processor.with_reporter(reporter)
+    text_summarizer = text_summarizer.with_reporter(reporter)
+
+    try:
+        # Summarize pages while later pages are still being extracted
+        pages = pdf_processor.stream_pdf(upload)
+        first_page = next(pages, None)
+        if first_page is None:
+            return None
+
+        # Only a preview and the word count are kept, so memory does not
+        # grow with the document
+        preview = []
+        preview_chars = 0
+        word_count = 0
+
+        def collect_pages():
+            nonlocal preview_chars, word_count
+            for page_text in itertools.chain([first_page], pages):
+                if preview_chars <= PREVIEW_CHARS:
+                    preview.append(page_text)
+                    preview_chars += len(page_text) + 1
+                word_count += len(page_text.split())
+                yield page_text
+
+        summary = text_summarizer.summarize_pages(collect_pages())
+    finally:
+        if isinstance(upload, SpooledUpload):
+            upload.remove()
+
+    return {
+        "text": " ".join(preview),
+        "words": word_count,
+        "summary": summary,
+        "file_name": f"{upload.name}_summary.txt",
+    }
+
+
+def summarize_pdfs_job(
+    pdf_processor: PDFProcessor,
+    text_summarizer: TextSummarizer,
+    uploads: List[Union[UploadedBytes, SpooledUpload]],
+    reporter: JobReporter,
+) -> dict:
+    """Extract PDF files concurrently and summarize them with shared model batches"""
+    pdf_processor = pdf_processor.with_reporter(reporter)
+    text_summarizer = text_summarizer.with_reporter(reporter)
+
+    try:
+        with reporter.stage(f"Extracting {len(uploads)} PDF files..."):
+            extractions = pdf_processor.process_many(uploads)
+    finally:
+        remove_uploads(uploads)
+
+    texts = [e.text for e in extractions if isinstance(e, ExtractionResult)]
+    summaries = iter(text_summarizer.summarize_documents(texts))
+
+    documents = []
+    for upload, extraction in zip(uploads, extractions):
+        document = {"name": upload.name, "file_name": f"{upload.name}_summary.txt"}
+        if isinstance(extraction, ExtractionResult):
+            summary = next(summaries)
+            document["words"] = len(extraction.text.split())
+        else:
+            summary = extraction
+        if isinstance(summary, SummaryResult):
+            document["summary"] = summary.summary
+        else:
+            document["error"] = str(summary)
+        documents.append(document)
+
+    return {"documents": documents, "zip": zip_summaries(documents)}
+
+
+def zip_summaries(documents: List[dict]) -> bytes:
+    """Pack the summaries of several documents into one ZIP file"""
+    buffer = io.BytesIO()
+    names = set()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for document in documents:
+            if "summary" not in document:
+                continue
+            # Uploads may share a file name
+            name, number = document["file_name"], 1
+            while name in names:
+                number += 1
+                name = f"{Path(document['file_name']).stem}_{number}.txt"
+            names.add(name)
+            archive.writestr(name, document["summary"])
+    return buffer.getvalue()
+
+
+def copy_upload(
+    pdf_processor: PDFProcessor, uploaded_file
+) -> Union[UploadedBytes, SpooledUpload]:
+    """Copy an upload for a job, to disk if it is large"""
+    if pdf_processor.is_large(uploaded_file.size):
+        return pdf_processor.spool(uploaded_file)
+    return UploadedBytes(uploaded_file.getvalue(), uploaded_file.name, uploaded_file.type)
+
+
+def remove_uploads(uploads: List[Union[UploadedBytes, SpooledUpload]]):
+    """Delete the temporary files of spooled uploads"""
+    for upload in uploads:
+        if isinstance(upload, SpooledUpload):
+            upload.remove()
+
+
+def summarize_text_job(
+    text_summarizer: TextSummarizer,
+    text: str,
+    incremental: bool,
+    reporter: JobReporter,
+) -> dict:
+    """Summarize text in a background job, streaming greedy summaries into the job"""
+    text_summarizer = text_summarizer.with_reporter(reporter)
+    started = time.perf_counter()
+    first_text_at = []
+
+    def add_text(piece: str):
+        if not first_text_at:
+            first_text_at.append(time.perf_counter())
+        reporter.add_text(piece)
+
+    summary = text_summarizer.summarize_text(
+        text, incremental=incremental, on_text=add_text
+    )
+    return {
+        "text": text,
+        "summary": summary,
+        "file_name": "text_summary.txt",
+        "first_text_after": first_text_at[0] - started if first_text_at else None,
+    }
+
+
+def show_jobs(job_executor: JobExecutor, key: str, text_summarizer: TextSummarizer):
+    """Show this session's jobs of one kind, newest first"""
+    for job_id in list(st.session_state[key]):
+        job = job_executor.get(job_id)
+        if job is None:
+            st.session_state[key].remove(job_id)
+            continue
+
+        st.markdown(f"#### {job.name}")
+        display_job_status(job)
+
+        if job.status == QUEUED:
+            if st.button("✖️ Cancel", key=f"cancel-{job.id}"):
+                job_executor.cancel(job.id)
+                st.rerun()
+        elif job.active and job.partial_text:
+            # Show the summary as it is written
+            st.markdown(text_summarizer.format_as_bullets(job.partial_text))
+
+        result = job.result
+        if job.status == DONE and result and "documents" in result:
+            show_documents(job, result)
+        elif job.status == DONE and result:
+            if "first_text_after" not in result:
+                st.success("✅ Text extracted successfully!")
+
+                # Show extracted text preview
+                with st.expander("📝 View Extracted Text (Preview)"):
+                    st.text_area(
+                        "Extracted Content:",
+                        value=(
+                            result["text"][:PREVIEW_CHARS] + "..."
+                            if len(result["text"]) > PREVIEW_CHARS
+                            else result["text"]
+                        ),
+                        height=200,
+                        disabled=True,
+                        key=f"preview-{job.id}",
+                    )
+
+            if result["summary"]:
+                st.success("✅ Summary generated successfully!")
+
+                # Display summary
+                st.subheader("📋 Summary")
+                st.markdown(result["summary"])
+
+                # Display statistics
+                st.subheader("📊 Statistics")
+                display_summary_stats(
+                    result["text"], result["summary"], original_words=result.get("words")
+                )
+                if result.get("first_text_after") is not None:
+                    st.caption(f"⚡ First words after {result['first_text_after']:.1f}s")
+
+                # Download option
+                st.download_button(
+                    label="💾 Download Summary",
+                    data=result["summary"],
+                    file_name=result["file_name"],
+                    mime="text/plain",
+                    key=f"download-{job.id}",
+                )
+
+        if job.status in (DONE, FAILED, CANCELLED):
+            if st.button("🗑️ Dismiss", key=f"dismiss-{job.id}"):
+                st.session_state[key].remove(job.id)
+                st.rerun()
+        st.markdown("---")
+
+
+def show_documents(job, result: dict):
+    """Show the per-file summaries of a multi-file job with their downloads"""
+    summarized = [d for d in result["documents"] if "summary" in d]
+    st.success(f"✅ Summarized {len(summarized)} of {len(result['documents'])} files")
+    if summarized:
+        st.download_button(
+            label="🗜️ Download All Summaries (ZIP)",
+            data=result["zip"],
+            file_name="summaries.zip",
+            mime="application/zip",
+            key=f"download-zip-{job.id}",
+        )
+
+    for number, document in enumerate(result["documents"]):
+        with st.expander(f"📄 {document['name']}"):
+            if "error" in document:
+                st.error(f"❌ {document['error']}")
+                continue
+
+            st.markdown(document["summary"])
+            st.caption(f"Original: {document['words']:,} words")
+            st.download_button(
+                label="💾 Download Summary",
+                data=document["summary"],
+                file_name=document["file_name"],
+                mime="text/plain",
+                key=f"download-{job.id}-{number}",
+            )
 
 
 def main():
@@ -37,7 +390,11 @@ def main():
     )
 
     # Initialize components
-    pdf_processor, text_summarizer = initialize_components()
+    pdf_processor, text_summarizer, job_executor = initialize_components()
+
+    # IDs of this session's background jobs, newest first; they survive reruns
+    st.session_state.setdefault("pdf_jobs", [])
+    st.session_state.setdefault("text_jobs", [])
 
     # App header
     st.title("📝 AI Notes Summarizer")
@@ -62,25 +419,107 @@ def main():
         help="BART is recommended for best quality summaries",
     )
 
-    # Update text summarizer model if changed
-    if text_summarizer.model_name != model_options[selected_model]:
-        text_summarizer.model_name = model_options[selected_model]
-        text_summarizer.summarizer = None  # Reset to reload model
+    # Inference backend selection
+    backend_options = {
+        "PyTorch": "torch",
+        "PyTorch int8 (CPU)": "int8",
+        "ONNX Runtime": "onnx",
+    }
+    default_backend = os.getenv("INFERENCE_BACKEND", "torch")
+    selected_backend = st.sidebar.selectbox(
+        "Inference Backend:",
+        options=list(backend_options.keys()),
+        index=list(backend_options.values()).index(default_backend)
+        if default_backend in backend_options.values()
+        else 0,
+        help="int8 and ONNX Runtime are faster on CPU-only machines",
+    )
+
+    # Switch models; resident models are reused instead of reloaded
+    text_summarizer.set_model(
+        model_options[selected_model], backend_options[selected_backend]
+    )
 
     # Summary length options
     summary_length = st.sidebar.select_slider(
         "Summary Length:",
         options=["Short", "Medium", "Long"],
-        value="Medium",
-        help="Choose the desired length of the summary",
+        value=DEFAULT_PRESET.capitalize(),
+        help=(
+            "Choose the desired length of the summary. Short and Medium decode "
+            "greedily, and Short is fastest; Long uses a beam search that avoids "
+            "repetition"
+        ),
     )
 
-    # Update summary length settings
-    length_settings = {"Short": (30, 150), "Medium": (50, 300), "Long": (100, 500)}
-    text_summarizer.min_summary_length, text_summarizer.max_summary_length = (
-        length_settings[summary_length]
+    # Update summary length and decoding settings
+    text_summarizer.apply_preset(PRESETS[summary_length.lower()])
+    if not text_summarizer.can_stream:
+        st.sidebar.caption(
+            f"{summary_length} summaries use beam search, so they appear when "
+            "complete instead of as they are written."
+        )
+
+    # Extractive pre-filter for very long documents
+    prefilter = st.sidebar.select_slider(
+        "Long Document Pre-filter:",
+        options=["Off", "50%", "30%", "20%"],
+        value="Off",
+        help="For texts over 10,000 words, keep only this share of the most informative sentences before summarizing",
+    )
+    text_summarizer.extractive_ratio = (
+        None if prefilter == "Off" else int(prefilter.rstrip("%")) / 100
     )
 
+    # Later reruns reconfigure the shared summarizer while jobs are still
+    # queued, so jobs get a copy with this run's settings
+    job_summarizer = copy.copy(text_summarizer)
+
+    # Cache statistics
+    cache_stats = text_summarizer.cache.stats()
+    st.sidebar.caption(
+        f"Summary cache: {cache_stats['hits']:,} hits / {cache_stats['misses']:,} misses"
+    )
+    if pdf_processor.extraction_cache is not None:
+        extraction_stats = pdf_processor.extraction_cache.stats()
+        st.sidebar.caption(
+            f"Extraction cache: {extraction_stats['hits']:,} hits / "
+            f"{extraction_stats['misses']:,} misses"
+        )
+    cpu_scheduler = text_summarizer.cpu_scheduler
+    if cpu_scheduler.busy or cpu_scheduler.queued:
+        st.sidebar.caption(
+            f"Generation slots: {cpu_scheduler.busy}/{cpu_scheduler.slots} busy, "
+            f"{cpu_scheduler.queued} waiting"
+        )
+    active_jobs = job_executor.active_count()
+    if active_jobs:
+        st.sidebar.caption(f"Background jobs: {active_jobs} running or queued")
+    resident_models = text_summarizer.registry.resident_models()
+    if resident_models:
+        st.sidebar.caption(
+            f"Loaded models: {', '.join(resident_models)} "
+            f"({text_summarizer.registry.memory_mb():,.0f} MB)"
+        )
+
+    # Stage timings, when metrics are enabled
+    if text_summarizer.metrics.enabled:
+        stages = text_summarizer.metrics.snapshot()["stages"]
+        if stages:
+            with st.sidebar.expander("⏱️ Stage timings"):
+                st.dataframe(
+                    [
+                        {
+                            "Stage": name,
+                            "Runs": stage["count"],
+                            "Mean (s)": round(stage["seconds"] / stage["count"], 3),
+                            "Max (s)": round(stage["max_seconds"], 3),
+                        }
+                        for name, stage in sorted(stages.items())
+                    ],
+                    hide_index=True,
+                )
+
     # Main content area
     tab1, tab2 = st.tabs(["📄 PDF Upload", "📝 Text Input"])
 
@@ -88,9 +527,36 @@ def main():
         st.header("Upload PDF File")
         st.markdown("Upload a PDF file to extract and summarize its content.")
 
-        uploaded_file = st.file_uploader(
-            "Choose a PDF file", type=["pdf"], help="Upload a PDF file (max 10MB)"
+        uploaded_files = st.file_uploader(
+            "Choose PDF files",
+            type=["pdf"],
+            accept_multiple_files=True,
+            help=(
+                "Upload one or more PDF files "
+                f"(max {pdf_processor.size_limit / 1024 / 1024:.0f}MB each)"
+            ),
         )
+        uploaded_file = uploaded_files[0] if len(uploaded_files) == 1 else None
+
+        if len(uploaded_files) > 1:
+            total_size = format_file_size(sum(f.size for f in uploaded_files))
+            st.info(f"📚 **Files:** {len(uploaded_files)} PDFs ({total_size})")
+
+            # Files are extracted at once and their chunks share model batches
+            if st.button("📖 Extract & Summarize All PDFs", type="primary"):
+                valid_files = [f for f in uploaded_files if pdf_processor.validate_pdf(f)]
+                if valid_files:
+                    uploads = [copy_upload(pdf_processor, f) for f in valid_files]
+                    st.session_state.pdf_jobs.insert(
+                        0,
+                        job_executor.submit(
+                            f"📚 {len(uploads)} PDF files",
+                            partial(
+                                summarize_pdfs_job, pdf_processor, job_summarizer, uploads
+                            ),
+                            on_cancel=partial(remove_uploads, uploads),
+                        ),
+                    )
 
         if uploaded_file is not None:
             # Display file info
@@ -99,47 +565,21 @@ def main():
 
             # Process PDF button
             if st.button("📖 Extract & Summarize PDF", type="primary"):
-                with st.spinner("Processing PDF file..."):
-                    # Extract text from PDF
-                    extracted_text = pdf_processor.process_pdf(uploaded_file)
-
-                    if extracted_text:
-                        st.success("✅ Text extracted successfully!")
-
-                        # Show extracted text preview
-                        with st.expander("📝 View Extracted Text (Preview)"):
-                            st.text_area(
-                                "Extracted Content:",
-                                value=(
-                                    extracted_text[:1000] + "..."
-                                    if len(extracted_text) > 1000
-                                    else extracted_text
-                                ),
-                                height=200,
-                                disabled=True,
-                            )
-
-                        # Generate summary
-                        summary = text_summarizer.summarize_text(extracted_text)
-
-                        if summary:
-                            st.success("✅ Summary generated successfully!")
-
-                            # Display summary
-                            st.subheader("📋 Summary")
-                            st.markdown(summary)
-
-                            # Display statistics
-                            st.subheader("📊 Statistics")
-                            display_summary_stats(extracted_text, summary)
-
-                            # Download option
-                            st.download_button(
-                                label="💾 Download Summary",
-                                data=summary,
-                                file_name=f"{uploaded_file.name}_summary.txt",
-                                mime="text/plain",
-                            )
+                if pdf_processor.validate_pdf(uploaded_file):
+                    # The job keeps its own copy of the upload, on disk if it is large
+                    upload = copy_upload(pdf_processor, uploaded_file)
+                    st.session_state.pdf_jobs.insert(
+                        0,
+                        job_executor.submit(
+                            f"📄 {uploaded_file.name}",
+                            partial(
+                                summarize_pdf_job, pdf_processor, job_summarizer, upload
+                            ),
+                            on_cancel=getattr(upload, "remove", None),
+                        ),
+                    )
+
+        show_jobs(job_executor, "pdf_jobs", text_summarizer)
 
     with tab2:
         st.header("Direct Text Input")
@@ -152,33 +592,44 @@ def main():
             help="Minimum 100 characters required for effective summarization",
         )
 
-        # Character count
+        # Character count, with tokens and expected work once the model is loaded
         char_count = len(text_input)
-        st.caption(f"Characters: {char_count:,}")
+        caption = f"Characters: {char_count:,}"
+        estimate = text_summarizer.estimate(text_input) if text_input else None
+        if estimate is not None:
+            caption += (
+                f" · Tokens: {estimate.tokens:,}"
+                f" · Estimated chunks: {estimate.chunks:,}"
+            )
+            if estimate.seconds is not None:
+                caption += f" · Estimated time: ~{estimate.seconds:.0f}s"
+        st.caption(caption)
+
+        incremental = st.checkbox(
+            "⚡ Only re-summarize edited paragraphs",
+            value=False,
+            help=(
+                "Keeps chunk boundaries stable across edits so summaries of unchanged "
+                "paragraphs are reused. Chunks are smaller, so use it for text you "
+                "plan to edit and summarize again"
+            ),
+        )
 
         if st.button("🚀 Summarize Text", type="primary"):
-            if validate_input(text_input, min_length=100):
-                # Generate summary
-                summary = text_summarizer.summarize_text(text_input)
-
-                if summary:
-                    st.success("✅ Summary generated successfully!")
-
-                    # Display summary
-                    st.subheader("📋 Summary")
-                    st.markdown(summary)
-
-                    # Display statistics
-                    st.subheader("📊 Statistics")
-                    display_summary_stats(text_input, summary)
-
-                    # Download option
-                    st.download_button(
-                        label="💾 Download Summary",
-                        data=summary,
-                        file_name="text_summary.txt",
-                        mime="text/plain",
-                    )
+            if validate_input(
+                text_input, min_length=100, reporter=text_summarizer.reporter
+            ):
+                st.session_state.text_jobs.insert(
+                    0,
+                    job_executor.submit(
+                        f"📝 Text ({len(text_input.split()):,} words)",
+                        partial(
+                            summarize_text_job, job_summarizer, text_input, incremental
+                        ),
+                    ),
+                )
+
+        show_jobs(job_executor, "text_jobs", text_summarizer)
 
     # Footer
     st.markdown("---")
@@ -191,6 +642,15 @@ def main():
         unsafe_allow_html=True,
     )
 
+    # Poll this session's jobs until they finish
+    session_jobs = st.session_state.pdf_jobs + st.session_state.text_jobs
+    if any(
+        job_executor.get(job_id) is not None and job_executor.get(job_id).active
+        for job_id in session_jobs
+    ):
+        time.sleep(JOB_POLL_INTERVAL)
+        st.rerun()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+AI Notes Summarizer - Batch CLI
+Summarizes directories or manifests of PDF and text files offline.
+
+Text is extracted by a pool of worker processes and fed through a bounded
+queue to a fixed number of model worker processes. Results are written to
+JSONL (or Parquet), and successfully summarized documents are recorded in a
+checkpoint file so an interrupted run can be resumed. Documents that failed
+are retried by the next run; their earlier error records stay in the output.
+
+Examples:
+    python batch_summarize.py notes/ -o summaries.jsonl
+    python batch_summarize.py manifest.txt -o summaries.parquet --model-workers 2
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Deque, Dict, Iterator, List, Optional, Set, Tuple
+
+from modules.errors import SummarizerError
+from modules.generation_policy import DEFAULT_PRESET, PRESETS
+from modules.model_registry import BACKENDS, ModelRegistry
+from modules.pdf_processor import PDFProcessor
+from modules.text_summarizer import TextSummarizer
+
+SUPPORTED_SUFFIXES = {".pdf", ".txt", ".md"}
+
+
+def iter_documents(source: str) -> Iterator[Tuple[str, str]]:
+    """
+    List the documents to summarize
+
+    Args:
+        source: Directory to scan, or a manifest file with one path per line
+            (or JSON lines with "path" and optional "id" fields)
+
+    Yields:
+        Tuple[str, str]: Document ID and file path
+    """
+    source_path = Path(source)
+    if source_path.is_dir():
+        for path in sorted(source_path.rglob("*")):
+            if path.is_file() and path.suffix.lower() in SUPPORTED_SUFFIXES:
+                yield str(path.relative_to(source_path)), str(path)
+        return
+
+    base_dir = source_path.parent
+    with open(source_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("{"):
+                entry = json.loads(line)
+                path = entry["path"]
+                doc_id = entry.get("id", path)
+            else:
+                path = doc_id = line
+            yield doc_id, str(base_dir / path)
+
+
+def extract_document(doc_id: str, path: str) -> Dict:
+    """
+    Extract and preprocess the text of one document (runs in an extraction worker)
+
+    Args:
+        doc_id: Document ID
+        path: File path
+
+    Returns:
+        Dict: Task with "text", or a result record with "error"
+    """
+    try:
+        if path.lower().endswith(".pdf"):
+            processor = PDFProcessor(backend=os.getenv("PDF_BACKEND", "auto"))
+            processor.max_workers = 1  # Already running in a worker process
+            text = processor.process(path).text
+        else:
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                text = f.read()
+        return {"id": doc_id, "path": path, "text": text}
+    except (SummarizerError, OSError) as e:
+        return {"id": doc_id, "path": path, "error": str(e)}
+    except Exception as e:
+        return {"id": doc_id, "path": path, "error": f"Unexpected error: {str(e)}"}
+
+
+def model_worker(
+    model_name: str,
+    backend: str,
+    length: str,
+    extractive_ratio: Optional[float],
+    batch_size: int,
+    num_threads: int,
+    tasks: multiprocessing.Queue,
+    results: multiprocessing.Queue,
+):
+    """
+    Summarize documents from the task queue until a None sentinel arrives
+
+    Args:
+        model_name: Model to load in this worker
+        backend: Inference backend for the model
+        length: Summary length preset (see generation_policy.PRESETS)
+        extractive_ratio: Fraction of words kept from very long documents (None disables)
+        batch_size: Chunks per forward pass
+        num_threads: PyTorch intra-op threads for this worker
+        tasks: Queue of extracted documents
+        results: Queue receiving result records
+    """
+    import torch
+
+    torch.set_num_threads(num_threads)
+
+    summarizer = TextSummarizer(
+        model_name,
+        registry=ModelRegistry(
+            max_models=1,
+            onnx_cache_dir=os.getenv("ONNX_CACHE_DIR"),
+            artifact_dir=os.getenv("MODEL_ARTIFACT_DIR"),
+        ),
+        backend=backend,
+    )
+    summarizer.apply_preset(PRESETS[length])
+    summarizer.extractive_ratio = extractive_ratio
+    summarizer.batch_size = batch_size
+    try:
+        summarizer.load_model()
+    except SummarizerError as e:
+        results.put({"worker_error": str(e)})
+        return
+
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+
+        record = {"id": task["id"], "path": task["path"]}
+        start = time.perf_counter()
+        try:
+            result = summarizer.summarize(task["text"])
+            record.update(
+                summary=result.summary,
+                chunks=result.chunk_count,
+                failed_chunks=result.failed_chunks,
+                input_tokens=result.input_tokens,
+            )
+        except SummarizerError as e:
+            record["error"] = str(e)
+        except Exception as e:
+            record["error"] = f"Unexpected error during summarization: {str(e)}"
+        record["seconds"] = round(time.perf_counter() - start, 3)
+        results.put(record)
+
+
+class ResultWriter:
+    """Appends result records and checkpoints successfully summarized document IDs"""
+
+    def __init__(self, output: str, checkpoint: str):
+        """
+        Initialize the writer
+
+        Args:
+            output: JSONL or Parquet output path
+            checkpoint: File listing successfully summarized document IDs
+        """
+        self.output = output
+        self.parquet = output.endswith(".parquet")
+        # Parquet cannot be appended to, so records are staged as JSONL first
+        self.records_path = output + ".partial.jsonl" if self.parquet else output
+        self.checkpoint = checkpoint
+        self._records = open(self.records_path, "a", encoding="utf-8")
+        self._done = open(checkpoint, "a", encoding="utf-8")
+
+    def completed_ids(self) -> Set[str]:
+        """Read the IDs of documents finished by earlier runs"""
+        with open(self.checkpoint, "r", encoding="utf-8") as f:
+            return {line.rstrip("\n") for line in f if line.strip()}
+
+    def write(self, record: Dict):
+        """Write a record, then mark its document as done unless it failed"""
+        self._records.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._records.flush()
+        if "error" not in record:  # Failed documents are retried on resume
+            self._done.write(record["id"] + "\n")
+            self._done.flush()
+
+    def close(self):
+        """Close the files and produce the Parquet file if requested"""
+        self._records.close()
+        self._done.close()
+        if self.parquet:
+            import pandas as pd
+
+            pd.read_json(self.records_path, lines=True).to_parquet(
+                self.output, index=False
+            )
+
+
+def feed_tasks(
+    documents: List[Tuple[str, str]],
+    extract_workers: int,
+    tasks: multiprocessing.Queue,
+    results: multiprocessing.Queue,
+    num_model_workers: int,
+):
+    """
+    Extract documents in a process pool and queue them for the model workers
+
+    Args:
+        documents: Document IDs and paths to process
+        extract_workers: Number of extraction processes
+        tasks: Bounded queue feeding the model workers
+        results: Queue receiving failed extractions directly, and a
+            "feeder_error" record if feeding stops on an exception
+        num_model_workers: Number of None sentinels to send at the end
+    """
+
+    def enqueue(task: Dict):
+        if "error" in task:
+            results.put(task)
+        else:
+            tasks.put(task)  # Blocks while the model workers are busy
+
+    try:
+        # Bound in-flight extractions so extracted text does not pile up in memory
+        window: Deque[Future] = deque()
+        with ProcessPoolExecutor(max_workers=extract_workers) as pool:
+            for doc_id, path in documents:
+                window.append(pool.submit(extract_document, doc_id, path))
+                if len(window) >= extract_workers * 2:
+                    enqueue(window.popleft().result())
+
+            while window:
+                enqueue(window.popleft().result())
+    except Exception as e:  # e.g. BrokenProcessPool when an extractor crashes
+        results.put({"feeder_error": f"{type(e).__name__}: {str(e)}"})
+    finally:
+        # The model workers exit once they have drained the queue
+        for _ in range(num_model_workers):
+            tasks.put(None)
+
+
+def run(args: argparse.Namespace) -> int:
+    """
+    Run a batch job
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        int: Process exit code
+    """
+    checkpoint = args.checkpoint or args.output + ".checkpoint"
+    Path(checkpoint).touch()
+    writer = ResultWriter(args.output, checkpoint)
+
+    completed = writer.completed_ids()
+    documents = [doc for doc in iter_documents(args.source) if doc[0] not in completed]
+    print(f"📄 {len(documents)} document(s) to summarize ({len(completed)} already done)")
+    if not documents:
+        writer.close()
+        return 0
+
+    ctx = multiprocessing.get_context("spawn")
+    tasks = ctx.Queue(maxsize=args.model_workers * 2)
+    results = ctx.Queue()
+    num_threads = max(1, (os.cpu_count() or 1) // args.model_workers)
+
+    workers = [
+        ctx.Process(
+            target=model_worker,
+            args=(
+                args.model,
+                args.backend,
+                args.length,
+                args.extractive_ratio,
+                args.batch_size,
+                num_threads,
+                tasks,
+                results,
+            ),
+        )
+        for _ in range(args.model_workers)
+    ]
+    for worker in workers:
+        worker.start()
+
+    feeder = threading.Thread(
+        target=feed_tasks,
+        args=(documents, args.extract_workers, tasks, results, len(workers)),
+        daemon=True,
+    )
+    feeder.start()
+
+    start = time.perf_counter()
+    done = failed = total_tokens = 0
+    try:
+        while done < len(documents):
+            try:
+                record = results.get(timeout=1.0)
+            except queue.Empty:
+                if not any(worker.is_alive() for worker in workers):
+                    print("❌ All model workers exited before the batch finished")
+                    return 1
+                continue
+
+            if "worker_error" in record:
+                print(f"❌ Model worker failed to start: {record['worker_error']}")
+                continue
+            if "feeder_error" in record:
+                print(f"❌ Extraction stopped: {record['feeder_error']}")
+                return 1
+
+            writer.write(record)
+            done += 1
+            failed += "error" in record
+            total_tokens += record.get("input_tokens", 0)
+
+            if done % args.report_every == 0 or done == len(documents):
+                elapsed = time.perf_counter() - start
+                print(
+                    f"✅ {done}/{len(documents)} docs | {failed} failed | "
+                    f"{done / elapsed:.2f} docs/sec | {total_tokens / elapsed:,.0f} tokens/sec"
+                )
+    finally:
+        for worker in workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+        writer.close()
+
+    return 0 if failed == 0 else 2
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Summarize a directory or manifest of PDF and text files."
+    )
+    parser.add_argument("source", help="Directory to scan or manifest file")
+    parser.add_argument(
+        "-o", "--output", required=True, help="Output file (.jsonl or .parquet)"
+    )
+    parser.add_argument(
+        "--checkpoint", help="Checkpoint file (default: <output>.checkpoint)"
+    )
+    parser.add_argument(
+        "--model", default=os.getenv("DEFAULT_MODEL", "facebook/bart-large-cnn")
+    )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default=os.getenv("INFERENCE_BACKEND", "torch"),
+        help="Inference backend (int8 and onnx are faster on CPU)",
+    )
+    parser.add_argument(
+        "--length", choices=list(PRESETS), default=DEFAULT_PRESET
+    )
+    parser.add_argument(
+        "--extractive-ratio",
+        type=float,
+        help="Keep this fraction of the most informative words of documents over 10,000 words",
+    )
+    parser.add_argument("--model-workers", type=int, default=1)
+    parser.add_argument(
+        "--extract-workers", type=int, default=max(1, (os.cpu_count() or 1) // 2)
+    )
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--report-every", type=int, default=10)
+    return parser.parse_args(argv)
+
+
+def main():
+    """Command line entry point"""
+    sys.exit(run(parse_args()))
+
+
+if __name__ == "__main__":
+    main()
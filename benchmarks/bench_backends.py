@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Benchmark for inference backends
+Compares latency, memory and ROUGE of the int8 and ONNX Runtime backends
+against the fp32 PyTorch baseline.
+
+Each backend runs in its own process so peak memory is measured per backend.
+ROUGE is computed against the baseline's summaries, and against reference
+summaries when the documents file provides them.
+
+Examples:
+    python benchmarks/bench_backends.py --model sshleifer/distilbart-cnn-12-6
+    python benchmarks/bench_backends.py --documents docs.jsonl --backends torch int8
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import resource
+import statistics
+import sys
+import time
+from typing import Dict, List, Optional, Sequence
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.cache import SummaryCache
+from modules.errors import SummarizerError
+from modules.model_registry import BACKENDS, ModelRegistry
+from modules.text_summarizer import TextSummarizer
+
+
+def make_documents(count: int, words: int, seed: int = 0) -> List[Dict]:
+    """
+    Generate synthetic lecture-note documents
+
+    Args:
+        count: Number of documents
+        words: Approximate words per document
+        seed: Random seed for reproducible output
+
+    Returns:
+        List[Dict]: Documents with a "text" field
+    """
+    rng = random.Random(seed)
+    subjects = ["The model", "The lecture", "Our experiment", "The dataset", "This method"]
+    verbs = ["improves", "describes", "measures", "reduces", "explains"]
+    objects = [
+        "training time on small datasets",
+        "the accuracy of the baseline",
+        "memory use during inference",
+        "how attention weights are computed",
+        "the error rate on held-out data",
+    ]
+    documents = []
+    for _ in range(count):
+        sentences = []
+        while sum(len(s.split()) for s in sentences) < words:
+            sentences.append(
+                f"{rng.choice(subjects)} {rng.choice(verbs)} {rng.choice(objects)}."
+            )
+        documents.append({"text": " ".join(sentences)})
+    return documents
+
+
+def _ngrams(tokens: Sequence[str], n: int) -> Dict[tuple, int]:
+    counts: Dict[tuple, int] = {}
+    for i in range(len(tokens) - n + 1):
+        gram = tuple(tokens[i : i + n])
+        counts[gram] = counts.get(gram, 0) + 1
+    return counts
+
+
+def _f1(overlap: int, candidate_total: int, reference_total: int) -> float:
+    if not overlap:
+        return 0.0
+    precision = overlap / candidate_total
+    recall = overlap / reference_total
+    return 2 * precision * recall / (precision + recall)
+
+
+def rouge(candidate: str, reference: str) -> Dict[str, float]:
+    """
+    Compute ROUGE-1, ROUGE-2 and ROUGE-L F1 scores
+
+    Args:
+        candidate: Generated summary
+        reference: Summary to compare against
+
+    Returns:
+        Dict[str, float]: Scores keyed by "rouge1", "rouge2" and "rougeL"
+    """
+    cand = candidate.lower().split()
+    ref = reference.lower().split()
+    scores = {}
+
+    for n in (1, 2):
+        cand_grams, ref_grams = _ngrams(cand, n), _ngrams(ref, n)
+        overlap = sum(min(c, ref_grams.get(g, 0)) for g, c in cand_grams.items())
+        scores[f"rouge{n}"] = _f1(
+            overlap, sum(cand_grams.values()), sum(ref_grams.values())
+        )
+
+    # Longest common subsequence, one row at a time
+    previous = [0] * (len(ref) + 1)
+    for token in cand:
+        current = [0]
+        for j, ref_token in enumerate(ref):
+            current.append(
+                previous[j] + 1 if token == ref_token else max(previous[j + 1], current[j])
+            )
+        previous = current
+    scores["rougeL"] = _f1(previous[-1], len(cand), len(ref))
+    return scores
+
+
+def mean_rouge(candidates: List[str], references: List[str]) -> Dict[str, float]:
+    """Average ROUGE scores over document pairs"""
+    scores = [rouge(c, r) for c, r in zip(candidates, references)]
+    return {key: statistics.mean(s[key] for s in scores) for key in scores[0]}
+
+
+def run_backend(
+    model_name: str, backend: str, documents: List[Dict], onnx_cache_dir: Optional[str]
+) -> Dict:
+    """
+    Load one backend and summarize every document (runs in its own process)
+
+    Args:
+        model_name: Model to benchmark
+        backend: Inference backend
+        documents: Documents with a "text" field
+        onnx_cache_dir: Directory for ONNX exports
+
+    Returns:
+        Dict: Load time, per-document latencies, peak RSS and summaries
+    """
+    summarizer = TextSummarizer(
+        model_name,
+        cache=SummaryCache(max_entries=0),  # Every run must hit the model
+        registry=ModelRegistry(max_models=1, onnx_cache_dir=onnx_cache_dir),
+        backend=backend,
+    )
+
+    start = time.perf_counter()
+    try:
+        summarizer.load_model()
+    except SummarizerError as e:
+        return {"backend": backend, "error": str(e)}
+    load_seconds = time.perf_counter() - start
+
+    summarizer.summarize(documents[0]["text"])  # Warm-up
+
+    latencies, summaries = [], []
+    for document in documents:
+        start = time.perf_counter()
+        summaries.append(summarizer.summarize(document["text"]).summary)
+        latencies.append(time.perf_counter() - start)
+
+    return {
+        "backend": backend,
+        "load_seconds": load_seconds,
+        "latencies": latencies,
+        # ru_maxrss is reported in kilobytes on Linux
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "weights_mb": summarizer.registry.memory_mb(),
+        "summaries": summaries,
+    }
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--model", default=os.getenv("DEFAULT_MODEL", "facebook/bart-large-cnn")
+    )
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=list(BACKENDS))
+    parser.add_argument(
+        "--documents",
+        help='JSONL file with a "text" field and an optional "reference" summary',
+    )
+    parser.add_argument("--count", type=int, default=8, help="Synthetic documents")
+    parser.add_argument("--words", type=int, default=600, help="Words per synthetic document")
+    parser.add_argument("--onnx-cache-dir", default=os.getenv("ONNX_CACHE_DIR"))
+    parser.add_argument("--output", help="Write the full results to this JSON file")
+    args = parser.parse_args()
+
+    if args.documents:
+        with open(args.documents, "r", encoding="utf-8") as f:
+            documents = [json.loads(line) for line in f if line.strip()]
+    else:
+        documents = make_documents(args.count, args.words)
+
+    # The fp32 baseline always runs first so the others can be scored against it
+    backends = ["torch"] + [b for b in args.backends if b != "torch"]
+
+    ctx = multiprocessing.get_context("spawn")
+    results = []
+    for backend in backends:
+        with ctx.Pool(1) as pool:
+            results.append(
+                pool.apply(
+                    run_backend,
+                    (args.model, backend, documents, args.onnx_cache_dir),
+                )
+            )
+
+    baseline = results[0]
+    references = [d.get("reference") for d in documents]
+    has_references = all(references)
+
+    header = (
+        f"{'Backend':<8} {'Load (s)':>9} {'Mean (s)':>9} {'p50 (s)':>8} "
+        f"{'Speedup':>8} {'Weights':>9} {'Peak RSS':>9} {'R-1':>6} {'R-2':>6} {'R-L':>6}"
+    )
+    if has_references:
+        header += f" {'Ref R-L':>8}"
+    print(f"Model: {args.model} | {len(documents)} documents")
+    print(header)
+
+    for result in results:
+        if "error" in result:
+            print(f"{result['backend']:<8} failed: {result['error']}")
+            continue
+        if "error" in baseline:
+            agreement = {"rouge1": 0.0, "rouge2": 0.0, "rougeL": 0.0}
+            speedup = 0.0
+        else:
+            agreement = mean_rouge(result["summaries"], baseline["summaries"])
+            speedup = statistics.mean(baseline["latencies"]) / statistics.mean(
+                result["latencies"]
+            )
+        result["rouge_vs_fp32"] = agreement
+
+        line = (
+            f"{result['backend']:<8} {result['load_seconds']:>9.2f} "
+            f"{statistics.mean(result['latencies']):>9.3f} "
+            f"{statistics.median(result['latencies']):>8.3f} {speedup:>7.2f}x "
+            f"{result['weights_mb']:>7.1f}MB {result['peak_rss_mb']:>7.0f}MB "
+            f"{agreement['rouge1']:>6.3f} {agreement['rouge2']:>6.3f} {agreement['rougeL']:>6.3f}"
+        )
+        if has_references:
+            result["rouge_vs_reference"] = mean_rouge(result["summaries"], references)
+            line += f" {result['rouge_vs_reference']['rougeL']:>8.3f}"
+        print(line)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"model": args.model, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Benchmark for CPU scheduling of concurrent generations
+Measures aggregate throughput and p95 latency under 1, 4 and 16 concurrent
+requests, with and without a CPUScheduler.
+
+Unscheduled, every request generates on all cores at once, as concurrent
+Streamlit sessions used to; scheduled, at most --slots generations run at a
+time on their share of --cores and the rest queue. Requests come from client
+threads sharing one TextSummarizer, which runs a tiny locally built model
+(see tiny_model.py) made large enough for compute to dominate. Every
+configuration runs in a fresh process.
+
+Examples:
+    python benchmarks/bench_cpu_scheduler.py
+    python benchmarks/bench_cpu_scheduler.py --cores 8 --slots 1 2 4 --concurrency 1 4 16
+"""
+
+import argparse
+import itertools
+import json
+import logging
+import math
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_pipeline import WORDS, make_pages
+from modules.cache import SummaryCache
+from modules.cpu_scheduler import CPUScheduler, available_cores
+from modules.events import ProgressReporter
+from modules.text_summarizer import TextSummarizer
+
+
+def percentile(values: List[float], share: float) -> float:
+    """Nearest-rank percentile of a list of values"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(share * len(ordered)) - 1)]
+
+
+def run_level(
+    model_dir: str,
+    concurrency: int,
+    requests: int,
+    words: int,
+    cores: int,
+    slots: Optional[int],
+) -> Dict:
+    """
+    Serve requests from concurrent clients (runs in its own process)
+
+    Args:
+        model_dir: Directory of the tiny model
+        concurrency: Client threads sending requests at the same time
+        requests: Requests across all clients
+        words: Words per request
+        cores: Core budget
+        slots: Generation slots, or None to run without a scheduler
+
+    Returns:
+        Dict: Wall time, throughput and latency percentiles
+    """
+    import torch
+
+    logging.disable(logging.WARNING)  # Keep pipeline warnings out of the table
+    torch.set_num_threads(cores)
+
+    summarizer = TextSummarizer(
+        model_dir,
+        cache=SummaryCache(max_entries=0),  # Every request must hit the model
+        cpu_scheduler=CPUScheduler(cores, slots) if slots else None,
+    )
+    # Fixed lengths keep the amount of generated text the same across requests
+    summarizer.min_summary_length = 40
+    summarizer.max_summary_length = 60
+    summarizer.load_model()
+    summarizer.summarize_text(make_pages(1, words, seed=-1)[0])  # Warm-up
+
+    texts = [make_pages(1, words, seed=i)[0] for i in range(requests)]
+    next_request = itertools.count()
+    latencies = []
+    lock = threading.Lock()
+
+    def client():
+        client_summarizer = summarizer.with_reporter(ProgressReporter())
+        while True:
+            with lock:
+                index = next(next_request)
+            if index >= requests:
+                return
+            start = time.perf_counter()
+            client_summarizer.summarize_text(texts[index])
+            with lock:
+                latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+
+    return {
+        "mode": f"{slots} slot(s)" if slots else "unscheduled",
+        "slots": slots,
+        "threads_per_slot": summarizer.cpu_scheduler.threads_per_slot if slots else cores,
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "seconds": seconds,
+        "requests_per_second": len(latencies) / seconds,
+        "p50_latency": percentile(latencies, 0.5),
+        "p95_latency": percentile(latencies, 0.95),
+    }
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    cores = available_cores()
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--cores", type=int, default=cores, help="Core budget")
+    parser.add_argument(
+        "--slots",
+        type=int,
+        nargs="+",
+        help="Slot counts to compare (default: 1 and the scheduler's default)",
+    )
+    parser.add_argument("--requests", type=int, default=32, help="Requests per level")
+    parser.add_argument("--words", type=int, default=400, help="Words per request")
+    parser.add_argument("--d-model", type=int, default=256, help="Tiny model hidden size")
+    parser.add_argument("--layers", type=int, default=2, help="Tiny model layers")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    slot_counts = args.slots or sorted({1, CPUScheduler(args.cores).slots})
+    modes = [None] + slot_counts
+
+    ctx = multiprocessing.get_context("spawn")
+    results = []
+    with tempfile.TemporaryDirectory() as model_dir:
+        from tiny_model import build_tiny_model
+
+        with ctx.Pool(1) as pool:
+            pool.apply(
+                build_tiny_model,
+                (model_dir, WORDS),
+                {"d_model": args.d_model, "layers": args.layers},
+            )
+
+        print(f"Core budget: {args.cores}")
+        print(
+            f"{'Mode':<14} {'Threads':>7} {'Clients':>7} {'Requests':>8} "
+            f"{'Req/s':>8} {'p50 (s)':>8} {'p95 (s)':>8}"
+        )
+        for concurrency in args.concurrency:
+            for slots in modes:
+                with ctx.Pool(1) as pool:
+                    result = pool.apply(
+                        run_level,
+                        (model_dir, concurrency, args.requests, args.words, args.cores, slots),
+                    )
+                results.append(result)
+                print(
+                    f"{result['mode']:<14} {result['threads_per_slot']:>7} "
+                    f"{concurrency:>7} {result['requests']:>8} "
+                    f"{result['requests_per_second']:>8.2f} "
+                    f"{result['p50_latency']:>8.2f} {result['p95_latency']:>8.2f}"
+                )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(
+                {"cores": args.cores, "settings": vars(args), "results": results},
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
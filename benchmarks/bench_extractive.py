@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark for extractive pre-filtering
+Compares summarization time, model input tokens and ROUGE for several
+pre-filter ratios against summarizing the full text.
+
+ROUGE is computed against the unfiltered summaries, and against reference
+summaries when the documents file provides them.
+
+Examples:
+    python benchmarks/bench_extractive.py --model sshleifer/distilbart-cnn-12-6
+    python benchmarks/bench_extractive.py --documents docs.jsonl --ratios 0.5 0.2
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_backends import make_documents, mean_rouge
+from modules.cache import SummaryCache
+from modules.extractive import select_sentences
+from modules.text_summarizer import TextSummarizer
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--model", default=os.getenv("DEFAULT_MODEL", "facebook/bart-large-cnn")
+    )
+    parser.add_argument("--ratios", type=float, nargs="+", default=[0.5, 0.3, 0.2])
+    parser.add_argument(
+        "--documents",
+        help='JSONL file with a "text" field and an optional "reference" summary',
+    )
+    parser.add_argument("--count", type=int, default=2, help="Synthetic documents")
+    parser.add_argument("--words", type=int, default=12000, help="Words per synthetic document")
+    args = parser.parse_args()
+
+    if args.documents:
+        with open(args.documents, "r", encoding="utf-8") as f:
+            documents = [json.loads(line) for line in f if line.strip()]
+    else:
+        documents = make_documents(args.count, args.words)
+
+    summarizer = TextSummarizer(args.model, cache=SummaryCache(max_entries=0))
+    summarizer.extractive_min_words = 0  # Pre-filter every document under test
+    summarizer.load_model()
+
+    references = [d.get("reference") for d in documents]
+    has_references = all(references)
+
+    header = (
+        f"{'Ratio':>6} {'Select (s)':>11} {'Total (s)':>10} {'Speedup':>8} "
+        f"{'Tokens':>9} {'R-1':>6} {'R-2':>6} {'R-L':>6}"
+    )
+    if has_references:
+        header += f" {'Ref R-L':>8}"
+    print(f"Model: {args.model} | {len(documents)} documents")
+    print(header)
+
+    baseline = None
+    for ratio in [None] + args.ratios:
+        summarizer.extractive_ratio = ratio
+        select_times, total_times, tokens, summaries = [], [], [], []
+        for document in documents:
+            start = time.perf_counter()
+            if ratio:
+                select_sentences(document["text"], ratio)
+            select_times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            result = summarizer.summarize(document["text"])
+            total_times.append(time.perf_counter() - start)
+            tokens.append(result.input_tokens)
+            summaries.append(result.summary)
+
+        if baseline is None:
+            baseline = {"seconds": statistics.mean(total_times), "summaries": summaries}
+        agreement = mean_rouge(summaries, baseline["summaries"])
+
+        line = (
+            f"{ratio or 1.0:>6.2f} {statistics.mean(select_times):>11.3f} "
+            f"{statistics.mean(total_times):>10.2f} "
+            f"{baseline['seconds'] / statistics.mean(total_times):>7.2f}x "
+            f"{statistics.mean(tokens):>9,.0f} {agreement['rouge1']:>6.3f} "
+            f"{agreement['rouge2']:>6.3f} {agreement['rougeL']:>6.3f}"
+        )
+        if has_references:
+            line += f" {mean_rouge(summaries, references)['rougeL']:>8.3f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
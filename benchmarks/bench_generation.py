@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the generation presets
+Reports decode time, summary length and ROUGE for each summary length preset
+(see modules/generation_policy.py) on the same documents.
+
+Decode time is the time spent in model.generate, recorded by the metrics
+layer under "decode_<preset>". ROUGE is computed against the "long" preset's
+summaries, and against reference summaries when the documents file provides
+them.
+
+Examples:
+    python benchmarks/bench_generation.py --model sshleifer/distilbart-cnn-12-6
+    python benchmarks/bench_generation.py --documents docs.jsonl --presets short medium
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_backends import make_documents, mean_rouge
+from modules.cache import SummaryCache
+from modules.generation_policy import PRESETS
+from modules.metrics import Metrics
+from modules.model_registry import ModelRegistry
+from modules.text_summarizer import TextSummarizer
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--model", default=os.getenv("DEFAULT_MODEL", "facebook/bart-large-cnn")
+    )
+    parser.add_argument("--backend", default=os.getenv("INFERENCE_BACKEND", "torch"))
+    parser.add_argument(
+        "--presets", nargs="+", choices=list(PRESETS), default=list(PRESETS)
+    )
+    parser.add_argument(
+        "--documents",
+        help='JSONL file with a "text" field and an optional "reference" summary',
+    )
+    parser.add_argument("--count", type=int, default=8, help="Synthetic documents")
+    parser.add_argument("--words", type=int, default=600, help="Words per synthetic document")
+    parser.add_argument("--output", help="Write the full results to this JSON file")
+    args = parser.parse_args()
+
+    if args.documents:
+        with open(args.documents, "r", encoding="utf-8") as f:
+            documents = [json.loads(line) for line in f if line.strip()]
+    else:
+        documents = make_documents(args.count, args.words)
+
+    metrics = Metrics(enabled=True)
+    summarizer = TextSummarizer(
+        args.model,
+        cache=SummaryCache(max_entries=0),  # Every run must hit the model
+        registry=ModelRegistry(
+            max_models=1, onnx_cache_dir=os.getenv("ONNX_CACHE_DIR")
+        ),
+        backend=args.backend,
+        metrics=metrics,
+    )
+    summarizer.load_model()
+    summarizer.summarize(documents[0]["text"])  # Warm-up
+
+    # The most thorough preset runs first so the others can be scored against it
+    presets = ["long"] + [name for name in args.presets if name != "long"]
+    results = []
+    for name in presets:
+        summarizer.apply_preset(PRESETS[name])
+        metrics.reset()
+        latencies, summaries = [], []
+        for document in documents:
+            start = time.perf_counter()
+            summaries.append(summarizer.summarize(document["text"]).summary)
+            latencies.append(time.perf_counter() - start)
+
+        snapshot = metrics.snapshot()
+        results.append(
+            {
+                "preset": name,
+                "decode_seconds": snapshot["stages"][f"decode_{name}"]["seconds"],
+                "latencies": latencies,
+                "tokens_out": snapshot["counters"].get("tokens_out", 0),
+                "summaries": summaries,
+            }
+        )
+
+    baseline = results[0]
+    references = [d.get("reference") for d in documents]
+    has_references = all(references)
+
+    header = (
+        f"{'Preset':<8} {'Decode (s)':>10} {'Mean (s)':>9} {'Tokens out':>10} "
+        f"{'Words':>6} {'R-1':>6} {'R-2':>6} {'R-L':>6}"
+    )
+    if has_references:
+        header += f" {'Ref R-L':>8}"
+    print(f"Model: {args.model} | {len(documents)} documents")
+    print(header)
+    for result in results:
+        if result["preset"] not in args.presets:
+            continue
+        agreement = mean_rouge(result["summaries"], baseline["summaries"])
+        result["rouge_vs_long"] = agreement
+        words = statistics.mean(len(summary.split()) for summary in result["summaries"])
+        line = (
+            f"{result['preset']:<8} {result['decode_seconds']:>10.2f} "
+            f"{statistics.mean(result['latencies']):>9.3f} {result['tokens_out']:>10.0f} "
+            f"{words:>6.0f} {agreement['rouge1']:>6.3f} {agreement['rouge2']:>6.3f} "
+            f"{agreement['rougeL']:>6.3f}"
+        )
+        if has_references:
+            result["rouge_vs_reference"] = mean_rouge(result["summaries"], references)
+            line += f" {result['rouge_vs_reference']['rougeL']:>8.3f}"
+        print(line)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"model": args.model, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Benchmark for multi-file PDF summarization
+Compares summarizing a set of PDFs one file at a time (PDFProcessor.process
+and TextSummarizer.summarize per file) against the multi-file pipeline
+(PDFProcessor.process_many and TextSummarizer.summarize_documents), which
+extracts the files concurrently and fills model batches with chunks from
+every file.
+
+The PDFs are generated here with varied lengths, and summarization uses a tiny
+locally built model (see tiny_model.py). Each mode runs in a fresh process
+with its own cold cache.
+
+Examples:
+    python benchmarks/bench_multi_document.py
+    python benchmarks/bench_multi_document.py --files 12 --pages 1 8 --workers 4
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_pipeline import WORDS, make_pages, make_pdf
+from modules.cache import SummaryCache
+from modules.pdf_processor import PDFProcessor
+from modules.text_summarizer import TextSummarizer
+
+
+def run_mode(model_dir: str, pdfs: List[bytes], mode: str, workers: int) -> Dict:
+    """
+    Summarize every PDF in one mode (runs in its own process)
+
+    Args:
+        model_dir: Directory of the tiny model
+        pdfs: PDF files
+        mode: "per-file" or "multi-file"
+        workers: Extraction worker processes
+
+    Returns:
+        Dict: Wall time and the split between extraction and summarization
+    """
+    logging.disable(logging.WARNING)  # Keep pipeline warnings out of the table
+    processor = PDFProcessor()
+    processor.max_workers = workers
+    processor.parallel_document_bytes = 0  # Generated files are small
+    summarizer = TextSummarizer(model_dir, cache=SummaryCache(max_entries=0))
+    summarizer.load_model()
+
+    start = time.perf_counter()
+    if mode == "per-file":
+        extract_seconds = 0.0
+        summaries = []
+        for pdf in pdfs:
+            extract_start = time.perf_counter()
+            text = processor.process(pdf).text
+            extract_seconds += time.perf_counter() - extract_start
+            summaries.append(summarizer.summarize(text))
+    else:
+        extractions = processor.process_many(pdfs)
+        extract_seconds = time.perf_counter() - start
+        summaries = summarizer.summarize_documents([e.text for e in extractions])
+    seconds = time.perf_counter() - start
+
+    return {
+        "mode": mode,
+        "files": len(pdfs),
+        "chunks": sum(summary.chunk_count for summary in summaries),
+        "seconds": seconds,
+        "extract_seconds": extract_seconds,
+        "summarize_seconds": seconds - extract_seconds,
+    }
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--files", type=int, default=8, help="PDF files per run")
+    parser.add_argument(
+        "--pages", type=int, nargs=2, default=[1, 6], help="Page range per file"
+    )
+    parser.add_argument("--words", type=int, default=300, help="Words per page")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=min(4, os.cpu_count() or 1),
+        help="Extraction worker processes",
+    )
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    pdfs = [
+        make_pdf(make_pages(rng.randint(*args.pages), args.words, seed=i))
+        for i in range(args.files)
+    ]
+
+    ctx = multiprocessing.get_context("spawn")
+    results = []
+    with tempfile.TemporaryDirectory() as model_dir:
+        from tiny_model import build_tiny_model
+
+        with ctx.Pool(1) as pool:
+            pool.apply(build_tiny_model, (model_dir, WORDS))
+
+        print(f"{args.files} files, {args.workers} extraction worker(s)")
+        print(
+            f"{'Mode':<11} {'Chunks':>6} {'Extract (s)':>11} "
+            f"{'Summarize (s)':>13} {'Total (s)':>9}"
+        )
+        for mode in ("per-file", "multi-file"):
+            # Pool workers are daemonic and cannot start extraction workers
+            with ProcessPoolExecutor(1, mp_context=ctx) as executor:
+                result = executor.submit(
+                    run_mode, model_dir, pdfs, mode, args.workers
+                ).result()
+            results.append(result)
+            print(
+                f"{mode:<11} {result['chunks']:>6} {result['extract_seconds']:>11.2f} "
+                f"{result['summarize_seconds']:>13.2f} {result['seconds']:>9.2f}"
+            )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"settings": vars(args), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for text normalization
+Compares the shared single-pass normalizer with the previous chained regex passes.
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import timeit
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.text_normalizer import normalize_text
+
+
+def legacy_normalize(text: str) -> str:
+    """Previous PDFProcessor.preprocess_text implementation (four passes)"""
+    text = re.sub(r"\n+", "\n", text)
+    text = re.sub(r"\s+", " ", text)
+    text = re.sub(r"[^\w\s\.\,\!\?\;\:\-\(\)\[\]\"\'\/]", " ", text)
+    text = " ".join(text.split())
+    return text.strip()
+
+
+def make_extracted_text(size_mb: float, seed: int = 0) -> str:
+    """
+    Generate text that looks like PDF extraction output
+
+    Args:
+        size_mb: Approximate size of the text in megabytes
+        seed: Random seed for reproducible output
+
+    Returns:
+        str: Synthetic text with ragged whitespace and stray symbols
+    """
+    rng = random.Random(seed)
+    words = "the lecture notes cover data model training results figure table".split()
+    noise = ["  ", "\n", "\n\n", "\t", " • ", " © ", "—", " | ", "...", " (see 3.2) "]
+    parts = []
+    size = 0
+    target = int(size_mb * 1024 * 1024)
+    while size < target:
+        part = rng.choice(words) + (rng.choice(noise) if rng.random() < 0.2 else " ")
+        parts.append(part)
+        size += len(part)
+    return "".join(parts)
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=float, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'Size':>8} {'Legacy (s)':>12} {'Single-pass (s)':>16} {'Speedup':>8}")
+    for size_mb in args.sizes:
+        text = make_extracted_text(size_mb)
+        legacy = min(timeit.repeat(lambda: legacy_normalize(text), number=1, repeat=args.repeat))
+        single = min(timeit.repeat(lambda: normalize_text(text), number=1, repeat=args.repeat))
+        print(f"{size_mb:>6.1f}MB {legacy:>12.3f} {single:>16.3f} {legacy / single:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Benchmark for PDF extraction backends
+Compares pages/sec of every installed backend (see modules/pdf_backends.py)
+on the same corpus.
+
+The corpus is a generated text PDF per --pages size, plus any PDF files given
+with --pdfs; real documents with embedded fonts are where the backends differ
+most. Each backend opens every document and extracts all of its pages in this
+process, without the worker pool, so the numbers compare the libraries
+themselves. Word counts are reported so diverging output is easy to spot.
+
+Examples:
+    python benchmarks/bench_pdf_backends.py
+    python benchmarks/bench_pdf_backends.py --pdfs ~/papers/*.pdf --repeat 3
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Dict, List, Tuple
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_pipeline import make_pages, make_pdf
+from modules.pdf_backends import available_backends, get_backend
+
+
+def load_corpus(
+    pages: List[int], words_per_page: int, pdfs: List[str]
+) -> List[Tuple[str, bytes]]:
+    """
+    Build the benchmark documents
+
+    Args:
+        pages: Page counts of the generated PDFs
+        words_per_page: Approximate words per generated page
+        pdfs: Paths of additional PDF files
+
+    Returns:
+        List[Tuple[str, bytes]]: Document names and contents
+    """
+    corpus = [
+        (f"generated-{count}p", make_pdf(make_pages(count, words_per_page)))
+        for count in pages
+    ]
+    for path in pdfs:
+        with open(path, "rb") as f:
+            corpus.append((os.path.basename(path), f.read()))
+    return corpus
+
+
+def run_backend(name: str, data: bytes, repeat: int) -> Dict:
+    """
+    Extract every page of one document with one backend
+
+    Args:
+        name: Backend name
+        data: PDF file contents
+        repeat: Runs to take the fastest of
+
+    Returns:
+        Dict: Pages, best time, pages/sec, words and failed pages
+    """
+    backend = get_backend(name)
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        document = backend.open(data)
+        try:
+            page_count = backend.page_count(document)
+            texts = backend.extract_pages(document, 0, page_count)
+        finally:
+            backend.close(document)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    return {
+        "pages": page_count,
+        "seconds": round(best, 4),
+        "pages_per_sec": round(page_count / best, 1) if best else None,
+        "words": sum(len(text.split()) for text in texts if text),
+        "failed_pages": sum(1 for text in texts if text is None),
+    }
+
+
+def main():
+    """Run the benchmark from the command line"""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--pages", type=int, nargs="*", default=[10, 100, 500])
+    parser.add_argument("--words-per-page", type=int, default=400)
+    parser.add_argument("--pdfs", nargs="*", default=[], help="Additional PDF files")
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        default=available_backends(),
+        help="Backends to compare (default: all installed)",
+    )
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.pages, args.words_per_page, args.pdfs)
+    results = []
+    print(
+        f"{'document':<24} {'backend':<10} {'pages':>6} "
+        f"{'seconds':>9} {'pages/s':>9} {'words':>9}"
+    )
+    for document_name, data in corpus:
+        for backend in args.backends:
+            result = {"document": document_name, "backend": backend}
+            result.update(run_backend(backend, data, args.repeat))
+            results.append(result)
+            print(
+                f"{document_name:<24} {backend:<10} {result['pages']:>6} "
+                f"{result['seconds']:>9.3f} {result['pages_per_sec']:>9.1f} "
+                f"{result['words']:>9}"
+            )
+
+    # Totals over the whole corpus
+    print()
+    for backend in args.backends:
+        rows = [result for result in results if result["backend"] == backend]
+        pages = sum(result["pages"] for result in rows)
+        seconds = sum(result["seconds"] for result in rows)
+        print(f"{backend:<10} {pages / seconds:>9.1f} pages/s over {pages} pages")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"backends": args.backends, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
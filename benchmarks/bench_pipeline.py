@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the extraction and summarization pipeline
+Measures PDFProcessor.process_pdf, TextSummarizer.chunk_text and end-to-end
+TextSummarizer.summarize_text on generated documents of 1 to 500 pages.
+
+Everything runs offline: the PDFs are generated here, and summarization uses a
+tiny randomly initialized model (see tiny_model.py) so the numbers track the
+pipeline's own overhead rather than a particular model. Each stage and size
+runs in a fresh process, so peak RSS is measured per measurement.
+
+Results are written as JSON; a run compared against a saved baseline reports
+the change per measurement and exits with status 1 on a regression.
+
+Examples:
+    python benchmarks/bench_pipeline.py --save-baseline benchmarks/baseline.json
+    python benchmarks/bench_pipeline.py --baseline benchmarks/baseline.json
+    python benchmarks/bench_pipeline.py --pages 1 10 --stages chunk_text --repeat 5
+"""
+
+import argparse
+import io
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import sys
+import tempfile
+import textwrap
+import time
+from typing import Dict, List
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.cache import SummaryCache
+from modules.metrics import Metrics
+from modules.pdf_processor import PDFProcessor
+from modules.text_normalizer import normalize_text
+from modules.text_summarizer import TextSummarizer
+
+STAGES = ("process_pdf", "chunk_text", "summarize_text")
+
+WORDS = """
+    the lecture notes cover data model training results figure table method
+    experiment baseline accuracy error rate memory inference attention weights
+    dataset students review chapter section example summary question answer
+    learning network layer loss function gradient update batch sample test
+    shows improves measures reduces explains describes compares with and of to
+    in on for by from this that these our we it is are was were be can will
+""".split()
+
+
+class UploadedPDF(io.BytesIO):
+    """In-memory file with the attributes PDFProcessor expects from an upload"""
+
+    def __init__(self, data: bytes, name: str = "benchmark.pdf"):
+        super().__init__(data)
+        self.name = name
+        self.type = "application/pdf"
+        self.size = len(data)
+
+
+def make_pages(count: int, words_per_page: int, seed: int = 0) -> List[str]:
+    """
+    Generate the text of lecture-note pages
+
+    Args:
+        count: Number of pages
+        words_per_page: Approximate words per page
+        seed: Random seed for reproducible output
+
+    Returns:
+        List[str]: Text per page
+    """
+    rng = random.Random(seed)
+    pages = []
+    for _ in range(count):
+        sentences = []
+        words = 0
+        while words < words_per_page:
+            length = rng.randint(8, 20)
+            sentence = " ".join(rng.choice(WORDS) for _ in range(length))
+            sentences.append(sentence.capitalize() + ".")
+            words += length
+        pages.append(" ".join(sentences))
+    return pages
+
+
+def make_pdf(pages: List[str]) -> bytes:
+    """
+    Write pages of plain text as a minimal PDF file
+
+    Args:
+        pages: Text per page (ASCII)
+
+    Returns:
+        bytes: PDF file contents
+    """
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [%s] /Count %d >>"
+        % (
+            " ".join(f"{4 + 2 * i} 0 R" for i in range(len(pages))).encode("ascii"),
+            len(pages),
+        ),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i, text in enumerate(pages):
+        lines = [
+            "(" + line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") + ") '"
+            for line in textwrap.wrap(text, 90)
+        ]
+        content = ("BT /F1 9 Tf 36 806 Td 11 TL " + " ".join(lines) + " ET").encode("ascii")
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (5 + 2 * i)
+        )
+        objects.append(
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content)
+        )
+
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        pdf += b"%010d 00000 n \n" % offset
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    return bytes(pdf)
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is reported in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_stage(
+    stage: str, pages: int, words_per_page: int, model_dir: str, repeat: int
+) -> Dict:
+    """
+    Measure one stage on one document size (runs in its own process)
+
+    Args:
+        stage: One of STAGES
+        pages: Pages in the generated document
+        words_per_page: Approximate words per page
+        model_dir: Directory of the tiny model
+        repeat: Timed runs; the fastest one is reported
+
+    Returns:
+        Dict: Wall times, peak RSS, throughput and stage details
+    """
+    logging.disable(logging.WARNING)  # Keep pipeline warnings out of the table
+
+    page_texts = make_pages(pages, words_per_page)
+    text = normalize_text("\n".join(page_texts))
+    details = {}
+    reset = None  # Runs untimed before every repeat
+
+    if stage == "process_pdf":
+        pdf = make_pdf(page_texts)
+        processor = PDFProcessor()
+        details["pdf_mb"] = len(pdf) / 1024 / 1024
+
+        def run():
+            return processor.process_pdf(UploadedPDF(pdf))
+
+    else:
+        metrics = Metrics(enabled=True)
+        summarizer = TextSummarizer(
+            model_dir,
+            cache=SummaryCache(max_entries=0),  # Every run must hit the model
+            metrics=metrics,
+        )
+        # Fixed lengths keep the amount of generated text the same across runs
+        summarizer.min_summary_length = 40
+        summarizer.max_summary_length = 60
+        summarizer.load_model()
+        # Every repeat must tokenize the document again instead of hitting
+        # the tokenizer service's memo
+        reset = summarizer.tokens.clear
+
+        if stage == "chunk_text":
+
+            def run():
+                return summarizer.chunk_text(text)
+
+        else:
+            summarizer.summarize_text(make_pages(1, 400, seed=1)[0])  # Warm-up
+            metrics.reset()
+
+            def run():
+                return summarizer.summarize_text(text)
+
+    rss_before = _peak_rss_mb()
+    seconds = []
+    for _ in range(repeat):
+        if reset is not None:
+            reset()
+        start = time.perf_counter()
+        output = run()
+        seconds.append(time.perf_counter() - start)
+        if output is None:
+            return {"stage": stage, "pages": pages, "error": f"{stage} returned None"}
+
+    if stage == "chunk_text":
+        details["chunks"] = len(output)
+    elif stage == "summarize_text":
+        details["stage_seconds"] = {
+            name: timing["seconds"] / repeat
+            for name, timing in metrics.snapshot()["stages"].items()
+        }
+
+    best = min(seconds)
+    words = len(text.split())
+    return {
+        "stage": stage,
+        "pages": pages,
+        "words": words,
+        "seconds": best,
+        "all_seconds": seconds,
+        "pages_per_second": pages / best,
+        "words_per_second": words / best,
+        "peak_rss_mb": _peak_rss_mb(),
+        "rss_growth_mb": _peak_rss_mb() - rss_before,
+        **details,
+    }
+
+
+def environment() -> Dict:
+    """Describe the machine and library versions the results come from"""
+    import PyPDF2
+    import torch
+    import transformers
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "torch": torch.__version__,
+        "transformers": transformers.__version__,
+        "PyPDF2": PyPDF2.__version__,
+    }
+
+
+def compare(
+    results: List[Dict], baseline: Dict, tolerance: float, min_seconds: float
+) -> List[str]:
+    """
+    Compare results with a baseline run
+
+    Args:
+        results: Measurements of this run
+        baseline: Contents of a baseline results file
+        tolerance: Allowed relative slowdown or memory growth (0.2 = 20%)
+        min_seconds: Slowdowns smaller than this are treated as timing noise
+
+    Returns:
+        List[str]: Description of each regression
+    """
+    previous = {
+        (r["stage"], r["pages"]): r for r in baseline["results"] if "error" not in r
+    }
+    regressions = []
+    for result in results:
+        before = previous.get((result["stage"], result["pages"]))
+        if before is None or "error" in result:
+            continue
+        for key, label in (("seconds", "wall time"), ("peak_rss_mb", "peak RSS")):
+            change = result[key] / before[key] - 1
+            result[f"{key}_change"] = change
+            if change > tolerance and (
+                key != "seconds" or result[key] - before[key] > min_seconds
+            ):
+                regressions.append(
+                    f"{result['stage']} ({result['pages']} pages): {label} "
+                    f"{before[key]:.3f} -> {result[key]:.3f} (+{change:.0%})"
+                )
+    return regressions
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 10, 50, 100, 500])
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES))
+    parser.add_argument("--words-per-page", type=int, default=400)
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per measurement")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--save-baseline", help="Write the results as a new baseline")
+    parser.add_argument("--baseline", help="Compare against this baseline file")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed slowdown or memory growth against the baseline (default 0.2)",
+    )
+    parser.add_argument(
+        "--min-seconds",
+        type=float,
+        default=0.05,
+        help="Ignore slowdowns smaller than this many seconds (default 0.05)",
+    )
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    results = []
+    with tempfile.TemporaryDirectory() as model_dir:
+        from tiny_model import build_tiny_model
+
+        # Linux carries peak RSS over into spawned children, so the parent
+        # never imports PyTorch itself while measurements run
+        with ctx.Pool(1) as pool:
+            pool.apply(build_tiny_model, (model_dir, WORDS))
+
+        print(
+            f"{'Stage':<15} {'Pages':>6} {'Words':>9} {'Time (s)':>9} "
+            f"{'Pages/s':>9} {'Words/s':>10} {'Peak RSS':>9} {'Growth':>8}"
+        )
+        for stage in args.stages:
+            for pages in args.pages:
+                with ctx.Pool(1) as pool:
+                    result = pool.apply(
+                        run_stage,
+                        (stage, pages, args.words_per_page, model_dir, args.repeat),
+                    )
+                results.append(result)
+
+                if "error" in result:
+                    print(f"{stage:<15} {pages:>6} failed: {result['error']}")
+                    continue
+                print(
+                    f"{stage:<15} {pages:>6} {result['words']:>9,} "
+                    f"{result['seconds']:>9.3f} {result['pages_per_second']:>9.1f} "
+                    f"{result['words_per_second']:>10,.0f} "
+                    f"{result['peak_rss_mb']:>7.0f}MB {result['rss_growth_mb']:>6.0f}MB"
+                )
+
+    report = {
+        "environment": environment(),
+        "settings": {"words_per_page": args.words_per_page, "repeat": args.repeat},
+        "results": results,
+    }
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("environment") != report["environment"]:
+            print("\nWarning: the baseline was recorded in a different environment")
+        if baseline.get("settings") != report["settings"]:
+            print("Warning: the baseline was recorded with different settings")
+
+        regressions = compare(results, baseline, args.tolerance, args.min_seconds)
+        print(f"\nCompared with {args.baseline} (tolerance {args.tolerance:.0%}):")
+        for result in results:
+            if "seconds_change" in result:
+                print(
+                    f"  {result['stage']:<15} {result['pages']:>6} pages: "
+                    f"time {result['seconds_change']:+.1%}, "
+                    f"peak RSS {result['peak_rss_mb_change']:+.1%}"
+                )
+        for regression in regressions:
+            print(f"  REGRESSION {regression}")
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Benchmark for startup time
+Measures, in a fresh process per run, how long the application's modules take
+to import, how long the model takes to load, and the time from process start
+to the first summary.
+
+Three startups are compared:
+    hub:              the model loaded by name (Hub cache or model directory)
+    artifact:         the model loaded from a materialized artifact
+                      (see prepare_models.py)
+    artifact+warm-up: as above, with the warm-up generation the API runs
+                      before reporting ready
+
+Without --model, a tiny locally built model (see tiny_model.py) is used so the
+benchmark runs offline; pass a real model to measure its download cache
+against its artifact.
+
+Examples:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --model sshleifer/distilbart-cnn-12-6 --repeat 3
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Nothing from the project is imported at module level: startup processes
+# import this module too, and the imports are what is being measured
+MODES = ("hub", "artifact", "artifact+warm-up")
+
+
+def run_startup(
+    model_name: str, artifact_dir: Optional[str], warm_up: bool, text: str
+) -> Dict:
+    """
+    Start the summarizer and summarize one text (runs in a fresh process)
+
+    Args:
+        model_name: Model to load
+        artifact_dir: Artifact directory (None loads the model by name)
+        warm_up: Run the warm-up generation before the first summary
+        text: Text of the first summary
+
+    Returns:
+        Dict: Seconds per startup step, counted from the start of the imports
+    """
+    import logging
+
+    start = time.perf_counter()
+    from modules.cache import SummaryCache
+    from modules.model_registry import ModelRegistry
+    from modules.pdf_processor import PDFProcessor  # noqa: F401
+    from modules.text_summarizer import TextSummarizer
+
+    import_seconds = time.perf_counter() - start
+    import torch  # noqa: F401
+    import transformers  # noqa: F401
+
+    framework_import_seconds = time.perf_counter() - start - import_seconds
+    logging.disable(logging.WARNING)  # Keep loading messages out of the table
+
+    registry = ModelRegistry(max_models=1, artifact_dir=artifact_dir)
+    summarizer = TextSummarizer(
+        model_name, cache=SummaryCache(max_entries=0), registry=registry
+    )
+    load_start = time.perf_counter()
+    summarizer.load_model()
+    load_seconds = time.perf_counter() - load_start
+
+    warm_up_seconds = registry.warm_up(model_name) if warm_up else 0.0
+    ready_seconds = time.perf_counter() - start
+
+    summary_start = time.perf_counter()
+    summarizer.summarize(text)
+    first_summary_seconds = time.perf_counter() - summary_start
+
+    return {
+        "import_seconds": import_seconds,
+        "framework_import_seconds": framework_import_seconds,
+        "load_seconds": load_seconds,
+        "warm_up_seconds": warm_up_seconds,
+        "ready_seconds": ready_seconds,
+        "first_summary_seconds": first_summary_seconds,
+        "time_to_first_summary": ready_seconds + first_summary_seconds,
+    }
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--model", help="Model to start (default: a tiny local model)")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--repeat", type=int, default=3, help="Startups per mode")
+    parser.add_argument("--words", type=int, default=300, help="Words to summarize")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    from bench_pipeline import WORDS, make_pages
+
+    ctx = multiprocessing.get_context("spawn")
+    text = make_pages(1, args.words, seed=0)[0]
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        model_name = args.model
+        if model_name is None:
+            from tiny_model import build_tiny_model
+
+            model_name = os.path.join(work_dir, "tiny-model")
+            with ProcessPoolExecutor(1, mp_context=ctx) as executor:
+                executor.submit(build_tiny_model, model_name, WORDS).result()
+
+        from modules.model_artifacts import materialize
+
+        artifact_dir = os.path.join(work_dir, "artifacts")
+        with ProcessPoolExecutor(1, mp_context=ctx) as executor:
+            executor.submit(materialize, model_name, artifact_dir).result()
+
+        print(f"Model: {args.model or 'tiny local model'} | median of {args.repeat}")
+        print(
+            f"{'Mode':<17} {'Import (s)':>10} {'Torch+HF (s)':>12} {'Load (s)':>8} "
+            f"{'Warm-up (s)':>11} {'Ready (s)':>9} {'1st summary (s)':>15}"
+        )
+        for mode in args.modes:
+            runs = []
+            for _ in range(args.repeat):
+                # A fresh interpreter per startup, so nothing is imported or loaded yet
+                with ProcessPoolExecutor(1, mp_context=ctx) as executor:
+                    runs.append(
+                        executor.submit(
+                            run_startup,
+                            model_name,
+                            artifact_dir if mode != "hub" else None,
+                            mode == "artifact+warm-up",
+                            text,
+                        ).result()
+                    )
+            result = {
+                key: statistics.median(run[key] for run in runs) for key in runs[0]
+            }
+            result["mode"] = mode
+            results.append(result)
+            print(
+                f"{mode:<17} {result['import_seconds']:>10.2f} "
+                f"{result['framework_import_seconds']:>12.2f} "
+                f"{result['load_seconds']:>8.2f} {result['warm_up_seconds']:>11.2f} "
+                f"{result['ready_seconds']:>9.2f} {result['first_summary_seconds']:>15.2f}"
+            )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"settings": vars(args), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
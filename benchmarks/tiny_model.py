@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Tiny summarization model for offline benchmarks
+Builds a randomly initialized BART model with a word-level tokenizer. Its
+summaries are meaningless, but it exercises the same tokenizer, batching and
+generate() code paths as the real models without downloading anything.
+
+Example:
+    python benchmarks/tiny_model.py /tmp/tiny-bart
+"""
+
+import argparse
+from typing import Iterable
+
+# Special tokens in the order BART expects their IDs
+SPECIAL_TOKENS = ["<s>", "<pad>", "</s>", "<unk>", "<mask>"]
+PUNCTUATION = [".", ",", "!", "?", ";", ":", "(", ")", "-"]
+
+
+def build_tiny_model(
+    output_dir: str,
+    words: Iterable[str],
+    max_length: int = 1024,
+    seed: int = 0,
+    d_model: int = 16,
+    layers: int = 1,
+) -> str:
+    """
+    Build a tiny BART summarization model and save it
+
+    Args:
+        output_dir: Directory to save the model and tokenizer to
+        words: Vocabulary; other words are encoded as <unk>
+        max_length: Model input limit in tokens
+        seed: Random seed for the weights, so every build generates the same text
+        d_model: Hidden size; larger models make compute dominate the timings
+        layers: Encoder and decoder layers
+
+    Returns:
+        str: output_dir, for use as a model name
+    """
+    import torch
+    from tokenizers import Tokenizer, models, normalizers, pre_tokenizers, processors
+    from transformers import (
+        BartConfig,
+        BartForConditionalGeneration,
+        PreTrainedTokenizerFast,
+    )
+
+    tokens = SPECIAL_TOKENS + PUNCTUATION + sorted({word.lower() for word in words})
+    vocab = {token: i for i, token in enumerate(tokens)}
+
+    tokenizer = Tokenizer(models.WordLevel(vocab=vocab, unk_token="<unk>"))
+    tokenizer.normalizer = normalizers.Lowercase()
+    tokenizer.pre_tokenizer = pre_tokenizers.Whitespace()
+    tokenizer.post_processor = processors.TemplateProcessing(
+        single="<s> $A </s>",
+        pair="<s> $A </s> </s> $B </s>",
+        special_tokens=[("<s>", vocab["<s>"]), ("</s>", vocab["</s>"])],
+    )
+    tokenizer = PreTrainedTokenizerFast(
+        tokenizer_object=tokenizer,
+        bos_token="<s>",
+        eos_token="</s>",
+        pad_token="<pad>",
+        unk_token="<unk>",
+        mask_token="<mask>",
+        model_max_length=max_length,
+    )
+
+    config = BartConfig(
+        vocab_size=len(vocab),
+        d_model=d_model,
+        encoder_layers=layers,
+        decoder_layers=layers,
+        encoder_attention_heads=2,
+        decoder_attention_heads=2,
+        encoder_ffn_dim=2 * d_model,
+        decoder_ffn_dim=2 * d_model,
+        max_position_embeddings=max_length + 2,  # BART offsets positions by 2
+        pad_token_id=vocab["<pad>"],
+        bos_token_id=vocab["<s>"],
+        eos_token_id=vocab["</s>"],
+        decoder_start_token_id=vocab["</s>"],
+        forced_eos_token_id=vocab["</s>"],
+    )
+    torch.manual_seed(seed)
+    model = BartForConditionalGeneration(config)
+
+    model.save_pretrained(output_dir)
+    tokenizer.save_pretrained(output_dir)
+    return output_dir
+
+
+def main():
+    """Build the model from the command line"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("output_dir")
+    parser.add_argument("--max-length", type=int, default=1024)
+    args = parser.parse_args()
+
+    from bench_pipeline import WORDS
+
+    build_tiny_model(args.output_dir, WORDS, args.max_length)
+    print(f"Saved tiny model to {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
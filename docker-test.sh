@@ -55,13 +55,14 @@ fi
 
 # Test 4: Wait for application to be ready
 echo -e "${BLUE}⏳ Test 4: Waiting for application to be ready...${NC}"
-for i in {1..30}; do
+# (the container warms up its models before Streamlit starts answering)
+for i in {1..180}; do
     if curl -f "http://localhost:${TEST_PORT}/_stcore/health" > /dev/null 2>&1; then
         echo -e "${GREEN}✅ Application is ready${NC}"
         break
     fi
-    if [ $i -eq 30 ]; then
-        echo -e "${RED}❌ Application failed to start within 30 seconds${NC}"
+    if [ $i -eq 180 ]; then
+        echo -e "${RED}❌ Application failed to start within 180 seconds${NC}"
         docker logs "${CONTAINER_NAME}"
         exit 1
     fi
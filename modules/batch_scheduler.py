@@ -0,0 +1,130 @@
+"""
+Batch Scheduling Module
+Collects chunks from concurrent requests into dynamic batches for one shared model.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Optional, Tuple
+
+from .metrics import Trace
+
+# A queued chunk, the future of its summary and the trace of its request
+_Item = Tuple[str, Future, Optional[Trace]]
+
+
+class BatchScheduler:
+    """Runs chunks from many callers through a single model in dynamic batches"""
+
+    def __init__(self, summarizer, max_batch_size: int = 8, max_wait: float = 0.05):
+        """
+        Initialize the scheduler
+
+        Args:
+            summarizer: TextSummarizer whose model runs the batches
+            max_batch_size: Maximum number of chunks per forward pass
+            max_wait: Seconds to wait for more chunks after the first one arrives
+        """
+        self.summarizer = summarizer
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: "queue.Queue[_Item]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def start(self):
+        """Start the worker thread and route the summarizer's batches through it"""
+        if self._thread is not None:
+            return
+
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="batch-scheduler", daemon=True
+        )
+        self._thread.start()
+        self.summarizer.scheduler = self
+
+    def stop(self):
+        """Stop the worker thread after the current batch"""
+        if self._thread is None:
+            return
+
+        self.summarizer.scheduler = None
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+
+        # Fail anything that was queued but never run
+        while True:
+            try:
+                _, future, _ = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            future.set_exception(RuntimeError("Batch scheduler stopped"))
+
+    def submit(self, chunk: str) -> Future:
+        """
+        Queue a chunk for summarization
+
+        The caller's trace is kept with the chunk, so the batch it runs in is
+        recorded into the caller's request trace.
+
+        Args:
+            chunk: Text chunk to summarize
+
+        Returns:
+            Future: Resolves to the chunk summary (None if summarization fails)
+        """
+        future: Future = Future()
+        self._queue.put((chunk, future, self.summarizer.metrics.current_trace()))
+        return future
+
+    def _collect_batch(self) -> List[_Item]:
+        """
+        Wait for the next chunk, then gather more until the batch is full or the deadline passes
+
+        Returns:
+            List[_Item]: Queued chunks with their futures and traces
+        """
+        try:
+            batch = [self._queue.get(timeout=0.1)]
+        except queue.Empty:
+            return []
+
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self):
+        """Worker loop that owns all model calls"""
+        while not self._stopped.is_set():
+            batch = self._collect_batch()
+            if not batch:
+                continue
+
+            # Sort by length so each forward pass pads to a similar length
+            batch.sort(key=lambda item: len(item[0]), reverse=True)
+            chunks = [chunk for chunk, _, _ in batch]
+            # Every request with a chunk in the batch sees the batch's spans and counts
+            traces = [trace for _, _, trace in batch]
+
+            try:
+                with self.summarizer.metrics.record_into(traces):
+                    summaries = self.summarizer.run_batch(chunks)
+            except Exception as e:
+                for _, future, _ in batch:
+                    future.set_exception(e)
+                continue
+
+            for (_, future, _), summary in zip(batch, summaries):
+                future.set_result(summary)
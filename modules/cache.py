@@ -0,0 +1,385 @@
+"""
+Caching Module
+Content-addressed caches with an in-memory LRU tier and an optional on-disk tier.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+# Disk hits between writes of their access times
+ACCESS_FLUSH_INTERVAL = 256
+
+
+class LRUCache:
+    """Thread-safe in-memory cache that evicts the least recently used entry"""
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Initialize the LRU cache
+
+        Args:
+            max_entries: Maximum number of entries kept in memory
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: str):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskStore:
+    """
+    SQLite-backed key/value store with size-based LRU eviction
+
+    Reads do not write: access times of hits are kept in memory and written
+    in batches, before eviction or every ACCESS_FLUSH_INTERVAL hits, so the
+    LRU order on disk is approximate.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 100 * 1024 * 1024):
+        """
+        Initialize the on-disk store
+
+        Args:
+            path: Path of the SQLite database file
+            max_bytes: Maximum total size of stored values
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._accessed: Dict[str, float] = {}  # Access times not yet written
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+            "size INTEGER NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._accessed[key] = time.time()
+            if len(self._accessed) >= ACCESS_FLUSH_INTERVAL:
+                self._flush_accessed()
+                self._conn.commit()
+            return row[0]
+
+    def put(self, key: str, value: bytes):
+        with self._lock:
+            self._flush_accessed()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, accessed) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, len(value), time.time()),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def size_bytes(self) -> int:
+        with self._lock:
+            return self._total_size()
+
+    def clear(self):
+        with self._lock:
+            self._accessed.clear()
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+
+    def _flush_accessed(self):
+        """Write the pending access times of recent hits"""
+        if not self._accessed:
+            return
+        self._conn.executemany(
+            "UPDATE entries SET accessed = ? WHERE key = ?",
+            [(accessed, key) for key, accessed in self._accessed.items()],
+        )
+        self._accessed.clear()
+
+    def _total_size(self) -> int:
+        row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return row[0]
+
+    def _evict(self):
+        """Drop least recently used entries until the store fits its budget"""
+        excess = self._total_size() - self.max_bytes
+        if excess <= 0:
+            return
+
+        rows = self._conn.execute("SELECT key, size FROM entries ORDER BY accessed")
+        stale_keys = []
+        for key, size in rows:
+            if excess <= 0:
+                break
+            stale_keys.append((key,))
+            excess -= size
+
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", stale_keys)
+
+
+class SummaryCache:
+    """Two-tier cache for document and chunk summaries"""
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        disk_path: Optional[str] = None,
+        max_disk_bytes: int = 100 * 1024 * 1024,
+    ):
+        """
+        Initialize the summary cache
+
+        Args:
+            max_entries: Maximum number of summaries kept in memory
+            disk_path: SQLite file for the persistent tier (None keeps it in memory only)
+            max_disk_bytes: Size budget of the persistent tier
+        """
+        self.memory = LRUCache(max_entries)
+        self.disk = DiskStore(disk_path, max_disk_bytes) if disk_path else None
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()  # Guards the counters
+
+    @staticmethod
+    def make_key(
+        text: str, model_name: str, min_length: int, max_length: int, kind: str = "doc"
+    ) -> str:
+        """
+        Build a content-addressed cache key
+
+        Args:
+            text: Text that was summarized
+            model_name: Model used for summarization
+            min_length: Minimum summary length setting
+            max_length: Maximum summary length setting
+            kind: Namespace of the entry ("doc" or "chunk")
+
+        Returns:
+            str: Hex digest identifying the summary
+        """
+        normalized = " ".join(text.split())
+        digest = hashlib.sha256()
+        for part in (kind, model_name, str(min_length), str(max_length), normalized):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a summary, promoting disk hits into memory
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            str: Cached summary or None on a miss
+        """
+        value = self.memory.get(key)
+        if value is None and self.disk is not None:
+            stored = self.disk.get(key)
+            if stored is not None:
+                value = stored.decode("utf-8")
+                self.memory.put(key, value)
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def put(self, key: str, value: str):
+        """
+        Store a summary in every tier
+
+        Args:
+            key: Key from make_key
+            value: Summary text
+        """
+        self.memory.put(key, value)
+        if self.disk is not None:
+            self.disk.put(key, value.encode("utf-8"))
+
+    def clear(self):
+        """Remove all entries and reset the counters"""
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters
+
+        Returns:
+            Dict[str, int]: Hits, misses and tier sizes
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "memory_entries": len(self.memory),
+            "disk_bytes": self.disk.size_bytes() if self.disk is not None else 0,
+        }
+
+
+class PageRecorder:
+    """Compresses pages for the extraction cache as they are extracted"""
+
+    def __init__(self, cache: "ExtractionCache", key: str):
+        self._cache = cache
+        self._key = key
+        self._compressor = zlib.compressobj(6)
+        self._parts: List[bytes] = []
+        self._size = 0
+        self.overflowed = False  # Too large to cache; pages are no longer kept
+
+    def add(self, page_text: Optional[str]):
+        """
+        Record the next page
+
+        Args:
+            page_text: Extracted text, or None if the page failed
+        """
+        if self.overflowed:
+            return
+        part = self._compressor.compress((json.dumps(page_text) + "\n").encode("utf-8"))
+        self._parts.append(part)
+        self._size += len(part)
+        if self._size > self._cache.disk.max_bytes:
+            self.overflowed = True
+            self._parts = []
+
+    def save(self):
+        """Store the recorded pages, unless they outgrew the cache"""
+        if self.overflowed:
+            return
+        # zlib buffers its output, so add() only sees part of the size; storing
+        # an entry over the budget would evict everything else
+        self._parts.append(self._compressor.flush())
+        blob = b"".join(self._parts)
+        self._parts = []
+        if len(blob) > self._cache.disk.max_bytes:
+            self.overflowed = True
+            return
+        self._cache.disk.put(self._key, blob)
+
+
+class ExtractionCache:
+    """On-disk cache of the page text extracted from PDF files"""
+
+    def __init__(self, disk_path: str, max_disk_bytes: int = 200 * 1024 * 1024):
+        """
+        Initialize the extraction cache
+
+        Entries hold each page's text as a line of JSON (null for pages that
+        failed to extract), compressed with zlib.
+
+        Args:
+            disk_path: SQLite file to store extractions in
+            max_disk_bytes: Size budget of the store
+        """
+        self.disk = DiskStore(disk_path, max_disk_bytes)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()  # Guards the counters
+
+    @staticmethod
+    def make_key(file_digest: str, extractor: str) -> str:
+        """
+        Build the key of a PDF file's extraction
+
+        Args:
+            file_digest: SHA-256 hex digest of the file bytes
+            extractor: Name of the extraction backend
+
+        Returns:
+            str: Cache key
+        """
+        return f"{extractor}:{file_digest}"
+
+    def get(self, key: str) -> Optional[List[Optional[str]]]:
+        """
+        Look up the pages of a PDF file
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Optional[List[Optional[str]]]: Text per page (None for failed
+            pages), or None on a miss
+        """
+        stored = self.disk.get(key)
+        with self._lock:
+            if stored is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if stored is None:
+            return None
+
+        lines = zlib.decompress(stored).decode("utf-8").splitlines()
+        return [json.loads(line) for line in lines]
+
+    def recorder(self, key: str) -> PageRecorder:
+        """
+        Start recording the pages of a PDF file as they are extracted
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            PageRecorder: Call add() per page and save() once all pages are in
+        """
+        return PageRecorder(self, key)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters
+
+        Returns:
+            Dict[str, int]: Hits, misses and stored bytes
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_bytes": self.disk.size_bytes(),
+        }
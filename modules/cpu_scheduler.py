@@ -0,0 +1,100 @@
+"""
+CPU Scheduling Module
+Shares a fixed core budget between a bounded number of concurrent model
+generations, queueing the rest.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from .metrics import Metrics
+
+
+def available_cores() -> int:
+    """Number of CPU cores this process may run on"""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+class CPUScheduler:
+    """Runs generations in a fixed number of slots, each with its share of the cores"""
+
+    def __init__(
+        self,
+        cores: Optional[int] = None,
+        slots: Optional[int] = None,
+        metrics: Optional[Metrics] = None,
+    ):
+        """
+        Initialize the scheduler
+
+        Args:
+            cores: Core budget for generation (defaults to the available cores)
+            slots: Generations that run at the same time; others wait in
+                arrival order (defaults to one slot per 4 cores)
+            metrics: Records how long generations wait for a slot
+        """
+        self.cores = max(1, cores or available_cores())
+        self.slots = max(1, min(slots or self.cores // 4, self.cores))
+        self.threads_per_slot = max(1, self.cores // self.slots)  # PyTorch intra-op threads
+        self.metrics = metrics or Metrics()
+        self._condition = threading.Condition()
+        self._waiting: "deque[object]" = deque()
+        self._busy = 0
+        self._configured = False
+
+    @property
+    def busy(self) -> int:
+        """Number of slots currently generating"""
+        return self._busy
+
+    @property
+    def queued(self) -> int:
+        """Number of generations waiting for a slot"""
+        return len(self._waiting)
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """
+        Hold a generation slot, waiting in line for one if all are busy
+
+        PyTorch uses threads_per_slot intra-op threads while the slot is held.
+        """
+        ticket = object()
+        waiting_since = time.perf_counter()
+        with self._condition:
+            self._waiting.append(ticket)
+            while self._busy >= self.slots or self._waiting[0] is not ticket:
+                self._condition.wait()
+            self._waiting.popleft()
+            self._busy += 1
+            self._condition.notify_all()  # The next in line may fit as well
+        self.metrics.observe("generation_queue_wait", time.perf_counter() - waiting_since)
+
+        try:
+            self._pin_threads()
+            yield
+        finally:
+            with self._condition:
+                self._busy -= 1
+                self._condition.notify_all()
+
+    def _pin_threads(self):
+        """Limit PyTorch to threads_per_slot intra-op threads"""
+        import torch
+
+        if not self._configured:
+            self._configured = True
+            try:
+                # Generation runs one operator at a time
+                torch.set_num_interop_threads(1)
+            except RuntimeError:
+                pass  # Inter-op threads were already started or configured
+
+        # New threads pick this up too, and every slot uses the same value
+        torch.set_num_threads(self.threads_per_slot)
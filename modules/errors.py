@@ -0,0 +1,24 @@
+"""
+Errors Module
+Exceptions raised by the core processing modules.
+"""
+
+
+class SummarizerError(Exception):
+    """Base class for errors reported to the user"""
+
+
+class InputError(SummarizerError):
+    """Input is missing, too short or otherwise unusable"""
+
+
+class PDFProcessingError(SummarizerError):
+    """PDF file could not be validated or its text could not be extracted"""
+
+
+class ModelLoadError(SummarizerError):
+    """Summarization model could not be loaded"""
+
+
+class SummarizationError(SummarizerError):
+    """Summary could not be generated"""
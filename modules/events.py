@@ -0,0 +1,95 @@
+"""
+Progress Events Module
+UI-agnostic reporting of messages and progress from the core modules.
+"""
+
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+_LOG_LEVELS = {
+    "info": logging.INFO,
+    "success": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+}
+
+
+@dataclass
+class ProgressEvent:
+    """Message or progress update emitted while processing"""
+
+    kind: str  # info, success, warning, error, progress, stage_start, stage_end
+    message: str = ""
+    fraction: Optional[float] = None  # Completed share of the current stage
+
+
+class ProgressReporter:
+    """
+    Receives events from the core modules
+
+    Events go to the callback if one is given, otherwise they are logged.
+    UI adapters subclass this and override emit() and stage().
+    """
+
+    def __init__(self, callback: Optional[Callable[[ProgressEvent], None]] = None):
+        """
+        Initialize the reporter
+
+        Args:
+            callback: Function called with every ProgressEvent
+        """
+        self.callback = callback
+
+    def emit(self, event: ProgressEvent):
+        """
+        Deliver an event
+
+        Args:
+            event: Event to deliver
+        """
+        if self.callback is not None:
+            self.callback(event)
+        elif event.kind in _LOG_LEVELS:
+            logger.log(_LOG_LEVELS[event.kind], event.message)
+        else:
+            logger.debug("%s %s %s", event.kind, event.message, event.fraction or "")
+
+    def info(self, message: str):
+        self.emit(ProgressEvent("info", message))
+
+    def success(self, message: str):
+        self.emit(ProgressEvent("success", message))
+
+    def warning(self, message: str):
+        self.emit(ProgressEvent("warning", message))
+
+    def error(self, message: str):
+        self.emit(ProgressEvent("error", message))
+
+    def progress(self, fraction: Optional[float] = None, message: str = ""):
+        """
+        Report progress of the current stage
+
+        Args:
+            fraction: Completed share between 0 and 1 (None if unknown)
+            message: Short status line
+        """
+        self.emit(ProgressEvent("progress", message, fraction))
+
+    @contextmanager
+    def stage(self, message: str) -> Iterator[None]:
+        """
+        Mark a long-running stage such as model loading
+
+        Args:
+            message: Description of the stage
+        """
+        self.emit(ProgressEvent("stage_start", message))
+        try:
+            yield
+        finally:
+            self.emit(ProgressEvent("stage_end", message))
@@ -0,0 +1,161 @@
+"""
+Extractive Selection Module
+Ranks sentences with TF-IDF similarity and TextRank to shrink very long texts before summarization.
+"""
+
+import re
+from collections import Counter
+from typing import List
+
+import numpy as np
+
+from .text_normalizer import SENTENCE_BREAK
+
+# Words of three or more letters; shorter tokens carry little topical signal
+_WORD = re.compile(r"[^\W\d_]{3,}")
+
+STOP_WORDS = frozenset(
+    """
+    about above after again against all also and any are because been before
+    being below between both but can could did does doing down during each few
+    for from further had has have having her here hers herself him himself his
+    how into its itself just more most not now off once only other our ours
+    out over own same she should some such than that the their theirs them
+    then there these they this those through too under until very was were
+    what when where which while who whom why will with would you your yours
+    """.split()
+)
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Split text into sentences
+
+    Args:
+        text: Input text
+
+    Returns:
+        List[str]: Non-empty sentences in document order
+    """
+    return [sentence.strip() for sentence in SENTENCE_BREAK.split(text) if sentence.strip()]
+
+
+def _tfidf_matrix(sentences: List[str], max_features: int) -> np.ndarray:
+    """
+    Build L2-normalized TF-IDF vectors for sentences
+
+    Args:
+        sentences: Sentences to vectorize
+        max_features: Number of most widespread terms to keep
+
+    Returns:
+        np.ndarray: Matrix of shape (len(sentences), vocabulary size)
+    """
+    tokens = [
+        [word for word in _WORD.findall(sentence.lower()) if word not in STOP_WORDS]
+        for sentence in sentences
+    ]
+    doc_freq = Counter(word for words in tokens for word in set(words))
+    vocabulary = {
+        word: i for i, (word, _) in enumerate(doc_freq.most_common(max_features))
+    }
+
+    rows, cols = [], []
+    for row, words in enumerate(tokens):
+        for word in words:
+            col = vocabulary.get(word)
+            if col is not None:
+                rows.append(row)
+                cols.append(col)
+
+    tf = np.zeros((len(sentences), len(vocabulary)), dtype=np.float32)
+    np.add.at(tf, (np.array(rows, dtype=np.intp), np.array(cols, dtype=np.intp)), 1.0)
+
+    df = np.array([doc_freq[word] for word in vocabulary], dtype=np.float32)
+    tfidf = tf * (np.log((1 + len(sentences)) / (1 + df)) + 1)
+    norms = np.linalg.norm(tfidf, axis=1, keepdims=True)
+    return tfidf / np.maximum(norms, 1e-12)
+
+
+def _textrank(vectors: np.ndarray, damping: float = 0.85, iterations: int = 50) -> np.ndarray:
+    """
+    Run PageRank over the cosine similarity graph of sentence vectors
+
+    Args:
+        vectors: L2-normalized sentence vectors
+        damping: PageRank damping factor
+        iterations: Maximum power iterations
+
+    Returns:
+        np.ndarray: Sentence scores with mean 1
+    """
+    n = vectors.shape[0]
+    similarity = vectors @ vectors.T
+    np.fill_diagonal(similarity, 0.0)
+
+    # Sentences with no similar neighbours link to every sentence equally
+    row_sums = similarity.sum(axis=1, keepdims=True)
+    transition = np.where(row_sums > 0, similarity / np.maximum(row_sums, 1e-12), 1.0 / n)
+
+    scores = np.full(n, 1.0 / n, dtype=np.float32)
+    for _ in range(iterations):
+        updated = (1 - damping) / n + damping * (transition.T @ scores)
+        if np.abs(updated - scores).sum() < 1e-6:
+            scores = updated
+            break
+        scores = updated
+
+    return scores * n
+
+
+def score_sentences(
+    sentences: List[str], block_size: int = 1024, max_features: int = 4096
+) -> np.ndarray:
+    """
+    Score sentences by how central they are to the text
+
+    Sentences are ranked in blocks of block_size so memory stays bounded for
+    very long documents; scores are normalized to mean 1 within each block.
+
+    Args:
+        sentences: Sentences in document order
+        block_size: Sentences ranked together
+        max_features: Vocabulary size per block
+
+    Returns:
+        np.ndarray: Score per sentence
+    """
+    scores = np.ones(len(sentences), dtype=np.float32)
+    for start in range(0, len(sentences), block_size):
+        block = sentences[start : start + block_size]
+        if len(block) > 1:
+            scores[start : start + len(block)] = _textrank(
+                _tfidf_matrix(block, max_features)
+            )
+    return scores
+
+
+def select_sentences(text: str, ratio: float) -> str:
+    """
+    Keep the highest-scoring sentences covering a fraction of the words
+
+    Args:
+        text: Input text
+        ratio: Fraction of the words to keep (0-1)
+
+    Returns:
+        str: Selected sentences in their original order
+    """
+    sentences = split_sentences(text)
+    if len(sentences) < 3 or ratio >= 1:
+        return text
+
+    word_counts = np.array([len(sentence.split()) for sentence in sentences])
+    budget = ratio * word_counts.sum()
+
+    # Highest scores first; stable so ties keep document order
+    ranked = np.argsort(-score_sentences(sentences), kind="stable")
+    kept_words = np.cumsum(word_counts[ranked])
+    keep = ranked[: max(1, int(np.searchsorted(kept_words, budget)) + 1)]
+
+    return " ".join(sentences[i] for i in sorted(keep))
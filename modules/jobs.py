@@ -0,0 +1,211 @@
+"""
+Background Jobs Module
+Runs summarization jobs on a thread pool so front ends can poll them instead
+of blocking on them.
+"""
+
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from .events import ProgressEvent, ProgressReporter
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+
+@dataclass
+class Job:
+    """Summarization job and everything it has reported so far"""
+
+    id: str
+    name: str
+    status: str = QUEUED
+    progress: Optional[float] = None  # Completed share of the current stage
+    stage: str = ""  # Description of the running stage
+    messages: List[ProgressEvent] = field(default_factory=list)  # info/warning/error events
+    partial_text: str = ""  # Text streamed so far
+    result: Any = None
+    error: Optional[str] = None
+    submitted: float = field(default_factory=time.time)
+    started: Optional[float] = None
+    finished: Optional[float] = None
+
+    @property
+    def active(self) -> bool:
+        """Whether the job is queued or running"""
+        return self.status in (QUEUED, RUNNING)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds the job has been running (or ran for)"""
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.time()) - self.started
+
+
+class JobReporter(ProgressReporter):
+    """Records the events of one job on the job"""
+
+    def __init__(self, job: Job):
+        super().__init__()
+        self.job = job
+        self._lock = threading.Lock()
+
+    def emit(self, event: ProgressEvent):
+        if event.kind == "progress":
+            if event.fraction is not None:
+                self.job.progress = min(max(event.fraction, 0.0), 1.0)
+            if event.message:
+                self.job.stage = event.message
+        elif event.kind == "stage_start":
+            self.job.stage = event.message
+            self.job.progress = None
+        elif event.kind == "stage_end":
+            self.job.progress = None
+        else:
+            with self._lock:
+                self.job.messages = self.job.messages + [event]
+
+    def add_text(self, piece: str):
+        """
+        Append streamed output to the job
+
+        Args:
+            piece: Text piece
+        """
+        self.job.partial_text += piece
+
+
+class JobExecutor:
+    """Thread pool that runs jobs and keeps their state for polling"""
+
+    def __init__(self, max_workers: int = 2, max_finished: int = 100):
+        """
+        Initialize the executor
+
+        Args:
+            max_workers: Jobs that run at the same time; others wait in a queue
+            max_finished: Finished jobs kept for polling (oldest are forgotten first)
+        """
+        self.max_finished = max_finished
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="summary-job"
+        )
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._futures: Dict[str, Future] = {}
+        self._on_cancel: Dict[str, Callable[[], None]] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        name: str,
+        func: Callable[[JobReporter], Any],
+        on_cancel: Optional[Callable[[], None]] = None,
+    ) -> str:
+        """
+        Queue a job
+
+        Args:
+            name: Description shown to the user
+            func: Called with the job's reporter; its return value becomes the
+                job result, and an exception fails the job
+            on_cancel: Called if the job is cancelled before it starts, to
+                release what func would have cleaned up
+
+        Returns:
+            str: Job ID
+        """
+        with self._lock:
+            job = Job(id=f"job-{next(self._ids)}", name=name)
+            self._jobs[job.id] = job
+            self._forget_finished()
+            self._futures[job.id] = self._executor.submit(
+                self._run, job, JobReporter(job), func
+            )
+            if on_cancel is not None:
+                self._on_cancel[job.id] = on_cancel
+        return job.id
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """
+        Look up a job
+
+        Args:
+            job_id: ID returned by submit
+
+        Returns:
+            Optional[Job]: The job, or None if it is unknown or was forgotten
+        """
+        return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a job that has not started yet
+
+        Args:
+            job_id: ID returned by submit
+
+        Returns:
+            bool: True if the job was cancelled
+        """
+        with self._lock:
+            future = self._futures.get(job_id)
+            if future is None or not future.cancel():
+                return False
+            job = self._jobs[job_id]
+            job.status = CANCELLED
+            job.finished = time.time()
+            del self._futures[job_id]
+            on_cancel = self._on_cancel.pop(job_id, None)
+
+        if on_cancel is not None:
+            on_cancel()
+        return True
+
+    def active_count(self) -> int:
+        """Number of queued and running jobs"""
+        return sum(1 for job in list(self._jobs.values()) if job.active)
+
+    def shutdown(self, wait: bool = False):
+        """
+        Stop accepting jobs and cancel queued ones
+
+        Args:
+            wait: Wait for running jobs to finish
+        """
+        for job_id in list(self._futures):
+            self.cancel(job_id)
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, job: Job, reporter: JobReporter, func: Callable[[JobReporter], Any]):
+        """Run a job on a worker thread, recording its outcome"""
+        job.status = RUNNING
+        job.started = time.time()
+        status = FAILED
+        try:
+            job.result = func(reporter)
+            status = DONE
+        except Exception as e:
+            job.error = str(e)
+        finally:
+            job.finished = time.time()
+            job.status = status
+            with self._lock:
+                self._futures.pop(job.id, None)
+                self._on_cancel.pop(job.id, None)
+
+    def _forget_finished(self):
+        """Drop the oldest finished jobs beyond max_finished (caller holds the lock)"""
+        finished = [job_id for job_id, job in self._jobs.items() if not job.active]
+        for job_id in finished[: max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
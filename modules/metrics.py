@@ -0,0 +1,256 @@
+"""
+Metrics Module
+Timing spans and counters for the processing pipeline, with Prometheus text
+exposition and optional per-request JSON traces.
+"""
+
+import contextvars
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+# Spans and counts recorded for the request(s) running in the current context
+_current_trace: "contextvars.ContextVar[Optional[Union[Trace, _TraceGroup]]]" = contextvars.ContextVar(
+    "summarizer_trace", default=None
+)
+
+_NULL_SPAN = nullcontext()
+
+
+class Trace:
+    """Spans and counters recorded for one request"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.spans: List[Dict] = []
+        self.counters: Dict[str, float] = {}
+
+    def to_dict(self) -> Dict:
+        """
+        Get the trace as JSON-serializable data
+
+        Returns:
+            Dict: "spans" (name, start and duration in seconds, thread) and "counters"
+        """
+        return {"spans": list(self.spans), "counters": dict(self.counters)}
+
+    def add_span(self, name: str, start: float, duration: float):
+        """
+        Record a span
+
+        Args:
+            name: Stage name
+            start: perf_counter() value at the start of the span
+            duration: Duration in seconds
+        """
+        self.spans.append(
+            {
+                "name": name,
+                "start": round(start - self.started, 6),
+                "duration": round(duration, 6),
+                "thread": threading.current_thread().name,
+            }
+        )
+
+    def add_count(self, name: str, value: float):
+        """
+        Increase a counter
+
+        Args:
+            name: Counter name
+            value: Amount to add
+        """
+        self.counters[name] = self.counters.get(name, 0) + value
+
+
+class _TraceGroup:
+    """Records into several traces at once, for work shared by several requests"""
+
+    def __init__(self, traces: List[Trace]):
+        self.traces = traces
+
+    def add_span(self, name: str, start: float, duration: float):
+        for trace in self.traces:
+            trace.add_span(name, start, duration)
+
+    def add_count(self, name: str, value: float):
+        for trace in self.traces:
+            trace.add_count(name, value)
+
+
+class Metrics:
+    """Collects stage timings and counters; nearly free when disabled"""
+
+    def __init__(self, enabled: bool = False, namespace: str = "summarizer"):
+        """
+        Initialize the metrics collector
+
+        Args:
+            enabled: Record process-wide metrics (traces are recorded either way)
+            namespace: Prefix of exported metric names
+        """
+        self.enabled = enabled
+        self.namespace = namespace
+        self._timings: Dict[str, List[float]] = {}  # stage -> [count, total, max]
+        self._counters: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def span(self, name: str):
+        """
+        Time a block of code as a pipeline stage
+
+        Args:
+            name: Stage name
+
+        Returns:
+            Context manager timing the block
+        """
+        if not self.enabled and _current_trace.get() is None:
+            return _NULL_SPAN
+        return self._span(name)
+
+    @contextmanager
+    def _span(self, name: str) -> Iterator[None]:
+        trace = _current_trace.get()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            if self.enabled:
+                self._record_timing(name, duration)
+            if trace is not None:
+                trace.add_span(name, start, duration)
+
+    def observe(self, name: str, seconds: float):
+        """
+        Record a duration measured elsewhere as a stage timing
+
+        Args:
+            name: Stage name
+            seconds: Duration in seconds
+        """
+        if self.enabled:
+            self._record_timing(name, seconds)
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.add_span(name, time.perf_counter() - seconds, seconds)
+
+    def count(self, name: str, value: float = 1):
+        """
+        Increase a counter
+
+        Args:
+            name: Counter name
+            value: Amount to add
+        """
+        if self.enabled:
+            with self._lock:
+                self._counters[name] = self._counters.get(name, 0) + value
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.add_count(name, value)
+
+    @contextmanager
+    def trace(self) -> Iterator[Trace]:
+        """
+        Record the spans and counts of the enclosed block into a Trace
+
+        Only code running in the same thread (or a copied context) is traced.
+
+        Yields:
+            Trace: Trace that fills in while the block runs
+        """
+        trace = Trace()
+        token = _current_trace.set(trace)
+        try:
+            yield trace
+        finally:
+            _current_trace.reset(token)
+
+    def current_trace(self) -> Optional[Trace]:
+        """
+        Get the trace of the request running in the current context
+
+        Returns:
+            Optional[Trace]: Trace being recorded, or None
+        """
+        trace = _current_trace.get()
+        return trace if isinstance(trace, Trace) else None
+
+    @contextmanager
+    def record_into(self, traces: Iterable[Optional[Trace]]) -> Iterator[None]:
+        """
+        Record the spans and counts of the enclosed block into several traces
+
+        Used for work done on behalf of several requests at once, such as a
+        model batch holding chunks from concurrent requests; every trace gets
+        the block's full spans and counts.
+
+        Args:
+            traces: Traces to record into (None entries and duplicates are skipped)
+        """
+        unique = list({id(t): t for t in traces if t is not None}.values())
+        group = _TraceGroup(unique) if unique else None
+        token = _current_trace.set(group)
+        try:
+            yield
+        finally:
+            _current_trace.reset(token)
+
+    def snapshot(self) -> Dict:
+        """
+        Get the current metric values
+
+        Returns:
+            Dict: "stages" (count, total and max seconds per stage) and "counters"
+        """
+        with self._lock:
+            return {
+                "stages": {
+                    name: {"count": int(count), "seconds": total, "max_seconds": peak}
+                    for name, (count, total, peak) in self._timings.items()
+                },
+                "counters": dict(self._counters),
+            }
+
+    def prometheus_text(self) -> str:
+        """
+        Render the metrics in the Prometheus text exposition format
+
+        Returns:
+            str: Exposition text
+        """
+        snapshot = self.snapshot()
+        prefix = self.namespace
+        lines = [
+            f"# HELP {prefix}_stage_seconds Time spent in each pipeline stage",
+            f"# TYPE {prefix}_stage_seconds summary",
+        ]
+        for name, stage in sorted(snapshot["stages"].items()):
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{name}"}} {stage["count"]}')
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{name}"}} {stage["seconds"]:.6f}')
+        lines.append(f"# HELP {prefix}_stage_max_seconds Longest run of each pipeline stage")
+        lines.append(f"# TYPE {prefix}_stage_max_seconds gauge")
+        for name, stage in sorted(snapshot["stages"].items()):
+            lines.append(f'{prefix}_stage_max_seconds{{stage="{name}"}} {stage["max_seconds"]:.6f}')
+
+        for name, value in sorted(snapshot["counters"].items()):
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {value:g}")
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        """Clear all recorded metrics"""
+        with self._lock:
+            self._timings.clear()
+            self._counters.clear()
+
+    def _record_timing(self, name: str, seconds: float):
+        with self._lock:
+            timing = self._timings.setdefault(name, [0, 0.0, 0.0])
+            timing[0] += 1
+            timing[1] += seconds
+            timing[2] = max(timing[2], seconds)
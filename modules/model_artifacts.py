@@ -0,0 +1,97 @@
+"""
+Model Artifacts Module
+Materializes models into a local artifact directory ahead of time, so they load
+from safetensors on local disk instead of the Hugging Face Hub cache.
+"""
+
+import os
+import shutil
+from pathlib import Path
+from typing import Optional
+
+from .errors import ModelLoadError
+from .events import ProgressReporter
+
+
+def artifact_path(artifact_dir: str, model_name: str) -> Path:
+    """
+    Get the directory a model's artifact is stored in
+
+    Args:
+        artifact_dir: Root directory of the artifacts
+        model_name: Name of the pre-trained model
+
+    Returns:
+        Path: Artifact directory of the model
+    """
+    return Path(artifact_dir) / model_name.strip("/").replace("/", "--")
+
+
+def find_artifact(artifact_dir: Optional[str], model_name: str) -> Optional[Path]:
+    """
+    Find a complete artifact of a model
+
+    Args:
+        artifact_dir: Root directory of the artifacts (None disables artifacts)
+        model_name: Name of the pre-trained model
+
+    Returns:
+        Optional[Path]: Artifact directory, or None if the model has no artifact
+    """
+    if not artifact_dir:
+        return None
+    path = artifact_path(artifact_dir, model_name)
+    if (path / "config.json").exists() and any(path.glob("*.safetensors")):
+        return path
+    return None
+
+
+def materialize(
+    model_name: str,
+    artifact_dir: str,
+    reporter: Optional[ProgressReporter] = None,
+) -> Path:
+    """
+    Save a model and its tokenizer as a local artifact, downloading it if needed
+
+    Weights are written as safetensors, which load memory-mapped instead of
+    being deserialized. Existing artifacts are kept.
+
+    Args:
+        model_name: Name of the pre-trained model
+        artifact_dir: Root directory of the artifacts
+        reporter: Receives progress messages (defaults to logging)
+
+    Returns:
+        Path: Artifact directory of the model
+
+    Raises:
+        ModelLoadError: If the model cannot be downloaded or saved
+    """
+    reporter = reporter or ProgressReporter()
+    path = find_artifact(artifact_dir, model_name)
+    if path is not None:
+        reporter.info(f"Artifact for {model_name} already exists: {path}")
+        return path
+
+    from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+
+    path = artifact_path(artifact_dir, model_name)
+    staging_dir = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        reporter.info(f"Materializing {model_name} into {path}...")
+        model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
+        model.save_pretrained(staging_dir, safe_serialization=True)
+        AutoTokenizer.from_pretrained(model_name).save_pretrained(staging_dir)
+    except Exception as e:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise ModelLoadError(f"Failed to materialize {model_name}: {str(e)}") from e
+
+    # Publish the artifact only once it is complete
+    try:
+        staging_dir.rename(path)
+    except OSError:
+        shutil.rmtree(staging_dir, ignore_errors=True)  # Another process won
+
+    reporter.success(f"Model artifact ready: {model_name}")
+    return path
@@ -0,0 +1,449 @@
+"""
+Model Registry Module
+Loads summarization models lazily and keeps a bounded set of them resident.
+"""
+
+import gc
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .errors import ModelLoadError
+from .events import ProgressReporter
+from .model_artifacts import find_artifact
+
+# "torch": PyTorch eager; "int8": PyTorch with dynamically quantized Linear
+# layers (CPU only); "onnx": ONNX Runtime export (requires optimum[onnxruntime])
+BACKENDS = ("torch", "int8", "onnx")
+
+# Input for the warm-up generation that runs before a model serves requests
+WARM_UP_TEXT = (
+    "The committee met on Tuesday to review the budget for the coming year. "
+    "Members agreed to fund the new library wing and to postpone the road repairs."
+)
+
+
+class ModelRegistry:
+    """Keeps up to max_models summarization pipelines in memory, evicting the least recently used"""
+
+    def __init__(
+        self,
+        max_models: int = 2,
+        memory_budget_mb: Optional[int] = None,
+        reporter: Optional[ProgressReporter] = None,
+        onnx_cache_dir: Optional[str] = None,
+        artifact_dir: Optional[str] = None,
+    ):
+        """
+        Initialize the registry
+
+        Args:
+            max_models: Maximum number of resident models
+            memory_budget_mb: Maximum total size of resident model weights (None for no limit)
+            reporter: Receives messages about loading and eviction (defaults to logging)
+            onnx_cache_dir: Directory for ONNX exports (defaults to ~/.cache/ai-notes-summarizer/onnx)
+            artifact_dir: Directory of models materialized ahead of time (see
+                model_artifacts); models found there load from local disk only
+        """
+        self.max_models = max(1, max_models)
+        self.memory_budget_mb = memory_budget_mb
+        self.reporter = reporter or ProgressReporter()
+        self.onnx_cache_dir = Path(
+            onnx_cache_dir
+            or Path.home() / ".cache" / "ai-notes-summarizer" / "onnx"
+        )
+        self.artifact_dir = artifact_dir
+        self._models: "OrderedDict[Tuple[str, str], object]" = OrderedDict()
+        self._sizes: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+        self._load_locks: Dict[Tuple[str, str], threading.Lock] = {}
+
+    def get(
+        self,
+        model_name: str,
+        backend: str = "torch",
+        reporter: Optional[ProgressReporter] = None,
+    ):
+        """
+        Get a loaded summarization pipeline, loading it if needed
+
+        The pipeline's own tokenizer is available as pipeline.tokenizer.
+
+        Args:
+            model_name: Name of the pre-trained model
+            backend: Inference backend (one of BACKENDS)
+            reporter: Receives loading messages for this call
+
+        Returns:
+            Pipeline: Summarization pipeline
+
+        Raises:
+            ModelLoadError: If the model cannot be loaded
+        """
+        if backend not in BACKENDS:
+            raise ModelLoadError(
+                f"Unknown inference backend '{backend}'. Choose one of: {', '.join(BACKENDS)}"
+            )
+
+        key = (model_name, backend)
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+                return self._models[key]
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        # Only one thread loads a given model; others wait for it
+        with load_lock:
+            with self._lock:
+                if key in self._models:
+                    self._models.move_to_end(key)
+                    return self._models[key]
+
+            loaders = {
+                "torch": self._load,
+                "int8": self._load_quantized,
+                "onnx": self._load_onnx,
+            }
+            summarizer = loaders[backend](model_name, reporter or self.reporter)
+
+            with self._lock:
+                self._models[key] = summarizer
+                self._sizes[key] = self._model_size(summarizer)
+                self._evict(keep=key)
+            return summarizer
+
+    def preload(
+        self, model_names: Iterable[str], backend: str = "torch", warm_up: bool = False
+    ):
+        """
+        Load models ahead of their first use
+
+        Args:
+            model_names: Models to load, most important last
+            backend: Inference backend to load them with
+            warm_up: Also run a short generation with each model
+        """
+        for model_name in model_names:
+            if self.is_loaded(model_name, backend):
+                continue  # Already loaded, e.g. by a server entry point
+            try:
+                self.get(model_name, backend)
+                if warm_up:
+                    self.warm_up(model_name, backend)
+            except ModelLoadError as e:
+                self.reporter.warning(f"Could not preload {model_name}: {str(e)}")
+
+    def warm_up(self, model_name: str, backend: str = "torch") -> float:
+        """
+        Run a short generation so the first request does not pay for it
+
+        The first generate() call allocates buffers and picks kernels, which
+        takes longer than later calls.
+
+        Args:
+            model_name: Name of the pre-trained model (loaded if needed)
+            backend: Inference backend
+
+        Returns:
+            float: Seconds the warm-up generation took
+
+        Raises:
+            ModelLoadError: If the model cannot be loaded or fails to generate
+        """
+        summarizer = self.get(model_name, backend)
+        start = time.perf_counter()
+        try:
+            summarizer(WARM_UP_TEXT, min_length=1, max_new_tokens=16, do_sample=False)
+        except Exception as e:
+            raise ModelLoadError(f"Warm-up generation failed: {str(e)}") from e
+        return time.perf_counter() - start
+
+    def is_loaded(self, model_name: str, backend: str = "torch") -> bool:
+        """Check whether a model is resident with the given backend"""
+        with self._lock:
+            return (model_name, backend) in self._models
+
+    def resident_models(self) -> List[str]:
+        """
+        Get the resident models
+
+        Returns:
+            List[str]: Model names (with non-default backends in parentheses)
+                from least to most recently used
+        """
+        with self._lock:
+            return [
+                name if backend == "torch" else f"{name} ({backend})"
+                for name, backend in self._models
+            ]
+
+    def memory_mb(self) -> float:
+        """Get the total size of resident model weights in MB"""
+        with self._lock:
+            return sum(self._sizes.values()) / (1024 * 1024)
+
+    def _evict(self, keep: Tuple[str, str]):
+        """
+        Drop least recently used models until the limits are met
+
+        Args:
+            keep: Model that must stay resident (the one just loaded)
+        """
+        budget = (
+            self.memory_budget_mb * 1024 * 1024 if self.memory_budget_mb else None
+        )
+        evicted = False
+
+        for key in list(self._models):
+            over_count = len(self._models) > self.max_models
+            over_budget = budget is not None and sum(self._sizes.values()) > budget
+            if not (over_count or over_budget):
+                break
+            if key == keep:
+                continue
+
+            del self._models[key]
+            del self._sizes[key]
+            self.reporter.info(f"Unloaded model {key[0]} to free memory")
+            evicted = True
+
+        if evicted:
+            gc.collect()
+            import torch
+
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+
+    def _load(self, model_name: str, reporter: ProgressReporter):
+        """
+        Load a PyTorch summarization pipeline, falling back to CPU on GPU errors
+
+        Args:
+            model_name: Name of the pre-trained model
+            reporter: Receives loading messages
+
+        Returns:
+            Pipeline: Summarization pipeline
+
+        Raises:
+            ModelLoadError: If the model cannot be loaded
+        """
+        # Imported here so the registry stays cheap to import in worker processes
+        import torch
+        from transformers import pipeline
+
+        try:
+            # Check if CUDA is available
+            device = 0 if torch.cuda.is_available() else -1
+
+            # Show device info
+            if torch.cuda.is_available():
+                reporter.info(f"🚀 Using GPU acceleration: {torch.cuda.get_device_name()}")
+            else:
+                reporter.info("💻 Using CPU for processing (this may be slower)")
+
+            # The pipeline's tokenizer is shared with chunking, so it is loaded once
+            summarizer = pipeline(
+                "summarization",
+                device=device,
+                torch_dtype=(
+                    torch.float16 if torch.cuda.is_available() else torch.float32
+                ),
+                **self._model_source(model_name, reporter),
+            )
+
+            reporter.success(f"Model loaded successfully: {model_name}")
+            return summarizer
+
+        except OSError as e:
+            if "Connection error" in str(e) or "timeout" in str(e).lower():
+                raise ModelLoadError(
+                    "Network error: Could not download the model. Please check your internet connection."
+                ) from e
+            raise ModelLoadError(f"Model loading error: {str(e)}") from e
+        except RuntimeError as e:
+            if "CUDA" not in str(e):
+                raise ModelLoadError(f"Runtime error loading model: {str(e)}") from e
+
+            reporter.warning("GPU memory error. Trying to use CPU instead...")
+            try:
+                summarizer = pipeline(
+                    "summarization",
+                    device=-1,  # Force CPU
+                    torch_dtype=torch.float32,
+                    **self._model_source(model_name, reporter),
+                )
+                reporter.success("Model loaded successfully on CPU")
+                return summarizer
+            except Exception as cpu_e:
+                raise ModelLoadError(
+                    f"Failed to load model on CPU: {str(cpu_e)}"
+                ) from cpu_e
+        except Exception as e:
+            raise ModelLoadError(f"Unexpected error loading model: {str(e)}") from e
+
+    def _load_quantized(self, model_name: str, reporter: ProgressReporter):
+        """
+        Load a CPU pipeline with dynamically quantized int8 Linear layers
+
+        Args:
+            model_name: Name of the pre-trained model
+            reporter: Receives loading messages
+
+        Returns:
+            Pipeline: Summarization pipeline
+
+        Raises:
+            ModelLoadError: If the model cannot be loaded
+        """
+        import torch
+        from transformers import pipeline
+
+        try:
+            from torch.ao.quantization import quantize_dynamic
+
+            summarizer = pipeline(
+                "summarization",
+                device=-1,  # Quantized kernels run on CPU only
+                torch_dtype=torch.float32,
+                **self._model_source(model_name, reporter),
+            )
+            # Weights are quantized ahead of time, activations on the fly
+            quantize_dynamic(
+                summarizer.model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+            )
+        except OSError as e:
+            raise ModelLoadError(f"Model loading error: {str(e)}") from e
+        except Exception as e:
+            raise ModelLoadError(f"Failed to quantize model: {str(e)}") from e
+
+        reporter.success(f"Model loaded successfully: {model_name} (int8)")
+        return summarizer
+
+    def _load_onnx(self, model_name: str, reporter: ProgressReporter):
+        """
+        Load an ONNX Runtime pipeline, exporting the model on first use
+
+        The export is saved under onnx_cache_dir and reused by later loads.
+
+        Args:
+            model_name: Name of the pre-trained model
+            reporter: Receives loading messages
+
+        Returns:
+            Pipeline: Summarization pipeline
+
+        Raises:
+            ModelLoadError: If the model cannot be exported or loaded
+        """
+        try:
+            from optimum.onnxruntime import ORTModelForSeq2SeqLM
+        except ImportError as e:
+            raise ModelLoadError(
+                "The onnx backend requires optimum with ONNX Runtime: "
+                "pip install 'optimum[onnxruntime]'"
+            ) from e
+        from transformers import AutoTokenizer, pipeline
+
+        export_dir = self.onnx_cache_dir / model_name.strip("/").replace("/", "--")
+        try:
+            if not (export_dir / "config.json").exists():
+                reporter.info(f"Exporting {model_name} to ONNX (first use only)...")
+                staging_dir = export_dir.with_name(f"{export_dir.name}.{os.getpid()}.tmp")
+                source = find_artifact(self.artifact_dir, model_name) or model_name
+                model = ORTModelForSeq2SeqLM.from_pretrained(source, export=True)
+                model.save_pretrained(staging_dir)
+                AutoTokenizer.from_pretrained(source).save_pretrained(staging_dir)
+                # Publish the export only once it is complete
+                try:
+                    staging_dir.rename(export_dir)
+                except OSError:
+                    shutil.rmtree(staging_dir, ignore_errors=True)  # Another process won
+
+            model = ORTModelForSeq2SeqLM.from_pretrained(export_dir)
+            tokenizer = AutoTokenizer.from_pretrained(export_dir)
+            summarizer = pipeline("summarization", model=model, tokenizer=tokenizer)
+        except Exception as e:
+            raise ModelLoadError(f"Failed to load ONNX model: {str(e)}") from e
+
+        reporter.success(f"Model loaded successfully: {model_name} (ONNX Runtime)")
+        return summarizer
+
+    def _model_source(self, model_name: str, reporter: ProgressReporter) -> dict:
+        """
+        Get the pipeline() arguments that select where a model is loaded from
+
+        Args:
+            model_name: Name of the pre-trained model
+            reporter: Receives loading messages
+
+        Returns:
+            dict: model and model_kwargs arguments for pipeline()
+        """
+        path = find_artifact(self.artifact_dir, model_name)
+        if path is None:
+            return {"model": model_name}
+
+        reporter.info(f"Loading {model_name} from {path}")
+        return {
+            "model": str(path),
+            # Never reach for the Hub, and map the safetensors weights instead
+            # of building the model twice in memory
+            "model_kwargs": {"local_files_only": True, "low_cpu_mem_usage": True},
+        }
+
+    @staticmethod
+    def _model_size(summarizer) -> int:
+        """
+        Estimate the memory held by a pipeline's weights
+
+        Args:
+            summarizer: Summarization pipeline
+
+        Returns:
+            int: Size in bytes
+        """
+        model = summarizer.model
+        if not hasattr(model, "modules"):
+            # ONNX Runtime holds the weights outside Python; use the export size
+            save_dir = getattr(model, "model_save_dir", None)
+            if save_dir is None:
+                return 0
+            return sum(path.stat().st_size for path in Path(save_dir).glob("*.onnx*"))
+
+        # parameters() skips tied duplicates but not quantized Linear weights,
+        # which are packed outside the parameter list
+        tensors = list(model.parameters()) + list(model.buffers())
+        for module in model.modules():
+            weight = getattr(module, "weight", None)
+            if callable(weight):
+                tensors.append(weight())
+        return sum(tensor.numel() * tensor.element_size() for tensor in tensors)
+
+
+_shared_registry: Optional[ModelRegistry] = None
+_shared_registry_lock = threading.Lock()
+
+
+def shared_registry(**settings) -> ModelRegistry:
+    """
+    Get the registry shared by everything in this process
+
+    A server entry point can load and warm models into it before the web app
+    starts, so the app's first session finds them resident.
+
+    Args:
+        **settings: ModelRegistry arguments (only the first call creates it)
+
+    Returns:
+        ModelRegistry: Process-wide registry
+    """
+    global _shared_registry
+    with _shared_registry_lock:
+        if _shared_registry is None:
+            _shared_registry = ModelRegistry(**settings)
+        return _shared_registry
@@ -0,0 +1,260 @@
+"""
+PDF Backends Module
+Text extraction libraries PDFProcessor can run on, behind one interface.
+"""
+
+import importlib.util
+import io
+import mmap
+import os
+import threading
+from typing import Any, Dict, List, Optional, Union
+
+from .errors import PDFProcessingError
+
+# "pypdf2": pure Python, always installed; "pypdfium2": PDFium bindings
+# (pip install pypdfium2); "pymupdf": MuPDF bindings (pip install PyMuPDF, AGPL)
+PDF_BACKENDS = ("pypdf2", "pypdfium2", "pymupdf")
+
+# Order "auto" tries installed backends in: PDFium and MuPDF are several times
+# faster than PyPDF2 on real documents, and PDFium's license is permissive
+AUTO_ORDER = ("pypdfium2", "pymupdf", "pypdf2")
+
+# Module each backend imports
+_MODULES = {"pypdf2": "PyPDF2", "pypdfium2": "pypdfium2", "pymupdf": "pymupdf"}
+
+ENCRYPTED_MESSAGE = "Cannot process encrypted PDF files. Please upload an unencrypted PDF."
+
+
+def map_file(f) -> mmap.mmap:
+    """Memory-map an open file read-only"""
+    if os.fstat(f.fileno()).st_size == 0:
+        raise PDFProcessingError("PDF file appears to be empty or corrupted.")
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class PDFBackend:
+    """
+    Opens PDF documents and extracts the text of their pages
+
+    Every backend returns page text with "\\n" line breaks, None for pages
+    whose text cannot be extracted, and raises PDFProcessingError for
+    corrupted or encrypted documents.
+    """
+
+    name = ""
+
+    def open(self, source: Union[bytes, str]) -> Any:
+        """
+        Open a PDF document
+
+        Args:
+            source: PDF bytes or path to a PDF file
+
+        Returns:
+            Any: Backend-specific document handle
+
+        Raises:
+            PDFProcessingError: If the PDF is corrupted or encrypted
+        """
+        raise NotImplementedError
+
+    def page_count(self, document: Any) -> int:
+        """Number of pages in an open document"""
+        raise NotImplementedError
+
+    def extract_page(self, document: Any, index: int) -> Optional[str]:
+        """
+        Extract the text of one page
+
+        Args:
+            document: Handle returned by open
+            index: 0-based page index
+
+        Returns:
+            Optional[str]: Page text, or None if extraction fails
+        """
+        raise NotImplementedError
+
+    def extract_pages(
+        self, document: Any, start: int, stop: int
+    ) -> List[Optional[str]]:
+        """Extract pages [start, stop)"""
+        return [self.extract_page(document, i) for i in range(start, stop)]
+
+    def close(self, document: Any):
+        """Release an open document"""
+
+
+class PyPDF2Backend(PDFBackend):
+    """Pure-Python extraction with PyPDF2"""
+
+    name = "pypdf2"
+
+    def open(self, source: Union[bytes, str]) -> Any:
+        import PyPDF2
+
+        if isinstance(source, bytes):
+            stream = io.BytesIO(source)
+        else:
+            with open(source, "rb") as f:
+                stream = map_file(f)
+
+        try:
+            reader = PyPDF2.PdfReader(stream)
+        except PyPDF2.errors.PdfReadError as e:
+            raise PDFProcessingError(f"Invalid or corrupted PDF file: {str(e)}") from e
+
+        if reader.is_encrypted:
+            raise PDFProcessingError(ENCRYPTED_MESSAGE)
+        return reader
+
+    def page_count(self, document: Any) -> int:
+        return len(document.pages)
+
+    def extract_page(self, document: Any, index: int) -> Optional[str]:
+        try:
+            return document.pages[index].extract_text()
+        except Exception:
+            return None
+
+
+class PdfiumBackend(PDFBackend):
+    """Native extraction with PDFium through pypdfium2"""
+
+    name = "pypdfium2"
+
+    # PDFium is not thread-safe; all calls in a process are serialized
+    _lock = threading.Lock()
+
+    def open(self, source: Union[bytes, str]) -> Any:
+        import pypdfium2
+
+        with self._lock:
+            try:
+                return pypdfium2.PdfDocument(source)
+            except pypdfium2.PdfiumError as e:
+                if "password" in str(e).lower():
+                    raise PDFProcessingError(ENCRYPTED_MESSAGE) from e
+                raise PDFProcessingError(
+                    f"Invalid or corrupted PDF file: {str(e)}"
+                ) from e
+
+    def page_count(self, document: Any) -> int:
+        with self._lock:
+            return len(document)
+
+    def extract_page(self, document: Any, index: int) -> Optional[str]:
+        with self._lock:
+            try:
+                page = document[index]
+                try:
+                    text_page = page.get_textpage()
+                    try:
+                        return text_page.get_text_bounded().replace("\r\n", "\n")
+                    finally:
+                        text_page.close()
+                finally:
+                    page.close()
+            except Exception:
+                return None
+
+    def close(self, document: Any):
+        with self._lock:
+            document.close()
+
+
+class PyMuPDFBackend(PDFBackend):
+    """Native extraction with MuPDF through PyMuPDF"""
+
+    name = "pymupdf"
+
+    # MuPDF documents must not be used from several threads at once
+    _lock = threading.Lock()
+
+    def open(self, source: Union[bytes, str]) -> Any:
+        import pymupdf
+
+        with self._lock:
+            try:
+                if isinstance(source, bytes):
+                    document = pymupdf.open(stream=source, filetype="pdf")
+                else:
+                    document = pymupdf.open(source, filetype="pdf")
+            except (pymupdf.FileDataError, RuntimeError) as e:
+                raise PDFProcessingError(
+                    f"Invalid or corrupted PDF file: {str(e)}"
+                ) from e
+
+            if document.needs_pass:
+                document.close()
+                raise PDFProcessingError(ENCRYPTED_MESSAGE)
+            return document
+
+    def page_count(self, document: Any) -> int:
+        with self._lock:
+            return document.page_count
+
+    def extract_page(self, document: Any, index: int) -> Optional[str]:
+        with self._lock:
+            try:
+                return document.load_page(index).get_text()
+            except Exception:
+                return None
+
+    def close(self, document: Any):
+        with self._lock:
+            document.close()
+
+
+_BACKEND_CLASSES = {
+    "pypdf2": PyPDF2Backend,
+    "pypdfium2": PdfiumBackend,
+    "pymupdf": PyMuPDFBackend,
+}
+_instances: Dict[str, PDFBackend] = {}
+
+
+def available_backends() -> List[str]:
+    """
+    List the backends whose library is installed
+
+    Returns:
+        List[str]: Backend names, in PDF_BACKENDS order
+    """
+    return [
+        name
+        for name in PDF_BACKENDS
+        if importlib.util.find_spec(_MODULES[name]) is not None
+    ]
+
+
+def get_backend(name: str = "auto") -> PDFBackend:
+    """
+    Get a PDF backend by name
+
+    Args:
+        name: One of PDF_BACKENDS, or "auto" for the fastest installed one
+
+    Returns:
+        PDFBackend: Shared backend instance
+
+    Raises:
+        PDFProcessingError: If the backend is unknown or its library is missing
+    """
+    available = available_backends()
+    if name == "auto":
+        name = next(backend for backend in AUTO_ORDER if backend in available)
+
+    if name not in PDF_BACKENDS:
+        raise PDFProcessingError(
+            f"Unknown PDF backend '{name}'. Choose one of: auto, {', '.join(PDF_BACKENDS)}"
+        )
+    if name not in available:
+        raise PDFProcessingError(
+            f"The {name} PDF backend requires {_MODULES[name]}: pip install {name}"
+        )
+
+    if name not in _instances:
+        _instances[name] = _BACKEND_CLASSES[name]()
+    return _instances[name]
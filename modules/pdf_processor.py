@@ -3,18 +3,232 @@ PDF Processing Module
 Handles PDF file upload, text extraction, and preprocessing.
 """
 
-import PyPDF2
+import copy
+import hashlib
 import io
-import re
-from typing import Optional, List
-import streamlit as st
+import multiprocessing
+import os
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator, Optional, List, Tuple, Union
+
+from .cache import ExtractionCache
+from .errors import PDFProcessingError, SummarizerError
+from .events import ProgressReporter
+from .metrics import Metrics
+from .pdf_backends import PDFBackend, get_backend, map_file
+from .text_normalizer import normalize_text
+
+# Uploaded file object, raw PDF bytes, or a path to a PDF file
+PDFSource = Union[bytes, str, os.PathLike, io.IOBase]
+
+
+@dataclass
+class ExtractionResult:
+    """Text extracted from a PDF file"""
+
+    text: str
+    page_count: int
+    failed_pages: List[int] = field(default_factory=list)
+
+
+class UploadedBytes(io.BytesIO):
+    """In-memory file with the attributes PDFProcessor expects from an upload"""
+
+    def __init__(self, data: bytes, name: str, type: str = "application/pdf"):
+        super().__init__(data)
+        self.name = name
+        self.type = type
+        self.size = len(data)
+
+
+class SpooledUpload(os.PathLike):
+    """Upload copied to a temporary file, with the attributes PDFProcessor expects"""
+
+    def __init__(
+        self,
+        path: str,
+        name: str,
+        type: str = "application/pdf",
+        sha256: Optional[str] = None,
+    ):
+        self.path = path
+        self.name = name
+        self.type = type
+        self.size = os.path.getsize(path)
+        self.sha256 = sha256  # Hex digest of the content, computed while spooling
+
+    def __fspath__(self) -> str:
+        return self.path
+
+    def remove(self):
+        """Delete the temporary file"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+# Backend and open document of the current extraction worker process
+_worker_backend: Optional[PDFBackend] = None
+_worker_document = None
+
+SPOOL_BLOCK_SIZE = 1024 * 1024  # Bytes copied at a time when spooling uploads
+
+
+def _file_digest(source, pdf_stream: io.IOBase) -> str:
+    """SHA-256 hex digest of an open PDF, reusing the one computed while spooling"""
+    digest = getattr(source, "sha256", None)
+    if digest:
+        return digest
+    if isinstance(pdf_stream, io.BytesIO):
+        with pdf_stream.getbuffer() as view:
+            return hashlib.sha256(view).hexdigest()
+    return hashlib.sha256(pdf_stream).hexdigest()
+
+
+def _init_page_worker(backend_name: str, pdf_source: Union[bytes, str]):
+    """Open the PDF once per worker process, from bytes or a file path"""
+    global _worker_backend, _worker_document
+    _worker_backend = get_backend(backend_name)
+    _worker_document = _worker_backend.open(pdf_source)
+
+
+def _extract_page_range(start: int, stop: int) -> List[Optional[str]]:
+    """Extract pages [start, stop) in a worker process"""
+    return _worker_backend.extract_pages(_worker_document, start, stop)
+
+
+def _extract_document(backend_name: str, pdf_source: Union[bytes, str]) -> List[Optional[str]]:
+    """Extract every page of a PDF in a document worker process"""
+    backend = get_backend(backend_name)
+    document = backend.open(pdf_source)
+    try:
+        return backend.extract_pages(document, 0, backend.page_count(document))
+    finally:
+        backend.close(document)
 
 
 class PDFProcessor:
     """Class to handle PDF file processing and text extraction"""
 
-    def __init__(self):
-        self.max_file_size = 10 * 1024 * 1024  # 10MB limit
+    def __init__(
+        self,
+        reporter: Optional[ProgressReporter] = None,
+        metrics: Optional[Metrics] = None,
+        extraction_cache: Optional[ExtractionCache] = None,
+        backend: str = "auto",
+    ):
+        """
+        Initialize the PDF processor
+
+        Args:
+            reporter: Receives messages and progress (defaults to logging)
+            metrics: Records stage timings and counters (defaults to disabled)
+            extraction_cache: Stores extracted pages by file content, so files
+                seen before skip parsing (None disables)
+            backend: PDF library to extract text with (see PDF_BACKENDS), or
+                "auto" for the fastest installed one
+
+        Raises:
+            PDFProcessingError: If the backend is unknown or not installed
+        """
+        self.reporter = reporter or ProgressReporter()
+        self.metrics = metrics or Metrics()
+        self.extraction_cache = extraction_cache
+        self.backend = get_backend(backend)
+        self.max_file_size = 10 * 1024 * 1024  # 10MB limit for in-memory processing
+        self.max_large_file_size = None  # Larger files up to this size are spooled to disk (None disables)
+        self.spool_dir = None  # Directory for spooled uploads (system temp dir if None)
+        self.parallel_page_threshold = 32  # Use worker processes from this many pages
+        self.pages_per_task = 8
+        self.page_window = 64  # Most pages extracted ahead of the consumer
+        self.max_workers = min(4, os.cpu_count() or 1)
+        # process_many uses worker processes from this many bytes across files
+        self.parallel_document_bytes = 4 * 1024 * 1024
+        self._document_pool = None  # Extracts whole documents in process_many
+
+    def with_reporter(self, reporter: ProgressReporter) -> "PDFProcessor":
+        """
+        Get a copy of this processor that reports to another reporter
+
+        Args:
+            reporter: Receives the copy's messages and progress
+
+        Returns:
+            PDFProcessor: Processor copy with the same settings
+        """
+        processor = copy.copy(self)
+        processor.reporter = reporter
+        return processor
+
+    @property
+    def size_limit(self) -> int:
+        """Largest accepted file size in bytes"""
+        return max(self.max_file_size, self.max_large_file_size or 0)
+
+    def is_large(self, size: int) -> bool:
+        """
+        Check whether a file is processed in large-document mode
+
+        Args:
+            size: File size in bytes
+
+        Returns:
+            bool: True if the file is spooled to disk instead of read into memory
+        """
+        return self.max_large_file_size is not None and size > self.max_file_size
+
+    def spool(self, uploaded_file) -> SpooledUpload:
+        """
+        Copy an upload to a temporary file in fixed-size blocks
+
+        The content is hashed on the way, for the extraction cache.
+
+        Args:
+            uploaded_file: File object to copy
+
+        Returns:
+            SpooledUpload: The temporary PDF file; the caller removes it
+        """
+        uploaded_file.seek(0)
+        digest = hashlib.sha256()
+        with tempfile.NamedTemporaryFile(
+            prefix="upload-", suffix=".pdf", dir=self.spool_dir, delete=False
+        ) as f:
+            for block in iter(lambda: uploaded_file.read(SPOOL_BLOCK_SIZE), b""):
+                digest.update(block)
+                f.write(block)
+        return SpooledUpload(
+            f.name,
+            getattr(uploaded_file, "name", "upload.pdf"),
+            getattr(uploaded_file, "type", "application/pdf"),
+            sha256=digest.hexdigest(),
+        )
+
+    def check_pdf(self, uploaded_file):
+        """
+        Check an uploaded PDF file's size and type
+
+        Args:
+            uploaded_file: Uploaded file object with size and type attributes
+
+        Raises:
+            PDFProcessingError: If the file is too large or not a PDF
+        """
+        with self.metrics.span("validate_pdf"):
+            # Check file size
+            size_limit = self.size_limit
+            if uploaded_file.size > size_limit:
+                raise PDFProcessingError(
+                    f"File size ({uploaded_file.size / 1024 / 1024:.1f}MB) exceeds limit "
+                    f"({size_limit / 1024 / 1024:.0f}MB)"
+                )
+
+            # Check file type
+            if uploaded_file.type != "application/pdf":
+                raise PDFProcessingError("Please upload a valid PDF file")
 
     def validate_pdf(self, uploaded_file) -> bool:
         """
@@ -26,19 +240,58 @@ class PDFProcessor:
         Returns:
             bool: True if valid, False otherwise
         """
-        # Check file size
-        if uploaded_file.size > self.max_file_size:
-            st.error(
-                f"File size ({uploaded_file.size / 1024 / 1024:.1f}MB) exceeds limit (10MB)"
-            )
+        try:
+            self.check_pdf(uploaded_file)
+            return True
+        except PDFProcessingError as e:
+            self.reporter.error(str(e))
             return False
 
-        # Check file type
-        if uploaded_file.type != "application/pdf":
-            st.error("Please upload a valid PDF file")
-            return False
+    def extract(self, source: PDFSource) -> ExtractionResult:
+        """
+        Extract text content from a PDF file
+
+        Args:
+            source: Uploaded file object, PDF bytes or path to a PDF file
+
+        Returns:
+            ExtractionResult: Extracted text and page statistics
+
+        Raises:
+            PDFProcessingError: If no text could be extracted
+        """
+        with self.metrics.span("extract_pdf"):
+            page_texts = []
+            failed_pages = []
+            page_count = 0
+
+            try:
+                for page_number, page_text in self.iter_pages(source):
+                    page_count = page_number
+                    if page_text is None:
+                        failed_pages.append(page_number)
+                    elif page_text.strip():  # Only add non-empty pages
+                        page_texts.append(page_text + "\n")
+            except MemoryError as e:
+                raise PDFProcessingError(
+                    "PDF file is too large to process. Please try a smaller file."
+                ) from e
+
+            self._report_failed_pages(failed_pages)
+            text_content = "".join(page_texts)
+
+            if not text_content.strip():
+                raise PDFProcessingError(
+                    "No readable text content found in the PDF file. The PDF might contain only images or scanned content."
+                )
+
+            # Check if extracted text is too short
+            if len(text_content.strip()) < 100:
+                self.reporter.warning(
+                    "Very little text was extracted. The PDF might contain mostly images or have formatting issues."
+                )
 
-        return True
+            return ExtractionResult(text_content, page_count, failed_pages)
 
     def extract_text_from_pdf(self, uploaded_file) -> Optional[str]:
         """
@@ -51,77 +304,251 @@ class PDFProcessor:
             str: Extracted text content or None if extraction fails
         """
         try:
-            # Reset file pointer
-            uploaded_file.seek(0)
+            return self.extract(uploaded_file).text
+        except PDFProcessingError as e:
+            self.reporter.error(str(e))
+            return None
+        except Exception as e:
+            self.reporter.error(f"Unexpected error processing PDF file: {str(e)}")
+            return None
+
+    def iter_pages(self, source: PDFSource) -> Iterator[Tuple[int, Optional[str]]]:
+        """
+        Extract pages one at a time, in page order
 
-            # Create a PDF reader object
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(uploaded_file.read()))
+        Large documents are extracted by a pool of worker processes, and pages
+        are yielded as soon as they are ready. With an extraction cache, files
+        extracted before are served from the cache without parsing them.
 
-            # Check if PDF is encrypted
-            if pdf_reader.is_encrypted:
-                st.error(
-                    "❌ Cannot process encrypted PDF files. Please upload an unencrypted PDF."
+        Args:
+            source: Uploaded file object, PDF bytes or path to a PDF file
+
+        Yields:
+            Tuple[int, Optional[str]]: 1-based page number and its text
+            (None if the page could not be extracted)
+
+        Raises:
+            PDFProcessingError: If the PDF is corrupted, encrypted or empty
+        """
+        with self._open_pdf(source) as (pdf_stream, worker_source):
+            if self.extraction_cache is None:
+                yield from self._iter_pages(worker_source)
+                return
+
+            with self.metrics.span("hash_pdf"):
+                key = self.extraction_cache.make_key(
+                    _file_digest(source, pdf_stream), self.backend.name
                 )
-                return None
+            pages = self.extraction_cache.get(key)
+            if pages is not None:
+                self.metrics.count("extraction_cache_hits")
+                self.metrics.count("pdf_pages", len(pages))
+                yield from enumerate(pages, 1)
+                return
+
+            self.metrics.count("extraction_cache_misses")
+            recorder = self.extraction_cache.recorder(key)
+            for page_number, page_text in self._iter_pages(worker_source):
+                recorder.add(page_text)
+                yield page_number, page_text
+            # Only complete extractions are stored
+            recorder.save()
+
+    @contextmanager
+    def _open_pdf(self, source: PDFSource) -> Iterator[Tuple[io.IOBase, Union[bytes, str]]]:
+        """
+        Open a PDF source for reading, memory-mapping files on disk
+
+        Paths are mapped directly, and uploads in large-document mode are
+        spooled to a temporary file first, so the document is never held in
+        memory as a whole. Other sources are read into memory.
+
+        Args:
+            source: Uploaded file object, PDF bytes or path to a PDF file
+
+        Yields:
+            Tuple: Stream over the PDF bytes, and the bytes or path the backend opens
+        """
+        if isinstance(source, (str, os.PathLike)):
+            spooled = None
+            path = os.fspath(source)
+        elif not isinstance(source, (bytes, bytearray)) and self.is_large(
+            getattr(source, "size", 0)
+        ):
+            spooled = self.spool(source)
+            path = spooled.path
+        else:
+            pdf_bytes = self._read_bytes(source)
+            yield io.BytesIO(pdf_bytes), pdf_bytes
+            return
 
+        try:
+            with open(path, "rb") as f, map_file(f) as pdf_map:
+                yield pdf_map, path
+        finally:
+            if spooled is not None:
+                spooled.remove()
+
+    def _iter_pages(
+        self, pdf_source: Union[bytes, str]
+    ) -> Iterator[Tuple[int, Optional[str]]]:
+        """Extract pages from PDF bytes or a PDF file path (see iter_pages)"""
+        if self._document_pool is not None:
+            # One worker extracts the whole document while others take other files
+            pages = self._document_pool.submit(
+                _extract_document, self.backend.name, pdf_source
+            ).result()
+            if not pages:
+                raise PDFProcessingError("PDF file appears to be empty or corrupted.")
+            self.metrics.count("pdf_pages", len(pages))
+            yield from enumerate(pages, 1)
+            return
+
+        document = self.backend.open(pdf_source)
+        try:
             # Check number of pages
-            num_pages = len(pdf_reader.pages)
+            num_pages = self.backend.page_count(document)
             if num_pages == 0:
-                st.error("❌ PDF file appears to be empty or corrupted.")
-                return None
+                raise PDFProcessingError("PDF file appears to be empty or corrupted.")
+            self.metrics.count("pdf_pages", num_pages)
 
             if num_pages > 100:
-                st.warning(
-                    f"⚠️ Large PDF detected ({num_pages} pages). Processing may take longer."
+                self.reporter.warning(
+                    f"Large PDF detected ({num_pages} pages). Processing may take longer."
                 )
 
-            # Extract text from all pages
-            text_content = ""
-            failed_pages = []
+            if num_pages < self.parallel_page_threshold or self.max_workers < 2:
+                for page_index in range(num_pages):
+                    with self.metrics.span("extract_page"):
+                        page_text = self.backend.extract_page(document, page_index)
+                    yield page_index + 1, page_text
+                return
+
+            yield from self._iter_pages_parallel(pdf_source, num_pages)
+        finally:
+            self.backend.close(document)
+
+    def _iter_pages_parallel(
+        self, pdf_source: Union[bytes, str], num_pages: int
+    ) -> Iterator[Tuple[int, Optional[str]]]:
+        """Extract pages in worker processes, yielding them in page order"""
+        # Spawn rather than fork: the parent may be running model threads
+        executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_page_worker,
+            initargs=(self.backend.name, pdf_source),
+        )
+        # Keep at most page_window pages in flight so memory does not grow
+        # with the document when the consumer is slower than extraction
+        starts = iter(range(0, num_pages, self.pages_per_task))
+        max_tasks = max(1, self.page_window // self.pages_per_task)
+        futures = deque()
+
+        def submit_next() -> bool:
+            start = next(starts, None)
+            if start is None:
+                return False
+            futures.append(
+                executor.submit(
+                    _extract_page_range, start, min(start + self.pages_per_task, num_pages)
+                )
+            )
+            return True
 
-            for page_num, page in enumerate(pdf_reader.pages):
-                try:
-                    page_text = page.extract_text()
-                    if page_text.strip():  # Only add non-empty pages
-                        text_content += page_text + "\n"
-                except Exception as e:
-                    failed_pages.append(page_num + 1)
-                    continue
+        while len(futures) < max_tasks and submit_next():
+            pass
+        try:
+            page_num = 0
+            while futures:
+                page_texts = futures.popleft().result()
+                submit_next()
+                for page_text in page_texts:
+                    page_num += 1
+                    yield page_num, page_text
+        finally:
+            # Stop outstanding work if the consumer gives up early
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def stream_pdf(self, uploaded_file) -> Iterator[str]:
+        """
+        Validate, extract and preprocess a PDF page by page
 
-            # Report failed pages
-            if failed_pages:
-                if len(failed_pages) < 5:
-                    st.warning(
-                        f"⚠️ Could not extract text from pages: {', '.join(map(str, failed_pages))}"
-                    )
-                else:
-                    st.warning(
-                        f"⚠️ Could not extract text from {len(failed_pages)} pages"
-                    )
+        Lets summarization start on the first pages while later pages are
+        still being extracted. Problems are sent to the reporter.
 
-            if not text_content.strip():
-                st.error(
-                    "❌ No readable text content found in the PDF file. The PDF might contain only images or scanned content."
-                )
-                return None
+        Args:
+            uploaded_file: Streamlit uploaded file object
 
-            # Check if extracted text is too short
-            if len(text_content.strip()) < 100:
-                st.warning(
-                    "⚠️ Very little text was extracted. The PDF might contain mostly images or have formatting issues."
-                )
+        Yields:
+            str: Preprocessed text of each non-empty page
+        """
+        if not self.validate_pdf(uploaded_file):
+            return
 
-            return text_content
+        failed_pages = []
+        try:
+            for page_number, page_text in self.iter_pages(uploaded_file):
+                if page_text is None:
+                    failed_pages.append(page_number)
+                    continue
 
-        except PyPDF2.errors.PdfReadError as e:
-            st.error(f"❌ Invalid or corrupted PDF file: {str(e)}")
-            return None
+                processed_text = self.preprocess_text(page_text)
+                if processed_text:
+                    yield processed_text
+
+        except PDFProcessingError as e:
+            self.reporter.error(str(e))
         except MemoryError:
-            st.error("❌ PDF file is too large to process. Please try a smaller file.")
-            return None
+            self.reporter.error(
+                "PDF file is too large to process. Please try a smaller file."
+            )
         except Exception as e:
-            st.error(f"❌ Unexpected error processing PDF file: {str(e)}")
-            return None
+            self.reporter.error(f"Unexpected error processing PDF file: {str(e)}")
+
+        self._report_failed_pages(failed_pages)
+
+    def _read_bytes(self, source: PDFSource) -> bytes:
+        """
+        Read the raw bytes of a PDF source
+
+        Args:
+            source: Uploaded file object, PDF bytes or path to a PDF file
+
+        Returns:
+            bytes: PDF file content
+        """
+        if isinstance(source, (bytes, bytearray)):
+            return bytes(source)
+
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as f:
+                return f.read()
+
+        # Reset file pointer
+        source.seek(0)
+        return source.read()
+
+    def _report_failed_pages(self, failed_pages: List[int]):
+        """
+        Warn about pages whose text could not be extracted
+
+        Args:
+            failed_pages: 1-based numbers of the failed pages
+        """
+        if not failed_pages:
+            return
+
+        if len(failed_pages) < 5:
+            self.reporter.warning(
+                f"Could not extract text from pages: {', '.join(map(str, failed_pages))}"
+            )
+        else:
+            self.reporter.warning(
+                f"Could not extract text from {len(failed_pages)} pages"
+            )
 
     def preprocess_text(self, text: str) -> str:
         """
@@ -133,20 +560,91 @@ class PDFProcessor:
         Returns:
             str: Cleaned and preprocessed text
         """
-        if not text:
-            return ""
+        with self.metrics.span("preprocess_text"):
+            return normalize_text(text)
+
+    def process(self, source: PDFSource) -> ExtractionResult:
+        """
+        Extract and preprocess the text of a PDF file
+
+        Args:
+            source: Uploaded file object, PDF bytes or path to a PDF file
 
-        # Remove excessive whitespace and newlines
-        text = re.sub(r"\n+", "\n", text)
-        text = re.sub(r"\s+", " ", text)
+        Returns:
+            ExtractionResult: Preprocessed text and page statistics
 
-        # Remove special characters that might interfere with processing
-        text = re.sub(r"[^\w\s\.\,\!\?\;\:\-\(\)]", " ", text)
+        Raises:
+            PDFProcessingError: If no text could be extracted
+        """
+        result = self.extract(source)
+        result.text = self.preprocess_text(result.text)
 
-        # Remove extra spaces
-        text = " ".join(text.split())
+        if len(result.text) < 50:
+            self.reporter.warning(
+                "The extracted text is very short. Please check if the PDF contains readable text."
+            )
 
-        return text.strip()
+        return result
+
+    def process_many(
+        self, sources: List[PDFSource]
+    ) -> List[Union[ExtractionResult, SummarizerError]]:
+        """
+        Extract and preprocess several PDF files concurrently
+
+        Files that are not in the extraction cache are each extracted by one
+        of max_workers worker processes, so several files are parsed at once.
+        Below parallel_document_bytes in total, starting the workers would take
+        longer than the extraction, and the files are extracted one by one.
+        A file that fails does not stop the others.
+
+        Args:
+            sources: Uploaded file objects, PDF bytes or paths to PDF files
+
+        Returns:
+            List: ExtractionResult per source in order, or the error it failed with
+        """
+        total_bytes = sum(self._source_size(source) for source in sources)
+        if (
+            len(sources) < 2
+            or self.max_workers < 2
+            or total_bytes < self.parallel_document_bytes
+        ):
+            return [self._try_process(source) for source in sources]
+
+        # Spawn rather than fork: the parent may be running model threads
+        executor = ProcessPoolExecutor(
+            max_workers=min(self.max_workers, len(sources)),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        processor = copy.copy(self)
+        processor._document_pool = executor
+        try:
+            # Threads hash, look up and preprocess files while workers parse them
+            with ThreadPoolExecutor(
+                max_workers=min(len(sources), 2 * self.max_workers)
+            ) as threads:
+                return list(threads.map(processor._try_process, sources))
+        finally:
+            executor.shutdown(wait=True)
+
+    @staticmethod
+    def _source_size(source: PDFSource) -> int:
+        """Size of a PDF source in bytes, without reading it"""
+        if isinstance(source, (bytes, bytearray)):
+            return len(source)
+        if isinstance(source, (str, os.PathLike)):
+            return os.path.getsize(source)
+        return getattr(source, "size", 0)
+
+    def _try_process(self, source: PDFSource) -> Union[ExtractionResult, SummarizerError]:
+        """Process one file, returning the error instead of raising it (see process_many)"""
+        try:
+            return self.process(source)
+        except SummarizerError as e:
+            return e
+        except Exception as e:
+            return PDFProcessingError(f"Unexpected error processing PDF file: {str(e)}")
 
     def process_pdf(self, uploaded_file) -> Optional[str]:
         """
@@ -161,17 +659,11 @@ class PDFProcessor:
         if not self.validate_pdf(uploaded_file):
             return None
 
-        # Extract text
-        raw_text = self.extract_text_from_pdf(uploaded_file)
-        if raw_text is None:
+        try:
+            return self.process(uploaded_file).text
+        except PDFProcessingError as e:
+            self.reporter.error(str(e))
+            return None
+        except Exception as e:
+            self.reporter.error(f"Unexpected error processing PDF file: {str(e)}")
             return None
-
-        # Preprocess text
-        processed_text = self.preprocess_text(raw_text)
-
-        if len(processed_text) < 50:
-            st.warning(
-                "The extracted text is very short. Please check if the PDF contains readable text."
-            )
-
-        return processed_text
@@ -0,0 +1,125 @@
+"""
+Streamlit Adapter Module
+Renders core module events and results in the Streamlit UI.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+import streamlit as st
+
+from .events import ProgressEvent, ProgressReporter
+from .jobs import CANCELLED, FAILED, QUEUED, RUNNING, Job
+
+
+def _show_message(event: ProgressEvent):
+    """Show an info, success, warning or error event"""
+    if event.kind == "info":
+        st.info(event.message)
+    elif event.kind == "success":
+        st.success(f"✅ {event.message}")
+    elif event.kind == "warning":
+        st.warning(f"⚠️ {event.message}")
+    elif event.kind == "error":
+        st.error(f"❌ {event.message}")
+
+
+class StreamlitReporter(ProgressReporter):
+    """Shows events as Streamlit messages, spinners and progress bars"""
+
+    def __init__(self):
+        super().__init__()
+        # Every session runs its script in its own thread
+        self._local = threading.local()
+
+    def emit(self, event: ProgressEvent):
+        if event.kind == "progress":
+            self._show_progress(event)
+        else:
+            _show_message(event)
+
+    @contextmanager
+    def stage(self, message: str) -> Iterator[None]:
+        try:
+            with st.spinner(f"🔄 {message}"):
+                yield
+        finally:
+            self._clear_progress()
+
+    def _show_progress(self, event: ProgressEvent):
+        """Update this session's progress bar and status line"""
+        if event.fraction is not None:
+            if getattr(self._local, "bar", None) is None:
+                self._local.bar = st.progress(0)
+            self._local.bar.progress(min(max(event.fraction, 0.0), 1.0))
+
+        if event.message:
+            if getattr(self._local, "status", None) is None:
+                self._local.status = st.empty()
+            self._local.status.caption(event.message)
+
+    def _clear_progress(self):
+        """Forget the progress widgets of the finished stage"""
+        status = getattr(self._local, "status", None)
+        if status is not None:
+            status.empty()
+        self._local.bar = None
+        self._local.status = None
+
+
+def display_summary_stats(
+    original_text: str, summary: str, original_words: Optional[int] = None
+):
+    """
+    Display statistics about the summarization
+
+    Args:
+        original_text: Original input text
+        summary: Generated summary
+        original_words: Word count of the original text, when only part of
+            the text was kept
+    """
+    if original_words is None:
+        original_words = len(original_text.split())
+    summary_words = len(summary.split())
+    compression_ratio = (
+        (1 - summary_words / original_words) * 100 if original_words > 0 else 0
+    )
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.metric("Original Words", f"{original_words:,}")
+
+    with col2:
+        st.metric("Summary Words", f"{summary_words:,}")
+
+    with col3:
+        st.metric("Compression", f"{compression_ratio:.1f}%")
+
+
+def display_job_status(job: Job):
+    """
+    Display the state, progress and messages of a background job
+
+    Args:
+        job: Job to display
+    """
+    if job.status == QUEUED:
+        st.caption("⏳ Waiting for a free worker...")
+    elif job.status == RUNNING:
+        status = f"🔄 {job.stage or 'Working...'} ({job.elapsed:.0f}s)"
+        if job.progress is not None:
+            st.progress(job.progress, text=status)
+        else:
+            st.caption(status)
+    elif job.status == FAILED:
+        st.error(f"❌ {job.error}")
+    elif job.status == CANCELLED:
+        st.caption("✖️ Cancelled")
+    else:
+        st.caption(f"Finished in {job.elapsed:.1f}s")
+
+    for event in job.messages:
+        _show_message(event)
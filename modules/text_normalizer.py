@@ -0,0 +1,34 @@
+"""
+Text Normalization Module
+Single-pass whitespace collapsing, character filtering and sentence boundaries shared by all text paths.
+"""
+
+import re
+
+# Punctuation kept alongside word characters; anything else becomes a space
+ALLOWED_PUNCTUATION = ".,!?;:-()[]\"'/"
+
+# Any run of whitespace or disallowed characters collapses to a single space
+_SEPARATOR_RUN = re.compile(r"[^\w" + re.escape(ALLOWED_PUNCTUATION) + r"]+")
+
+# Whitespace after sentence-ending punctuation, or a blank line
+SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+|\n\s*\n")
+
+# Blank line between paragraphs
+PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Collapse whitespace and strip unsupported characters in one pass
+
+    Args:
+        text: Raw text content
+
+    Returns:
+        str: Normalized text
+    """
+    if not text:
+        return ""
+
+    return _SEPARATOR_RUN.sub(" ", text).strip()
@@ -3,103 +3,241 @@ Text Summarization Module
 Handles text summarization using Hugging Face Transformers.
 """
 
-from transformers import pipeline, AutoTokenizer
-import torch
-from typing import List, Optional
-import streamlit as st
+from contextlib import nullcontext
+from dataclasses import dataclass
+from functools import partial
+import copy
+from typing import (
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+import bisect
+import hashlib
+import math
 import re
+import threading
+import time
+
+from .cache import SummaryCache
+from .cpu_scheduler import CPUScheduler
+from .errors import InputError, SummarizationError, SummarizerError
+from .events import ProgressReporter
+from .extractive import select_sentences, split_sentences
+from .generation_policy import GenerationPreset, length_budget
+from .metrics import Metrics
+from .model_registry import ModelRegistry
+from .text_normalizer import PARAGRAPH_BREAK, SENTENCE_BREAK
+from .tokenization import TokenizerService, tokenizer_service
+
+
+class TextChunk(str):
+    """Chunk of text that carries its model input IDs"""
+
+    input_ids: Optional[List[int]] = None
+
+
+@dataclass
+class SummaryResult:
+    """Summary produced by the summarization pipeline"""
+
+    summary: str
+    chunk_count: int
+    failed_chunks: int = 0
+    cached: bool = False
+    input_tokens: int = 0  # Model input tokens across all chunks
+    time_to_first_token: Optional[float] = None  # Seconds until streamed output began
+
+
+@dataclass
+class SummaryEstimate:
+    """Cheap preview of the work a summary will take"""
+
+    tokens: int
+    chunks: int
+    seconds: Optional[float] = None  # None until a chunk has been summarized
+
+
+class SummaryStream:
+    """Iterates over summary text as the model generates it
+
+    The complete SummaryResult is available as result once iteration ends.
+    """
+
+    def __init__(self, pieces: Generator[str, None, SummaryResult]):
+        self._pieces = pieces
+        self.result: Optional[SummaryResult] = None
+
+    def __iter__(self) -> Iterator[str]:
+        self.result = yield from self._pieces
 
 
 class TextSummarizer:
     """Class to handle text summarization using pre-trained models"""
 
-    def __init__(self, model_name: str = "facebook/bart-large-cnn"):
+    def __init__(
+        self,
+        model_name: str = "facebook/bart-large-cnn",
+        cache: Optional[SummaryCache] = None,
+        reporter: Optional[ProgressReporter] = None,
+        registry: Optional[ModelRegistry] = None,
+        backend: str = "torch",
+        metrics: Optional[Metrics] = None,
+        cpu_scheduler: Optional[CPUScheduler] = None,
+    ):
         """
         Initialize the text summarizer
 
         Args:
             model_name: Name of the pre-trained model to use
+            cache: Summary cache to use (defaults to an in-memory cache)
+            reporter: Receives messages and progress (defaults to logging)
+            registry: Model registry to load models from (defaults to a private one-model registry)
+            backend: Inference backend ("torch", "int8" or "onnx")
+            metrics: Records stage timings and counters (defaults to disabled)
+            cpu_scheduler: Limits concurrent generations and their threads,
+                shared by every summarizer on the machine (None leaves both
+                to PyTorch)
         """
         self.model_name = model_name
+        self.backend = backend
+        self.reporter = reporter or ProgressReporter()
+        self.registry = (
+            registry if registry is not None else ModelRegistry(max_models=1)
+        )
+        self.cache = cache if cache is not None else SummaryCache()
+        self.metrics = metrics or Metrics()
+        self.cpu_scheduler = cpu_scheduler
+        self.scheduler = None  # Optional BatchScheduler shared across requests
         self.summarizer = None
         self.tokenizer = None
-        self.max_chunk_length = 1024  # Maximum tokens per chunk
-        self.min_summary_length = 50
-        self.max_summary_length = 300
+        self.max_chunk_length = None  # Optional cap below the model's input limit
+        self.min_summary_length = 50  # Tokens
+        self.max_summary_length = 300  # Tokens
+        self.length_ratio = 0.25  # Target summary tokens per input token
+        self.generation_preset = None  # Decoding strategy (None keeps the model's defaults)
+        self.batch_size = 8  # Chunks per forward pass
+        self.reduce_fan_in = 8  # Most summaries combined in one reduce window
+        self.max_reduce_depth = 4  # Most reduce levels above the chunk summaries
+        self.extractive_ratio = None  # Fraction of words kept from very long texts (None disables)
+        self.extractive_min_words = 10000  # Texts longer than this are pre-filtered
+        # Recent seconds per chunk by model and decoding strategy, shared with
+        # with_reporter copies
+        self._chunk_seconds = {}
 
-    @st.cache_resource
-    def load_model(_self):
+    def load_model(self) -> bool:
         """
         Load the summarization model and tokenizer
+
+        The model comes from the registry, which keeps it resident for other
+        summarizers, and the tokenizer is the pipeline's own.
+
+        Returns:
+            bool: True once the model is loaded
+
+        Raises:
+            ModelLoadError: If the model cannot be loaded
         """
-        try:
-            # Check if CUDA is available
-            device = 0 if torch.cuda.is_available() else -1
+        self.summarizer = self.registry.get(
+            self.model_name, self.backend, reporter=self.reporter
+        )
+        self.tokenizer = self.summarizer.tokenizer
+        return True
 
-            # Show device info
-            if torch.cuda.is_available():
-                st.info(f"🚀 Using GPU acceleration: {torch.cuda.get_device_name()}")
-            else:
-                st.info("💻 Using CPU for processing (this may be slower)")
-
-            # Load the summarization pipeline
-            _self.summarizer = pipeline(
-                "summarization",
-                model=_self.model_name,
-                device=device,
-                torch_dtype=(
-                    torch.float16 if torch.cuda.is_available() else torch.float32
-                ),
-            )
+    def set_model(self, model_name: str, backend: Optional[str] = None):
+        """
+        Switch to another model or inference backend
 
-            # Load tokenizer for text chunking
-            _self.tokenizer = AutoTokenizer.from_pretrained(_self.model_name)
+        A model that is already resident in the registry is used immediately;
+        otherwise it is loaded on the next summarization.
 
-            st.success(f"✅ Model loaded successfully: {_self.model_name}")
-            return True
+        Args:
+            model_name: Name of the pre-trained model to use
+            backend: Inference backend to use (None keeps the current one)
+        """
+        backend = backend or self.backend
+        if (
+            model_name == self.model_name
+            and backend == self.backend
+            and self.summarizer is not None
+        ):
+            return
 
-        except OSError as e:
-            if "Connection error" in str(e) or "timeout" in str(e).lower():
-                st.error(
-                    "❌ Network error: Could not download the model. Please check your internet connection."
-                )
-            else:
-                st.error(f"❌ Model loading error: {str(e)}")
-            return False
-        except RuntimeError as e:
-            if "CUDA" in str(e):
-                st.error("❌ GPU memory error. Trying to use CPU instead...")
-                try:
-                    _self.summarizer = pipeline(
-                        "summarization",
-                        model=_self.model_name,
-                        device=-1,  # Force CPU
-                        torch_dtype=torch.float32,
-                    )
-                    _self.tokenizer = AutoTokenizer.from_pretrained(_self.model_name)
-                    st.success("✅ Model loaded successfully on CPU")
-                    return True
-                except Exception as cpu_e:
-                    st.error(f"❌ Failed to load model on CPU: {str(cpu_e)}")
-                    return False
-            else:
-                st.error(f"❌ Runtime error loading model: {str(e)}")
-                return False
-        except Exception as e:
-            st.error(f"❌ Unexpected error loading model: {str(e)}")
-            return False
+        self.model_name = model_name
+        self.backend = backend
+        self.summarizer = None
+        self.tokenizer = None
+        if self.registry.is_loaded(model_name, backend):
+            self.load_model()
+
+    def with_reporter(self, reporter: ProgressReporter) -> "TextSummarizer":
+        """
+        Get a copy of this summarizer that reports to another reporter
+
+        The copy keeps the current settings and shares the model, cache and
+        registry, so background jobs can report progress on their own.
+
+        Args:
+            reporter: Receives the copy's messages and progress
+
+        Returns:
+            TextSummarizer: Summarizer copy
+        """
+        summarizer = copy.copy(self)
+        summarizer.reporter = reporter
+        return summarizer
+
+    def apply_preset(self, preset: GenerationPreset):
+        """
+        Use a preset's length range and decoding strategy
+
+        Args:
+            preset: Preset from generation_policy.PRESETS
+        """
+        self.min_summary_length = preset.min_length
+        self.max_summary_length = preset.max_length
+        self.length_ratio = preset.length_ratio
+        self.generation_preset = preset
+
+    @property
+    def can_stream(self) -> bool:
+        """Whether summaries can be streamed token by token, which needs greedy decoding"""
+        if self.generation_preset is not None:
+            return self.generation_preset.num_beams == 1
+        if self.summarizer is None:
+            return False  # The model's own decoding settings are not known yet
+        return (self.summarizer.generation_config.num_beams or 1) == 1
+
+    def _ensure_model_loaded(self):
+        """Load the model if it is not loaded yet"""
+        if self.summarizer is None:
+            if self.registry.is_loaded(self.model_name, self.backend):
+                self.load_model()
+                return
+            with self.reporter.stage("Loading AI model..."):
+                self.load_model()
 
     def chunk_text(self, text: str) -> List[str]:
         """
         Split long text into smaller chunks for processing
 
+        With a fast tokenizer, whole sentences are packed into chunks that fit
+        the model's input limit, and each chunk keeps its token IDs so the text
+        is not encoded a second time before generation.
+
         Args:
             text: Input text to chunk
 
         Returns:
             List[str]: List of text chunks
         """
-        if not self.tokenizer:
+        if not self.tokenizer or not getattr(self.tokenizer, "is_fast", False):
             # Fallback chunking by sentences if tokenizer not available
             sentences = re.split(r"[.!?]+", text)
             chunks = []
@@ -118,17 +256,157 @@ class TextSummarizer:
 
             return chunks
 
-        # Use tokenizer for precise chunking
-        tokens = self.tokenizer.encode(text)
+        # Use tokenizer offsets to map sentence boundaries onto tokens
+        token_ids, offsets = self.tokens.encode_with_offsets(text)
+        if not token_ids:
+            return []
+
+        token_starts = [start for start, _ in offsets]
+        boundaries = {0, len(token_ids)}
+        for match in SENTENCE_BREAK.finditer(text):
+            boundaries.add(bisect.bisect_left(token_starts, match.start()))
+        boundaries = sorted(boundaries)
+
+        limit = self._chunk_token_limit()
+        head_ids, tail_ids = self._special_token_ids()
+        head_ids = head_ids + self._prefix_ids()
         chunks = []
 
-        for i in range(0, len(tokens), self.max_chunk_length):
-            chunk_tokens = tokens[i : i + self.max_chunk_length]
-            chunk_text = self.tokenizer.decode(chunk_tokens, skip_special_tokens=True)
-            chunks.append(chunk_text)
+        def add_chunk(start: int, end: int):
+            chunk = TextChunk(text[offsets[start][0] : offsets[end - 1][1]].strip())
+            chunk.input_ids = head_ids + token_ids[start:end] + tail_ids
+            chunks.append(chunk)
+
+        # Greedily pack whole sentences into chunks
+        chunk_start = 0
+        chunk_end = 0
+        for sentence_start, sentence_end in zip(boundaries, boundaries[1:]):
+            if sentence_end - chunk_start <= limit:
+                chunk_end = sentence_end
+                continue
+
+            if chunk_end > chunk_start:
+                add_chunk(chunk_start, chunk_end)
+
+            # Split sentences that are longer than a chunk on their own
+            chunk_start = sentence_start
+            while sentence_end - chunk_start > limit:
+                add_chunk(chunk_start, chunk_start + limit)
+                chunk_start += limit
+            chunk_end = sentence_end
+
+        if chunk_end > chunk_start:
+            add_chunk(chunk_start, chunk_end)
 
         return chunks
 
+    def chunk_paragraphs(self, text: str) -> List[str]:
+        """
+        Split text into content-defined chunks anchored on paragraph boundaries
+
+        Whether a chunk ends after a paragraph depends only on that
+        paragraph's own content, so editing one paragraph changes only the
+        chunk that contains it (and at most the chunk after it). Unchanged
+        chunks keep their text, and their summaries come from the chunk cache.
+        Paragraphs too long for one chunk are split into sentences first.
+
+        Args:
+            text: Input text to chunk
+
+        Returns:
+            List[str]: List of text chunks
+        """
+        if not self.tokenizer or not getattr(self.tokenizer, "is_fast", False):
+            return self.chunk_text(text)
+
+        limit = self._chunk_token_limit()
+        # Aim for two thirds of the limit on average: closer to the limit means
+        # fewer chunks and model passes, but the hard limit would then decide
+        # more boundaries, and those move when an earlier paragraph is edited
+        target = max(1, 2 * limit // 3)
+
+        units = []
+        for paragraph in PARAGRAPH_BREAK.split(text):
+            paragraph = paragraph.strip()
+            if paragraph:
+                units.append(paragraph)
+        counts = self._token_counts(units)
+
+        def split_oversized(splitter: Callable[[str], List[str]]):
+            split_units = []
+            for unit, count in zip(units, counts):
+                split_units.extend(splitter(unit) if count > limit else [unit])
+            return split_units, self._token_counts(split_units)
+
+        # Break paragraphs that exceed the limit into sentences, then hard-split
+        # any sentence that is still too long
+        if any(count > limit for count in counts):
+            units, counts = split_oversized(split_sentences)
+        if any(count > limit for count in counts):
+            units, counts = split_oversized(self.chunk_text)
+
+        chunk_texts = []
+        current: List[str] = []
+        current_tokens = 0
+        for unit, count in zip(units, counts):
+            if current and current_tokens + count + 1 > limit:
+                chunk_texts.append(" ".join(current))
+                current, current_tokens = [], 0
+
+            current.append(unit)
+            current_tokens += count + 1
+
+            # Anchor with probability count/target, decided by the unit's hash
+            digest = hashlib.blake2b(unit.encode("utf-8"), digest_size=8).digest()
+            if int.from_bytes(digest, "big") / 2**64 < count / target:
+                chunk_texts.append(" ".join(current))
+                current, current_tokens = [], 0
+
+        if current:
+            chunk_texts.append(" ".join(current))
+
+        # Encode every chunk once so generation reuses the IDs
+        return self._encode_chunks(chunk_texts)
+
+    def _token_counts(self, texts: List[str]) -> List[int]:
+        """
+        Count tokens of several texts, encoding new ones in one tokenizer call
+
+        Args:
+            texts: Texts to count
+
+        Returns:
+            List[int]: Token count per text, without special tokens
+        """
+        return self.tokens.count(texts)
+
+    def estimate(self, text: str) -> Optional[SummaryEstimate]:
+        """
+        Estimate the tokens, chunks and time a summary of text takes
+
+        The encoding is remembered, so chunking the same text afterwards does
+        not tokenize it again. Time is extrapolated from recent chunks
+        summarized with the current model and settings.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Optional[SummaryEstimate]: Estimate, or None if the model is not loaded yet
+        """
+        if not self.tokenizer or not getattr(self.tokenizer, "is_fast", False):
+            return None
+
+        tokens = len(self.tokens.encode_with_offsets(text)[0])
+        chunks = math.ceil(tokens / self._chunk_token_limit())
+        passes = chunks
+        if chunks > 1:
+            # Chunk summaries are reduced in windows of up to reduce_fan_in
+            passes += math.ceil(chunks / max(2, self.reduce_fan_in))
+        chunk_seconds = self._chunk_seconds.get(self._timing_key())
+        seconds = passes * chunk_seconds if chunk_seconds is not None else None
+        return SummaryEstimate(tokens, chunks, seconds)
+
     def summarize_chunk(self, chunk: str) -> Optional[str]:
         """
         Summarize a single text chunk
@@ -139,27 +417,446 @@ class TextSummarizer:
         Returns:
             str: Summary of the chunk or None if summarization fails
         """
+        return self._summarize_batch([chunk])[0]
+
+    def summarize_chunks(
+        self,
+        chunks: List[str],
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> List[Optional[str]]:
+        """
+        Summarize text chunks in batches
+
+        Chunks with a cached summary are skipped. The remaining chunks are
+        sorted by length before batching so that each batch pads to a similar
+        length, then the summaries are put back in document order.
+
+        Args:
+            chunks: Text chunks to summarize
+            progress_callback: Called with (completed_batches, total_batches)
+
+        Returns:
+            List[Optional[str]]: Summary per chunk (None where summarization failed)
+        """
+        summaries: List[Optional[str]] = [None] * len(chunks)
+        keys = [self._cache_key(chunk, "chunk") for chunk in chunks]
+        pending = []
+        for i, key in enumerate(keys):
+            summaries[i] = self.cache.get(key)
+            if summaries[i] is None:
+                pending.append(i)
+        self.metrics.count("chunk_cache_hits", len(chunks) - len(pending))
+        self.metrics.count("chunk_cache_misses", len(pending))
+
+        order = sorted(pending, key=lambda i: len(chunks[i]), reverse=True)
+        if self.scheduler is not None:
+            # The shared scheduler batches chunks across requests itself
+            batches = [order] if order else []
+        else:
+            batch_size = max(1, self.batch_size)
+            batches = [
+                order[i : i + batch_size] for i in range(0, len(order), batch_size)
+            ]
+
+        for batch_num, batch in enumerate(batches):
+            batch_summaries = self._summarize_batch([chunks[i] for i in batch])
+            for index, summary in zip(batch, batch_summaries):
+                summaries[index] = summary
+                if summary:
+                    self.cache.put(keys[index], summary)
+
+            if progress_callback:
+                progress_callback(batch_num + 1, len(batches))
+
+        return summaries
+
+    def _summarize_batch(self, batch: List[str]) -> List[Optional[str]]:
+        """
+        Summarize a batch of chunks, through the shared scheduler if one is attached
+
+        Args:
+            batch: Text chunks of similar length
+
+        Returns:
+            List[Optional[str]]: Summary per chunk in batch order
+        """
+        if self.scheduler is not None:
+            futures = [self.scheduler.submit(chunk) for chunk in batch]
+            return [future.result() for future in futures]
+
+        return self.run_batch(batch)
+
+    def run_batch(self, batch: List[str]) -> List[Optional[str]]:
+        """
+        Run one batch of chunks through the model
+
+        Args:
+            batch: Text chunks of similar length
+
+        Returns:
+            List[Optional[str]]: Summary per chunk in batch order
+        """
+        batch = self._encode_chunks(batch)
+        # Every chunk gets the length budget of its own input, so only chunks
+        # that share a budget are generated together
+        groups: Dict[Tuple[int, int], List[int]] = {}
+        for index, chunk in enumerate(batch):
+            lengths = self._summary_lengths(len(chunk.input_ids))
+            groups.setdefault(lengths, []).append(index)
+
+        summaries: List[Optional[str]] = [None] * len(batch)
+        for (min_length, max_length), indices in groups.items():
+            group = [batch[index] for index in indices]
+            for index, summary in zip(
+                indices, self._generate_group(group, min_length, max_length)
+            ):
+                summaries[index] = summary
+        return summaries
+
+    def _generate_group(
+        self, batch: List[str], min_length: int, max_length: int
+    ) -> List[Optional[str]]:
+        """
+        Generate summaries for chunks that share a length budget
+
+        A failed batch is retried one chunk at a time, so one bad chunk does
+        not lose the others' summaries.
+
+        Args:
+            batch: Text chunks carrying token IDs
+            min_length: Minimum summary length in tokens
+            max_length: Maximum summary length in tokens
+
+        Returns:
+            List[Optional[str]]: Summary per chunk in batch order (None on failure)
+        """
         try:
-            # Adjust summary length based on chunk length
-            chunk_length = len(chunk.split())
-            max_length = min(
-                self.max_summary_length, max(self.min_summary_length, chunk_length // 3)
+            return self._generate(batch, min_length, max_length)
+
+        except Exception as e:
+            if len(batch) == 1:
+                self.reporter.warning(f"Error summarizing chunk: {str(e)}")
+                return [None]
+
+            self.reporter.warning(
+                f"Batched summarization failed, retrying chunks one by one: {str(e)}"
             )
-            min_length = min(self.min_summary_length, max_length // 2)
-
-            summary = self.summarizer(
-                chunk,
-                max_length=max_length,
-                min_length=min_length,
-                do_sample=False,
-                truncation=True,
+            return [
+                self._generate_group([chunk], min_length, max_length)[0]
+                for chunk in batch
+            ]
+
+    def _generate(self, batch: List[str], min_length: int, max_length: int) -> List[str]:
+        """
+        Generate summaries for a batch of chunks with the loaded model
+
+        Args:
+            batch: Text chunks (token IDs are reused when a chunk carries them)
+            min_length: Minimum summary length in tokens
+            max_length: Maximum summary length in tokens
+
+        Returns:
+            List[str]: Summary per chunk in batch order
+        """
+        import torch
+
+        with self._generation_slot(), self.metrics.span(
+            "summarize_batch"
+        ), torch.inference_mode():
+            inputs = self._model_inputs(batch)
+            start = time.perf_counter()
+            with self.metrics.span(self._decode_stage()):
+                output_ids = self.summarizer.model.generate(
+                    **inputs, **self._generation_kwargs(min_length, max_length)
+                )
+            self._record_chunk_seconds((time.perf_counter() - start) / len(batch))
+
+        self.metrics.count("chunks_summarized", len(batch))
+        self.metrics.count("tokens_in", int(inputs["attention_mask"].sum()))
+        self.metrics.count(
+            "tokens_out", int((output_ids != self.tokenizer.pad_token_id).sum())
+        )
+        return self.tokenizer.batch_decode(
+            output_ids, skip_special_tokens=True, clean_up_tokenization_spaces=True
+        )
+
+    def _generate_stream(self, chunk: str, min_length: int, max_length: int) -> Iterator[str]:
+        """
+        Generate a summary for one chunk, yielding text as tokens are decoded
+
+        Args:
+            chunk: Text chunk
+            min_length: Minimum summary length in tokens
+            max_length: Maximum summary length in tokens
+
+        Yields:
+            str: Newly decoded summary text
+
+        Raises:
+            Exception: Whatever generation raised, once the streamed text ends
+        """
+        # Streamers do not support beam search; callers check can_stream
+        import torch
+        from transformers import TextIteratorStreamer
+
+        streamer = TextIteratorStreamer(
+            self.tokenizer, skip_special_tokens=True, clean_up_tokenization_spaces=True
+        )
+        inputs = self._model_inputs([chunk])
+        errors = []
+
+        generation_kwargs = self._generation_kwargs(min_length, max_length)
+
+        def generate():
+            try:
+                with torch.inference_mode(), self.metrics.span(self._decode_stage()):
+                    self.summarizer.model.generate(
+                        **inputs, **generation_kwargs, streamer=streamer
+                    )
+            except Exception as e:
+                errors.append(e)
+                streamer.end()  # Unblock the consumer
+
+        with self._generation_slot():
+            thread = threading.Thread(
+                target=generate, name="summary-stream", daemon=True
             )
+            thread.start()
+            try:
+                for text in streamer:
+                    if text:
+                        yield text
+            finally:
+                thread.join()
 
-            return summary[0]["summary_text"]
+        if errors:
+            raise errors[0]
 
-        except Exception as e:
-            st.warning(f"Error summarizing chunk: {str(e)}")
-            return None
+    def _generation_slot(self):
+        """Hold a CPU scheduler slot for one generation (no-op without a scheduler)"""
+        if self.cpu_scheduler is None:
+            return nullcontext()
+        return self.cpu_scheduler.slot()
+
+    def _model_inputs(self, batch: List[str]):
+        """
+        Build padded model inputs for a batch of chunks
+
+        Args:
+            batch: Text chunks (token IDs are reused when a chunk carries them)
+
+        Returns:
+            BatchEncoding: input_ids and attention_mask on the model's device
+        """
+        input_ids = [chunk.input_ids for chunk in self._encode_chunks(batch)]
+        inputs = self.tokenizer.pad({"input_ids": input_ids}, return_tensors="pt")
+        return inputs.to(self.summarizer.device)
+
+    def _generation_kwargs(self, min_length: int, max_length: int) -> dict:
+        """
+        Get the generate() arguments for a summary length range
+
+        Args:
+            min_length: Minimum summary length in tokens
+            max_length: Maximum summary length in tokens
+
+        Returns:
+            dict: Keyword arguments for model.generate
+        """
+        kwargs = {
+            "generation_config": self.summarizer.generation_config,
+            "max_length": max_length,
+            # The pipeline's default max_new_tokens would override max_length
+            "max_new_tokens": None,
+            "min_length": min_length,
+            "do_sample": False,
+        }
+        preset = self.generation_preset
+        if preset is not None:
+            kwargs.update(
+                num_beams=preset.num_beams,
+                # Stop once enough beams have finished instead of searching
+                # until no beam can improve
+                early_stopping=preset.num_beams > 1,
+            )
+            if preset.no_repeat_ngram_size is not None:
+                kwargs["no_repeat_ngram_size"] = preset.no_repeat_ngram_size
+            if preset.length_penalty is not None:
+                kwargs["length_penalty"] = preset.length_penalty
+        return kwargs
+
+    def _timing_key(self) -> str:
+        """Key that chunk timings are kept under for the current settings"""
+        return f"{self.model_name}@{self.backend}:{self._decode_stage()}"
+
+    def _record_chunk_seconds(self, seconds: float):
+        """Fold one chunk's generation time into the running average for estimates"""
+        key = self._timing_key()
+        previous = self._chunk_seconds.get(key)
+        self._chunk_seconds[key] = (
+            seconds if previous is None else 0.7 * previous + 0.3 * seconds
+        )
+
+    def _decode_stage(self) -> str:
+        """Stage name that decode time is recorded under, per preset"""
+        preset = self.generation_preset
+        return f"decode_{preset.name}" if preset is not None else "decode"
+
+    @property
+    def tokens(self) -> TokenizerService:
+        """Batched, memoized encoding with the loaded tokenizer"""
+        return tokenizer_service(self.tokenizer)
+
+    def _encode_chunks(self, chunks: List[str]) -> List[TextChunk]:
+        """
+        Get chunks that carry their model input IDs, encoding the rest in one batch
+
+        Args:
+            chunks: Text chunks
+
+        Returns:
+            List[TextChunk]: The chunks with input_ids set, in order
+        """
+        missing = [chunk for chunk in chunks if not getattr(chunk, "input_ids", None)]
+        encodings = iter(
+            self.tokens.encode(
+                [self._prefix() + chunk for chunk in missing],
+                add_special_tokens=True,
+                max_length=self._model_input_limit(),
+            )
+        )
+
+        encoded = []
+        for chunk in chunks:
+            if not getattr(chunk, "input_ids", None):
+                chunk = TextChunk(chunk)
+                chunk.input_ids = next(encodings)
+            encoded.append(chunk)
+        return encoded
+
+    def _with_input_ids(self, chunk: str) -> TextChunk:
+        """
+        Get a chunk that carries its model input IDs, encoding it if needed
+
+        Args:
+            chunk: Text chunk
+
+        Returns:
+            TextChunk: The chunk with input_ids set
+        """
+        return self._encode_chunks([chunk])[0]
+
+    def _prefix(self) -> str:
+        """Task prefix the model expects in front of its input (e.g. T5)"""
+        return getattr(self.summarizer, "prefix", None) or ""
+
+    def _prefix_ids(self) -> List[int]:
+        """Token IDs of the task prefix"""
+        prefix = self._prefix()
+        if not prefix:
+            return []
+        return self.tokens.encode([prefix])[0]
+
+    def _special_token_ids(self) -> Tuple[List[int], List[int]]:
+        """
+        Find the special tokens the tokenizer adds around a sequence
+
+        Returns:
+            Tuple[List[int], List[int]]: Token IDs added before and after the text
+        """
+        probe = self.tokens.encode(["summary"])[0]
+        full = self.tokens.encode(["summary"], add_special_tokens=True)[0]
+        for i in range(len(full) - len(probe) + 1):
+            if full[i : i + len(probe)] == probe:
+                return full[:i], full[i + len(probe) :]
+        return [], []
+
+    def _model_input_limit(self) -> int:
+        """
+        Get the number of input tokens the model accepts
+
+        Returns:
+            int: Input limit including special tokens
+        """
+        limit = self.tokenizer.model_max_length
+        if limit > 100_000:
+            # Tokenizer has no limit configured, fall back to the model config
+            config = getattr(getattr(self.summarizer, "model", None), "config", None)
+            limit = getattr(config, "max_position_embeddings", 1024)
+
+        if self.max_chunk_length:
+            limit = min(limit, self.max_chunk_length)
+        return limit
+
+    def _chunk_token_limit(self) -> int:
+        """
+        Get the number of text tokens that fit in one chunk
+
+        Returns:
+            int: Input limit minus special tokens and task prefix
+        """
+        head_ids, tail_ids = self._special_token_ids()
+        reserved = len(head_ids) + len(tail_ids) + len(self._prefix_ids())
+        return self._model_input_limit() - reserved
+
+    def _count_input_tokens(self, chunks: List[str]) -> int:
+        """
+        Count model input tokens of chunks that carry their token IDs
+
+        Args:
+            chunks: Text chunks
+
+        Returns:
+            int: Total number of input tokens
+        """
+        return sum(len(getattr(chunk, "input_ids", None) or ()) for chunk in chunks)
+
+    def _cache_key(self, text: str, kind: str) -> str:
+        """
+        Build the cache key for text under the current model and length settings
+
+        Args:
+            text: Document or chunk text
+            kind: Cache namespace ("doc", "chunk", or their "stream-" variants)
+
+        Returns:
+            str: Cache key
+        """
+        # Quantized and exported models can word summaries slightly differently
+        model_key = (
+            self.model_name
+            if self.backend == "torch"
+            else f"{self.model_name}@{self.backend}"
+        )
+        # Decoding strategy and length ratio change the summary as well
+        preset_name = (
+            self.generation_preset.name if self.generation_preset is not None else "default"
+        )
+        model_key += f"#{preset_name}:{self.length_ratio}"
+        return SummaryCache.make_key(
+            text,
+            model_key,
+            self.min_summary_length,
+            self.max_summary_length,
+            kind,
+        )
+
+    def _summary_lengths(self, input_tokens: int) -> Tuple[int, int]:
+        """
+        Compute summary length bounds for a chunk
+
+        Args:
+            input_tokens: Model input tokens of the chunk
+
+        Returns:
+            Tuple[int, int]: (min_length, max_length) in tokens
+        """
+        return length_budget(
+            input_tokens,
+            self.min_summary_length,
+            self.max_summary_length,
+            self.length_ratio,
+        )
 
     def format_as_bullets(self, summary_text: str) -> str:
         """
@@ -182,104 +879,674 @@ class TextSummarizer:
 
         return "\n".join(bullets)
 
-    def summarize_text(self, text: str) -> Optional[str]:
+    def summarize(self, text: str, incremental: bool = False) -> SummaryResult:
         """
         Complete text summarization pipeline
 
         Args:
             text: Input text to summarize
+            incremental: Use paragraph-anchored chunks so that re-summarizing
+                an edited text only summarizes the changed chunks again
 
         Returns:
-            str: Formatted summary or None if summarization fails
+            SummaryResult: Formatted summary and chunk statistics
+
+        Raises:
+            InputError: If the text is too short
+            SummarizerError: If the model cannot be loaded or nothing could be summarized
         """
-        if not text or len(text.strip()) < 100:
-            st.error(
-                "❌ Text is too short to summarize effectively (minimum 100 characters required)"
+        with self.metrics.span("summarize"):
+            text = self._prepare_text(text)
+
+            # Return a previous summary of the same document if we have one
+            document_key = self._cache_key(text, "doc")
+            cached_summary = self.cache.get(document_key)
+            if cached_summary is not None:
+                self.metrics.count("document_cache_hits")
+                return SummaryResult(cached_summary, chunk_count=0, cached=True)
+            self.metrics.count("document_cache_misses")
+
+            self._ensure_model_loaded()
+            chunks = self._chunk(text, incremental)
+            chunk_summaries = self._summarize_all(chunks)
+
+            result = self._reduce_summaries(chunk_summaries)
+            result.input_tokens = self._count_input_tokens(chunks)
+
+            # Only remember complete summaries so failed chunks get retried
+            if result.failed_chunks == 0:
+                self.cache.put(document_key, result.summary)
+
+            return result
+
+    def summarize_documents(
+        self, texts: List[str]
+    ) -> List[Union[SummaryResult, SummarizerError]]:
+        """
+        Summarize several documents, batching chunks across documents
+
+        The chunks of every document are pooled, so model batches are filled
+        from all documents instead of padding out each document's last batch,
+        and the chunk summaries are then reduced per document.
+
+        Args:
+            texts: Input texts to summarize
+
+        Returns:
+            List: SummaryResult per text in order, or the error that text failed with
+
+        Raises:
+            ModelLoadError: If the model cannot be loaded
+        """
+        results: List[Union[SummaryResult, SummarizerError, None]] = [None] * len(texts)
+        with self.metrics.span("summarize_documents"):
+            pending = []
+            for index, text in enumerate(texts):
+                try:
+                    text = self._prepare_text(text)
+                except SummarizerError as e:
+                    results[index] = e
+                    continue
+
+                document_key = self._cache_key(text, "doc")
+                cached_summary = self.cache.get(document_key)
+                if cached_summary is not None:
+                    self.metrics.count("document_cache_hits")
+                    results[index] = SummaryResult(cached_summary, chunk_count=0, cached=True)
+                    continue
+                self.metrics.count("document_cache_misses")
+                pending.append((index, document_key, text))
+
+            if not pending:
+                return results
+
+            self._ensure_model_loaded()
+            documents = []
+            for index, document_key, text in pending:
+                try:
+                    documents.append((index, document_key, self._chunk(text, False)))
+                except SummarizerError as e:
+                    results[index] = e
+
+            chunk_summaries = iter(
+                self._summarize_all([chunk for *_, chunks in documents for chunk in chunks])
+            )
+            for index, document_key, chunks in documents:
+                try:
+                    result = self._reduce_summaries(
+                        [next(chunk_summaries) for _ in chunks]
+                    )
+                except SummarizerError as e:
+                    results[index] = e
+                    continue
+
+                result.input_tokens = self._count_input_tokens(chunks)
+                if result.failed_chunks == 0:
+                    self.cache.put(document_key, result.summary)
+                results[index] = result
+
+        return results
+
+    def stream_summary(self, text: str, incremental: bool = False) -> SummaryStream:
+        """
+        Summarization pipeline that yields the summary text as it is generated
+
+        Chunks are summarized in batches as in summarize, and the last model
+        pass (the final reduce window, or the only chunk of a short text) is
+        streamed token by token. The raw text is yielded; the bullet-formatted
+        summary is in the stream's result once iteration ends.
+
+        Beam search cannot stream, so unless can_stream is set the last pass
+        is generated with the configured decoding and yielded in one piece.
+
+        Args:
+            text: Input text to summarize
+            incremental: Use paragraph-anchored chunks (see summarize)
+
+        Returns:
+            SummaryStream: Iterator over summary text pieces; raises the same
+                errors as summarize while it is iterated
+        """
+        return SummaryStream(self._stream_summary(text, incremental))
+
+    def _stream_summary(
+        self, text: str, incremental: bool
+    ) -> Generator[str, None, SummaryResult]:
+        """Generator behind stream_summary"""
+        start = time.perf_counter()
+        first_token_at = None
+
+        text = self._prepare_text(text)
+        document_key = self._cache_key(text, "stream-doc")
+        cached_summary = self._cached(text, "doc", "stream-doc")
+        if cached_summary is not None:
+            self.metrics.count("document_cache_hits")
+            yield cached_summary
+            return SummaryResult(
+                cached_summary,
+                chunk_count=0,
+                cached=True,
+                time_to_first_token=time.perf_counter() - start,
             )
+
+        self.metrics.count("document_cache_misses")
+        self._ensure_model_loaded()
+        chunks = self._chunk(text, incremental)
+
+        if len(chunks) == 1:
+            summaries, final_input = [], chunks[0]
+        else:
+            chunk_summaries = self._summarize_all(chunks)
+            summaries, failed_chunks = self._successful_summaries(chunk_summaries)
+            summaries = self._tree_reduce(summaries, final_pass=False)
+            final_input = (
+                " ".join(summaries) if self._needs_final_pass(summaries) else None
+            )
+
+        if final_input is None:
+            combined_summary = " ".join(summaries)
+            first_token_at = time.perf_counter()
+            yield combined_summary
+        else:
+            with self.reporter.stage("Writing summary..."):
+                pieces = self._stream_chunk(final_input)
+                while True:
+                    try:
+                        piece = next(pieces)
+                    except StopIteration as done:
+                        final_summary = done.value
+                        break
+                    if first_token_at is None:
+                        first_token_at = time.perf_counter()
+                    yield piece
+
+            if len(chunks) == 1:
+                summaries, failed_chunks = self._successful_summaries([final_summary])
+                combined_summary = final_summary
+            else:
+                # Keep the combined summaries if the final pass failed
+                combined_summary = final_summary or " ".join(summaries)
+
+        result = self._format_result(combined_summary, len(chunks), failed_chunks)
+        result.input_tokens = self._count_input_tokens(chunks)
+        if first_token_at is not None:
+            result.time_to_first_token = first_token_at - start
+            self.metrics.observe("time_to_first_token", result.time_to_first_token)
+
+        if result.failed_chunks == 0:
+            self.cache.put(document_key, result.summary)
+
+        return result
+
+    def _stream_chunk(self, chunk: str) -> Generator[str, None, Optional[str]]:
+        """
+        Summarize one chunk, yielding text as it is generated
+
+        A cached summary, or one generated with beam search, is yielded in
+        one piece.
+
+        Args:
+            chunk: Text chunk to summarize
+
+        Yields:
+            str: Summary text pieces
+
+        Returns:
+            Optional[str]: Complete summary (None if summarization failed)
+        """
+        cached_summary = self._cached(chunk, "chunk", "stream-chunk")
+        if cached_summary is not None:
+            yield cached_summary
+            return cached_summary
+
+        chunk = self._with_input_ids(chunk)
+        if self.can_stream:
+            min_length, max_length = self._summary_lengths(len(chunk.input_ids))
+            pieces = []
+            try:
+                for piece in self._generate_stream(chunk, min_length, max_length):
+                    pieces.append(piece)
+                    yield piece
+            except Exception as e:
+                self.reporter.warning(f"Error summarizing chunk: {str(e)}")
+                return None
+            summary = "".join(pieces).strip()
+        else:
+            summary = (self.run_batch([chunk])[0] or "").strip()
+            if summary:
+                yield summary
+
+        if not summary:
             return None
+        self.cache.put(self._cache_key(chunk, "stream-chunk"), summary)
+        return summary
+
+    def _cached(self, text: str, *kinds: str) -> Optional[str]:
+        """
+        Look up a cached summary under several cache namespaces in order
+
+        Args:
+            text: Document or chunk text
+            kinds: Cache namespaces to try
+
+        Returns:
+            Optional[str]: First cached summary found
+        """
+        for kind in kinds:
+            summary = self.cache.get(self._cache_key(text, kind))
+            if summary is not None:
+                return summary
+        return None
+
+    def _prepare_text(self, text: str) -> str:
+        """
+        Validate input text and pre-filter it if it is very long
+
+        Args:
+            text: Input text to summarize
+
+        Returns:
+            str: Text to chunk
+
+        Raises:
+            InputError: If the text is too short
+        """
+        if not text or len(text.strip()) < 100:
+            raise InputError(
+                "Text is too short to summarize effectively (minimum 100 characters required)"
+            )
 
         # Check text length limits
         word_count = len(text.split())
-        if word_count > 10000:
-            st.warning(
-                f"⚠️ Large text detected ({word_count:,} words). Processing may take several minutes."
+        if self.extractive_ratio and word_count > self.extractive_min_words:
+            text = self._prefilter(text, word_count)
+        elif word_count > 10000:
+            self.reporter.warning(
+                f"Large text detected ({word_count:,} words). Processing may take several minutes."
             )
+        return text
 
-        try:
-            # Load model if not already loaded
-            if not self.summarizer:
-                with st.spinner("🤖 Loading AI model..."):
-                    if not self.load_model():
-                        return None
+    def _chunk(self, text: str, incremental: bool) -> List[str]:
+        """
+        Chunk text for summarization
 
-            # Chunk the text
-            chunks = self.chunk_text(text)
+        Args:
+            text: Input text
+            incremental: Use paragraph-anchored chunks
 
-            if len(chunks) == 0:
-                st.error("❌ Could not process the text into chunks")
-                return None
+        Returns:
+            List[str]: Text chunks
 
-            st.info(f"📄 Processing {len(chunks)} text chunk(s)...")
+        Raises:
+            SummarizationError: If the text produced no chunks
+        """
+        with self.metrics.span("chunk_text"):
+            chunks = self.chunk_paragraphs(text) if incremental else self.chunk_text(text)
 
-            # Summarize each chunk
-            summaries = []
-            progress_bar = st.progress(0)
-            failed_chunks = 0
+        if len(chunks) == 0:
+            raise SummarizationError("Could not process the text into chunks")
 
-            for i, chunk in enumerate(chunks):
-                try:
-                    with st.spinner(f"🔄 Summarizing part {i+1} of {len(chunks)}..."):
-                        chunk_summary = self.summarize_chunk(chunk)
-                        if chunk_summary:
-                            summaries.append(chunk_summary)
-                        else:
-                            failed_chunks += 1
-                except Exception as e:
-                    st.warning(f"⚠️ Failed to summarize chunk {i+1}: {str(e)}")
-                    failed_chunks += 1
-                    continue
+        self.metrics.count("chunks", len(chunks))
 
-                progress_bar.progress((i + 1) / len(chunks))
+        self.reporter.info(f"📄 Processing {len(chunks)} text chunk(s)...")
+        return chunks
 
-            # Check if we have any successful summaries
-            if not summaries:
-                st.error("❌ Could not generate any summaries from the text")
-                return None
+    def _summarize_all(self, chunks: List[str]) -> List[Optional[str]]:
+        """
+        Summarize chunks in batches, reporting progress
 
-            if failed_chunks > 0:
-                st.warning(
-                    f"⚠️ {failed_chunks} out of {len(chunks)} chunks failed to process"
-                )
+        Args:
+            chunks: Text chunks
 
-            # Combine summaries
-            combined_summary = " ".join(summaries)
+        Returns:
+            List[Optional[str]]: Summary per chunk (None where summarization failed)
+        """
 
-            # If we have multiple chunks, summarize the combined summary
-            if len(chunks) > 1 and len(combined_summary.split()) > 200:
-                try:
-                    with st.spinner("🔄 Creating final summary..."):
-                        final_summary = self.summarize_chunk(combined_summary)
-                        if final_summary:
-                            combined_summary = final_summary
-                except Exception as e:
-                    st.warning(
-                        f"⚠️ Could not create final summary, using combined chunks: {str(e)}"
+        def update_progress(completed: int, total: int):
+            self.reporter.progress(completed / total)
+
+        with self.reporter.stage(f"Summarizing {len(chunks)} part(s)..."):
+            return self.summarize_chunks(chunks, update_progress)
+
+    def summarize_text(
+        self,
+        text: str,
+        incremental: bool = False,
+        on_text: Optional[Callable[[str], None]] = None,
+    ) -> Optional[str]:
+        """
+        Summarize text, reporting problems instead of raising them
+
+        Args:
+            text: Input text to summarize
+            incremental: Reuse summaries of unchanged paragraphs (see summarize)
+            on_text: Called with each piece of summary text as it is generated
+                (see stream_summary); not called unless can_stream is set
+
+        Returns:
+            str: Formatted summary or None if summarization fails
+        """
+        if on_text is None or not self.can_stream:
+            return self._report_failures(
+                partial(self.summarize, incremental=incremental), text
+            )
+
+        def consume_stream(text: str) -> SummaryResult:
+            stream = self.stream_summary(text, incremental)
+            for piece in stream:
+                on_text(piece)
+            return stream.result
+
+        return self._report_failures(consume_stream, text)
+
+    def summarize_stream(self, pieces: Iterable[str]) -> SummaryResult:
+        """
+        Summarization pipeline for text that arrives in pieces, such as PDF pages
+
+        Chunks are summarized one batch at a time as soon as enough text has
+        arrived, so the model can run while later pages are still being extracted.
+        With extractive_ratio set, the stream is pre-filtered in windows of
+        extractive_min_words words once it grows past that length.
+
+        Args:
+            pieces: Iterable of text pieces in document order
+
+        Returns:
+            SummaryResult: Formatted summary and chunk statistics
+
+        Raises:
+            SummarizerError: If the model cannot be loaded or nothing could be summarized
+        """
+        self._ensure_model_loaded()
+
+        if self.extractive_ratio:
+            pieces = self._prefilter_stream(pieces)
+
+        chunk_summaries = []
+        pending_chunks = []
+        input_tokens = 0
+
+        with self.reporter.stage("Summarizing pages as they are extracted..."):
+            for chunk in self._iter_stream_chunks(pieces):
+                pending_chunks.append(chunk)
+                input_tokens += self._count_input_tokens([chunk])
+                if len(pending_chunks) >= self.batch_size:
+                    chunk_summaries.extend(self.summarize_chunks(pending_chunks))
+                    pending_chunks = []
+                    self.reporter.progress(
+                        message=f"📄 Summarized {len(chunk_summaries)} text chunk(s)..."
                     )
 
-            # Format as bullet points
-            formatted_summary = self.format_as_bullets(combined_summary)
+            if pending_chunks:
+                chunk_summaries.extend(self.summarize_chunks(pending_chunks))
 
-            if not formatted_summary.strip():
-                st.error("❌ Generated summary is empty")
-                return None
+        if not chunk_summaries:
+            raise SummarizationError("Could not process the text into chunks")
 
-            return formatted_summary
+        result = self._reduce_summaries(chunk_summaries)
+        result.input_tokens = input_tokens
+        return result
 
+    def summarize_pages(self, pages: Iterable[str]) -> Optional[str]:
+        """
+        Summarize streamed text, reporting problems instead of raising them
+
+        Args:
+            pages: Iterable of text pieces in document order
+
+        Returns:
+            str: Formatted summary or None if summarization fails
+        """
+        return self._report_failures(self.summarize_stream, pages)
+
+    def _report_failures(self, summarize: Callable, source) -> Optional[str]:
+        """
+        Run a summarization pipeline and send any failure to the reporter
+
+        Args:
+            summarize: Pipeline method returning a SummaryResult
+            source: Text or text pieces to summarize
+
+        Returns:
+            str: Formatted summary or None if summarization fails
+        """
+        try:
+            return summarize(source).summary
+        except SummarizerError as e:
+            self.reporter.error(str(e))
         except MemoryError:
-            st.error(
-                "❌ Out of memory. Please try with a shorter text or restart the application."
+            self.reporter.error(
+                "Out of memory. Please try with a shorter text or restart the application."
             )
-            return None
         except Exception as e:
-            st.error(f"❌ Unexpected error during summarization: {str(e)}")
-            return None
+            self.reporter.error(f"Unexpected error during summarization: {str(e)}")
+        return None
+
+    def _prefilter(self, text: str, word_count: int) -> str:
+        """
+        Keep the most informative sentences of a very long text
+
+        Args:
+            text: Input text
+            word_count: Number of words in the text
+
+        Returns:
+            str: Selected sentences in document order
+        """
+        with self.metrics.span("prefilter"):
+            filtered = select_sentences(text, self.extractive_ratio)
+        self.reporter.info(
+            f"✂️ Kept the {len(filtered.split()):,} most informative of {word_count:,} words"
+        )
+        return filtered
+
+    def _prefilter_stream(self, pieces: Iterable[str]) -> Iterator[str]:
+        """
+        Pre-filter a stream of text pieces in windows of extractive_min_words words
+
+        Text shorter than extractive_min_words passes through unchanged.
+
+        Args:
+            pieces: Iterable of text pieces in document order
+
+        Yields:
+            str: Selected text per window in document order
+        """
+        window = []
+        window_words = 0
+        filtering = False
+
+        for piece in pieces:
+            window.append(piece)
+            window_words += len(piece.split())
+            if window_words < self.extractive_min_words:
+                continue
+
+            filtering = True
+            yield self._prefilter(" ".join(window), window_words)
+            window = []
+            window_words = 0
+
+        if window:
+            text = " ".join(window)
+            yield self._prefilter(text, window_words) if filtering else text
+
+    def _iter_stream_chunks(self, pieces: Iterable[str]) -> Iterator[str]:
+        """
+        Chunk a stream of text pieces without waiting for the whole document
+
+        Args:
+            pieces: Iterable of text pieces in document order
+
+        Yields:
+            str: Text chunks in document order
+        """
+        # Roughly two chunks' worth of characters before chunking the buffer
+        flush_chars = 8 * self._chunk_token_limit() if self.tokenizer else 4000
+        buffer = []
+        buffered_chars = 0
+
+        for piece in pieces:
+            buffer.append(piece)
+            buffered_chars += len(piece)
+            if buffered_chars < flush_chars:
+                continue
+
+            chunks = self.chunk_text(" ".join(buffer))
+            # The last chunk may continue on the next piece, so keep it buffered
+            yield from chunks[:-1]
+            buffer = chunks[-1:]
+            buffered_chars = sum(len(chunk) for chunk in buffer)
+
+        if buffer:
+            yield from self.chunk_text(" ".join(buffer))
+
+    def _group_summaries(self, summaries: List[str]) -> List[str]:
+        """
+        Pack consecutive summaries into windows that fit the model input
+
+        Args:
+            summaries: Summaries in document order
+
+        Returns:
+            List[str]: One joined text per window, in document order
+        """
+        limit = self._chunk_token_limit()
+        counts = self._token_counts(summaries)
+        fan_in = max(2, self.reduce_fan_in)
+
+        groups: List[List[str]] = []
+        group_tokens = 0
+        for summary, count in zip(summaries, counts):
+            # One token of slack per summary for the space that joins them
+            if groups and len(groups[-1]) < fan_in and group_tokens + count + 1 <= limit:
+                groups[-1].append(summary)
+                group_tokens += count + 1
+            else:
+                groups.append([summary])
+                group_tokens = count
+
+        return [" ".join(group) for group in groups]
+
+    def _tree_reduce(self, summaries: List[str], final_pass: bool = True) -> List[str]:
+        """
+        Summarize groups of summaries level by level until one window remains
+
+        Each level packs the summaries into model-sized windows of at most
+        reduce_fan_in summaries and summarizes the windows as one batch, so the
+        number of levels grows logarithmically with the number of chunks.
+
+        Args:
+            summaries: Chunk summaries in document order
+            final_pass: Also summarize the last window (False leaves it to the caller)
+
+        Returns:
+            List[str]: Remaining summaries in document order (a single one
+                unless the depth limit was reached or they are already short)
+        """
+        for depth in range(1, max(1, self.max_reduce_depth) + 1):
+            if len(summaries) <= 1 or len(" ".join(summaries).split()) <= 200:
+                break
+
+            groups = self._group_summaries(summaries)
+            if len(groups) == len(summaries):
+                break  # Every summary fills a window on its own; no progress possible
+            if len(groups) == 1 and not final_pass:
+                break
+
+            message = (
+                "Creating final summary..."
+                if len(groups) == 1
+                else f"Combining {len(summaries)} summaries into {len(groups)} (level {depth})..."
+            )
+            with self.reporter.stage(message):
+                reduced = self.summarize_chunks(groups)
+
+            # A failed window keeps its input so no content is lost
+            summaries = [summary or group for summary, group in zip(reduced, groups)]
+
+        return summaries
+
+    def _reduce_summaries(self, chunk_summaries: List[Optional[str]]) -> SummaryResult:
+        """
+        Combine chunk summaries into the final bullet-point summary
+
+        Args:
+            chunk_summaries: Summary per chunk (None where summarization failed)
+
+        Returns:
+            SummaryResult: Formatted summary and chunk statistics
+
+        Raises:
+            SummarizationError: If nothing could be summarized
+        """
+        summaries, failed_chunks = self._successful_summaries(chunk_summaries)
+
+        # Combine summaries, reducing them level by level while they are long
+        if len(chunk_summaries) > 1:
+            with self.metrics.span("reduce"):
+                summaries = self._tree_reduce(summaries)
+        combined_summary = " ".join(summaries)
+
+        return self._format_result(combined_summary, len(chunk_summaries), failed_chunks)
+
+    def _needs_final_pass(self, summaries: List[str]) -> bool:
+        """Check whether the summaries still need one more pass over a single window"""
+        return (
+            len(summaries) > 1
+            and len(" ".join(summaries).split()) > 200
+            and len(self._group_summaries(summaries)) == 1
+        )
+
+    def _successful_summaries(
+        self, chunk_summaries: List[Optional[str]]
+    ) -> Tuple[List[str], int]:
+        """
+        Drop failed chunk summaries, warning about them
+
+        Args:
+            chunk_summaries: Summary per chunk (None where summarization failed)
+
+        Returns:
+            Tuple[List[str], int]: Successful summaries and the number of failed chunks
+
+        Raises:
+            SummarizationError: If no chunk was summarized
+        """
+        summaries = [summary for summary in chunk_summaries if summary]
+        failed_chunks = len(chunk_summaries) - len(summaries)
+
+        # Check if we have any successful summaries
+        if not summaries:
+            raise SummarizationError("Could not generate any summaries from the text")
+
+        if failed_chunks > 0:
+            self.reporter.warning(
+                f"{failed_chunks} out of {len(chunk_summaries)} chunks failed to process"
+            )
+        return summaries, failed_chunks
+
+    def _format_result(
+        self, combined_summary: str, chunk_count: int, failed_chunks: int
+    ) -> SummaryResult:
+        """
+        Format the combined summary as bullet points
+
+        Args:
+            combined_summary: Final summary text
+            chunk_count: Number of chunks the text was split into
+            failed_chunks: Number of chunks that could not be summarized
+
+        Returns:
+            SummaryResult: Formatted summary and chunk statistics
+
+        Raises:
+            SummarizationError: If the summary is empty
+        """
+        with self.metrics.span("format_as_bullets"):
+            formatted_summary = self.format_as_bullets(combined_summary)
+
+        if not formatted_summary.strip():
+            raise SummarizationError("Generated summary is empty")
+
+        return SummaryResult(formatted_summary, chunk_count, failed_chunks)
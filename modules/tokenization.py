@@ -0,0 +1,200 @@
+"""
+Tokenization Module
+Shared tokenizer front end that encodes texts in batches and remembers
+recent encodings by content hash.
+"""
+
+import hashlib
+import threading
+import weakref
+from array import array
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+
+class TokenizerService:
+    """Batched, memoized encoding for one tokenizer
+
+    Encodings are kept in a bounded LRU keyed by a hash of the text and the
+    encoding settings, so the same text is not tokenized again by the UI,
+    chunking and generation. They are stored as compact arrays and evicted
+    once the remembered tokens exceed max_tokens.
+    """
+
+    def __init__(self, tokenizer, max_tokens: int = 1_000_000):
+        """
+        Initialize the service
+
+        Args:
+            tokenizer: Hugging Face tokenizer (fast tokenizers encode batches in parallel)
+            max_tokens: Most tokens remembered across all encodings
+        """
+        self.tokenizer = tokenizer
+        self.max_tokens = max_tokens
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[bytes, Tuple[array, Optional[array]]]" = OrderedDict()
+        self._tokens = 0
+        self._lock = threading.Lock()
+        # Fast tokenizers change their truncation settings on every call, and
+        # concurrent calls with different settings fail with "Already borrowed"
+        self._encode_lock = threading.Lock()
+
+    def encode(
+        self,
+        texts: List[str],
+        add_special_tokens: bool = False,
+        max_length: Optional[int] = None,
+    ) -> List[List[int]]:
+        """
+        Encode texts, tokenizing only those not remembered yet in one batch
+
+        Args:
+            texts: Texts to encode
+            add_special_tokens: Add the model's special tokens
+            max_length: Truncate encodings to this many tokens (None keeps all)
+
+        Returns:
+            List[List[int]]: Token IDs per text
+        """
+        settings = f"{int(add_special_tokens)}:{max_length}"
+        keys = [self._key(text, settings) for text in texts]
+        found = self._lookup(keys)
+
+        missing = {}
+        for text, key, entry in zip(texts, keys, found):
+            if entry is None:
+                missing.setdefault(key, text)
+        if missing:
+            with self._encode_lock:
+                encodings = self.tokenizer(
+                    list(missing.values()),
+                    add_special_tokens=add_special_tokens,
+                    truncation=max_length is not None,
+                    max_length=max_length,
+                    verbose=False,
+                )["input_ids"]
+            encoded = {}
+            for key, ids in zip(missing, encodings):
+                encoded[key] = (array("i", ids), None)
+                self._store(key, encoded[key])
+            found = [entry or encoded[key] for key, entry in zip(keys, found)]
+
+        return [entry[0].tolist() for entry in found]
+
+    def encode_with_offsets(self, text: str) -> Tuple[List[int], List[Tuple[int, int]]]:
+        """
+        Encode one text without special tokens, with character offsets per token
+
+        Args:
+            text: Text to encode
+
+        Returns:
+            Tuple[List[int], List[Tuple[int, int]]]: Token IDs and (start, end) offsets
+        """
+        key = self._key(text, "offsets")
+        entry = self._lookup([key])[0]
+        if entry is None:
+            with self._encode_lock:
+                encoding = self.tokenizer(
+                    text,
+                    add_special_tokens=False,
+                    return_offsets_mapping=True,
+                    verbose=False,
+                )
+            offsets = array("i")
+            for start, end in encoding["offset_mapping"]:
+                offsets.append(start)
+                offsets.append(end)
+            entry = (array("i", encoding["input_ids"]), offsets)
+            self._store(key, entry)
+
+        ids, offsets = entry
+        flat = offsets.tolist()
+        return ids.tolist(), list(zip(flat[::2], flat[1::2]))
+
+    def count(self, texts: List[str]) -> List[int]:
+        """
+        Count tokens of texts without special tokens
+
+        Args:
+            texts: Texts to count
+
+        Returns:
+            List[int]: Token count per text
+        """
+        return [len(ids) for ids in self.encode(texts)]
+
+    def clear(self):
+        """Forget every remembered encoding"""
+        with self._lock:
+            self._entries.clear()
+            self._tokens = 0
+
+    def stats(self) -> dict:
+        """Remembered encodings and hit/miss counters"""
+        return {
+            "entries": len(self._entries),
+            "tokens": self._tokens,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    @staticmethod
+    def _key(text: str, settings: str) -> bytes:
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16)
+        digest.update(settings.encode("ascii"))
+        return digest.digest()
+
+    def _lookup(self, keys: List[bytes]) -> List[Optional[Tuple[array, Optional[array]]]]:
+        with self._lock:
+            found = []
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+                    self._entries.move_to_end(key)
+                found.append(entry)
+            return found
+
+    def _store(self, key: bytes, entry: Tuple[array, Optional[array]]):
+        tokens = len(entry[0])
+        if tokens > self.max_tokens:
+            return  # Would evict everything else
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._tokens -= len(previous[0])
+            self._entries[key] = entry
+            self._tokens += tokens
+            while self._tokens > self.max_tokens:
+                _, (ids, _) = self._entries.popitem(last=False)
+                self._tokens -= len(ids)
+
+
+_services: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_services_lock = threading.Lock()
+
+
+def tokenizer_service(tokenizer) -> TokenizerService:
+    """
+    Get the service shared by everyone using a tokenizer
+
+    Summarizers that share a resident model share its encodings; the service
+    goes away with the tokenizer when the model is evicted.
+
+    Args:
+        tokenizer: Hugging Face tokenizer
+
+    Returns:
+        TokenizerService: Service for the tokenizer
+    """
+    with _services_lock:
+        service = _services.get(tokenizer)
+        if service is None:
+            service = TokenizerService(tokenizer)
+            _services[tokenizer] = service
+        return service
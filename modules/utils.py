@@ -3,9 +3,10 @@ Utility functions for the AI Notes Summarizer application
 """
 
 import logging
-import streamlit as st
 from typing import Optional
-import re
+
+from .events import ProgressReporter
+from .text_normalizer import normalize_text
 
 
 def setup_logging():
@@ -18,23 +19,30 @@ def setup_logging():
     return logging.getLogger(__name__)
 
 
-def validate_input(text: str, min_length: int = 50) -> bool:
+def validate_input(
+    text: str, min_length: int = 50, reporter: Optional[ProgressReporter] = None
+) -> bool:
     """
     Validate input text
 
     Args:
         text: Input text to validate
         min_length: Minimum required length
+        reporter: Receives the validation error (defaults to logging)
 
     Returns:
         bool: True if valid, False otherwise
     """
+    reporter = reporter or ProgressReporter()
+
     if not text or not text.strip():
-        st.error("Please provide some text content")
+        reporter.error("Please provide some text content")
         return False
 
     if len(text.strip()) < min_length:
-        st.error(f"Text is too short. Please provide at least {min_length} characters.")
+        reporter.error(
+            f"Text is too short. Please provide at least {min_length} characters."
+        )
         return False
 
     return True
@@ -50,19 +58,7 @@ def clean_text(text: str) -> str:
     Returns:
         str: Cleaned text
     """
-    if not text:
-        return ""
-
-    # Remove excessive whitespace
-    text = re.sub(r"\s+", " ", text)
-
-    # Remove special characters but keep punctuation
-    text = re.sub(r"[^\w\s\.\,\!\?\;\:\-\(\)\[\]\"\'\/]", " ", text)
-
-    # Clean up multiple spaces
-    text = " ".join(text.split())
-
-    return text.strip()
+    return normalize_text(text)
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -83,32 +79,6 @@ def format_file_size(size_bytes: int) -> str:
         return f"{size_bytes / (1024 * 1024):.1f} MB"
 
 
-def display_summary_stats(original_text: str, summary: str):
-    """
-    Display statistics about the summarization
-
-    Args:
-        original_text: Original input text
-        summary: Generated summary
-    """
-    original_words = len(original_text.split())
-    summary_words = len(summary.split())
-    compression_ratio = (
-        (1 - summary_words / original_words) * 100 if original_words > 0 else 0
-    )
-
-    col1, col2, col3 = st.columns(3)
-
-    with col1:
-        st.metric("Original Words", f"{original_words:,}")
-
-    with col2:
-        st.metric("Summary Words", f"{summary_words:,}")
-
-    with col3:
-        st.metric("Compression", f"{compression_ratio:.1f}%")
-
-
 def create_download_link(content: str, filename: str = "summary.txt") -> str:
     """
     Create a download link for the summary
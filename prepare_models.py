@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+AI Notes Summarizer - Model Preparation
+Materializes models into a local artifact directory, typically while building
+the container image, so the application loads them from local safetensors at
+startup without contacting the Hugging Face Hub.
+
+Examples:
+    python prepare_models.py --artifact-dir models facebook/bart-large-cnn
+    MODEL_ARTIFACT_DIR=/app/models PRELOAD_MODELS=t5-small python prepare_models.py
+"""
+
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+from modules.errors import SummarizerError
+from modules.model_artifacts import materialize
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "models",
+        nargs="*",
+        help="Models to materialize, also comma-separated (default: DEFAULT_MODEL "
+        "and PRELOAD_MODELS)",
+    )
+    parser.add_argument(
+        "--artifact-dir",
+        default=os.getenv("MODEL_ARTIFACT_DIR"),
+        help="Artifact directory (default: MODEL_ARTIFACT_DIR)",
+    )
+    args = parser.parse_args(argv)
+    if not args.artifact_dir:
+        parser.error("--artifact-dir or MODEL_ARTIFACT_DIR is required")
+    return args
+
+
+def main():
+    """Materialize the requested models"""
+    args = parse_args()
+    names = args.models or [
+        os.getenv("DEFAULT_MODEL", "facebook/bart-large-cnn"),
+        os.getenv("PRELOAD_MODELS", ""),
+    ]
+    models = [model.strip() for name in names for model in name.split(",")]
+
+    failed = False
+    for model_name in dict.fromkeys(model for model in models if model):
+        try:
+            print(materialize(model_name, args.artifact_dir))
+        except SummarizerError as e:
+            print(f"❌ {e}", file=sys.stderr)
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
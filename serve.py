@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+AI Notes Summarizer - Server Entry Point
+Loads and warms up the models in PRELOAD_MODELS, then starts the Streamlit
+application in the same process, so the first session finds them resident.
+Streamlit only starts answering (including /_stcore/health) once the models
+are warm, which makes its health check a readiness check.
+
+Arguments are passed on to "streamlit run app.py".
+
+Examples:
+    PRELOAD_MODELS=facebook/bart-large-cnn python serve.py --server.port=8501
+"""
+
+import os
+import sys
+import time
+
+from modules.utils import setup_logging
+
+
+def main():
+    """Warm up the configured models and run the Streamlit application"""
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    os.chdir(app_dir)
+    logger = setup_logging()
+
+    from app import model_registry_settings, preload_model_names
+    from modules.model_registry import shared_registry
+
+    preload_models = preload_model_names()
+    if preload_models:
+        start = time.perf_counter()
+        registry = shared_registry(**model_registry_settings())
+        registry.preload(
+            preload_models, os.getenv("INFERENCE_BACKEND", "torch"), warm_up=True
+        )
+        logger.info(
+            f"Warmed up {', '.join(registry.resident_models()) or 'no models'} "
+            f"in {time.perf_counter() - start:.1f}s"
+        )
+
+    from streamlit.web import cli as stcli
+
+    sys.argv = ["streamlit", "run", os.path.join(app_dir, "app.py"), *sys.argv[1:]]
+    sys.exit(stcli.main())
+
+
+if __name__ == "__main__":
+    main()
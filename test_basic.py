@@ -55,6 +55,18 @@ def test_pdf_processor():
         cleaned = processor.preprocess_text(test_text)
         print(f"✅ Text preprocessing works: '{cleaned}'")
 
+        # Every installed backend rejects corrupted files the same way
+        from modules.errors import PDFProcessingError
+        from modules.pdf_backends import available_backends, get_backend
+
+        for name in available_backends():
+            try:
+                get_backend(name).open(b"not a PDF")
+                raise AssertionError(f"{name} opened a corrupted file")
+            except PDFProcessingError:
+                pass
+        print(f"✅ PDF backends available: {', '.join(available_backends())}")
+
         return True
     except Exception as e:
         print(f"❌ PDF Processor test failed: {e}")
@@ -80,6 +92,17 @@ def test_text_summarizer():
         bullets = summarizer.format_as_bullets(test_summary)
         print(f"✅ Bullet formatting works:\n{bullets}")
 
+        # Summary budgets follow the input's token count
+        from modules.generation_policy import DEFAULT_PRESET, PRESETS, length_budget
+
+        summarizer.apply_preset(PRESETS["short"])
+        assert summarizer.generation_preset.num_beams == 1
+        summarizer.apply_preset(PRESETS[DEFAULT_PRESET])
+        assert summarizer.can_stream  # The default setting streams its summaries
+        assert length_budget(20, 50, 300, 0.25) == (10, 20)
+        assert length_budget(2000, 50, 300, 0.25) == (50, 300)
+        print("✅ Generation presets work")
+
         return True
     except Exception as e:
         print(f"❌ Text Summarizer test failed: {e}")
@@ -114,11 +137,486 @@ def test_utils():
         return False
 
 
+def test_summary_cache():
+    """Test summary cache keys, LRU eviction and counters"""
+    print("\nTesting Summary Cache...")
+
+    try:
+        import tempfile
+
+        from modules.cache import DiskStore, SummaryCache
+
+        cache = SummaryCache(max_entries=2)
+
+        # Keys ignore whitespace differences but not settings
+        key = SummaryCache.make_key("Some  notes\n", "model", 50, 300)
+        assert key == SummaryCache.make_key("Some notes", "model", 50, 300)
+        assert key != SummaryCache.make_key("Some notes", "model", 30, 150)
+
+        cache.put("a", "first")
+        cache.put("b", "second")
+        cache.get("a")
+        cache.put("c", "third")
+        assert cache.get("b") is None  # least recently used entry was evicted
+        assert cache.get("a") == "first"
+
+        # Disk hits count for eviction even though reads do not write
+        with tempfile.TemporaryDirectory() as cache_dir:
+            store = DiskStore(os.path.join(cache_dir, "store.sqlite3"), max_bytes=20)
+            store.put("a", b"x" * 8)
+            store.put("b", b"x" * 8)
+            store.get("a")
+            store.put("c", b"x" * 8)
+            assert store.get("b") is None and store.get("a") is not None
+
+        # Counters stay exact under concurrent lookups
+        from concurrent.futures import ThreadPoolExecutor
+
+        cache.clear()
+        cache.put("a", "first")
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(cache.get, ["a", "missing"] * 2000))
+        assert cache.hits == 2000 and cache.misses == 2000
+        print(f"✅ Summary cache works: {cache.stats()}")
+
+        return True
+    except Exception as e:
+        print(f"❌ Summary cache test failed: {e}")
+        return False
+
+
+def test_extraction_cache():
+    """Test that cached extractions are served without parsing the PDF"""
+    print("\nTesting Extraction Cache...")
+
+    try:
+        import hashlib
+        import tempfile
+
+        from modules.cache import ExtractionCache
+        from modules.pdf_processor import PDFProcessor
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = ExtractionCache(os.path.join(cache_dir, "extractions.sqlite3"))
+            data = b"not a real PDF, so a cache miss would fail to parse"
+            processor = PDFProcessor(extraction_cache=cache)
+            key = ExtractionCache.make_key(
+                hashlib.sha256(data).hexdigest(), processor.backend.name
+            )
+            recorder = cache.recorder(key)
+            for page_text in ["First page", None, "Third page"]:
+                recorder.add(page_text)
+            recorder.save()
+
+            result = processor.extract(data)
+            assert result.page_count == 3 and result.failed_pages == [2]
+            assert "Third page" in result.text
+
+            # Extractions over the budget are skipped instead of evicting the rest
+            cache.disk.max_bytes = cache.disk.size_bytes() + 1024
+            recorder = cache.recorder("too-large")
+            recorder.add(os.urandom(2048).hex())
+            recorder.save()
+            assert recorder.overflowed and cache.get("too-large") is None
+            assert cache.get(key) is not None
+            print(f"✅ Extraction cache works: {cache.stats()}")
+
+        return True
+    except Exception as e:
+        print(f"❌ Extraction cache test failed: {e}")
+        return False
+
+
+def test_tokenizer_service():
+    """Test that encodings are batched and remembered by content"""
+    print("\nTesting Tokenizer Service...")
+
+    try:
+        from modules.tokenization import TokenizerService
+
+        calls = []
+
+        def tokenizer(texts, **kwargs):
+            calls.append(list(texts))
+            ids = [[len(word) for word in text.split()] for text in texts]
+            return {"input_ids": ids}
+
+        service = TokenizerService(tokenizer, max_tokens=5)
+        assert service.count(["one two", "three", "one two"]) == [2, 1, 2]
+        assert calls == [["one two", "three"]]  # One batch, duplicates encoded once
+        assert service.encode(["three"]) == [[5]] and len(calls) == 1
+
+        service.count(["a b c d"])  # Exceeds the token budget with the others
+        assert service.stats()["tokens"] <= 5
+        service.clear()
+        service.count(["three"])
+        assert len(calls) == 3  # Encoded again after clearing
+        print(f"✅ Tokenizer service works: {service.stats()}")
+
+        return True
+    except Exception as e:
+        print(f"❌ Tokenizer service test failed: {e}")
+        return False
+
+
+def test_token_chunking():
+    """Test that chunks and reduce windows fit the model input limit"""
+    print("\nTesting Token Chunking and Tree Reduce...")
+
+    try:
+        import random
+
+        from tokenizers import Tokenizer, models, pre_tokenizers, processors
+        from transformers import PreTrainedTokenizerFast
+
+        from modules.cache import SummaryCache
+        from modules.text_summarizer import TextSummarizer
+
+        # A small word-level tokenizer, so nothing is downloaded
+        rng = random.Random(0)
+        words = [f"word{i}" for i in range(50)]
+        sentences = [
+            " ".join(rng.choice(words) for _ in range(rng.randint(5, 20))) + "."
+            for _ in range(200)
+        ]
+        sentences.insert(100, " ".join(rng.choice(words) for _ in range(600)) + ".")
+        text = " ".join(sentences)
+
+        tokens = ["<s>", "<pad>", "</s>", "<unk>", "."] + words
+        vocab = {token: i for i, token in enumerate(tokens)}
+        backend = Tokenizer(models.WordLevel(vocab=vocab, unk_token="<unk>"))
+        backend.pre_tokenizer = pre_tokenizers.Whitespace()
+        backend.post_processor = processors.TemplateProcessing(
+            single="<s> $A </s>", special_tokens=[("<s>", 0), ("</s>", 2)]
+        )
+        tokenizer = PreTrainedTokenizerFast(
+            tokenizer_object=backend,
+            bos_token="<s>",
+            eos_token="</s>",
+            pad_token="<pad>",
+            unk_token="<unk>",
+            model_max_length=512,
+        )
+
+        summarizer = TextSummarizer(cache=SummaryCache(max_entries=0))
+        summarizer.tokenizer = tokenizer
+        limit = summarizer._model_input_limit()
+
+        # Every chunk fits the model, and together the chunks cover every token
+        chunks = summarizer.chunk_text(text)
+        head_ids, tail_ids = summarizer._special_token_ids()
+        assert all(len(chunk.input_ids) <= limit for chunk in chunks)
+        covered = []
+        for chunk in chunks:
+            end = len(chunk.input_ids) - len(tail_ids)
+            covered.extend(chunk.input_ids[len(head_ids) : end])
+        assert covered == summarizer.tokens.encode([text])[0]
+        print(f"✅ Token chunking works: {len(chunks)} chunks of <= {limit} tokens")
+
+        # Stand-in for the model: a window's "summary" is its first 40 words
+        windows = []
+
+        def run_batch(batch):
+            windows.extend(batch)
+            return [" ".join(window.split()[:40]) for window in batch]
+
+        summarizer.run_batch = run_batch
+        text_words = text.split()
+        summaries = [" ".join(text_words[i : i + 30]) for i in range(0, 1800, 30)]
+        reduced = summarizer._tree_reduce(summaries)
+        assert len(reduced) == 1
+        assert all(count <= limit for count in summarizer.tokens.count(windows))
+        assert summarizer.tokens.count(reduced)[0] <= limit
+        print(
+            f"✅ Tree reduce works: {len(summaries)} summaries, {len(windows)} windows"
+        )
+
+        return True
+    except Exception as e:
+        print(f"❌ Token chunking test failed: {e}")
+        return False
+
+
+def test_core_api():
+    """Test that core modules report through events and exceptions"""
+    print("\nTesting Core API...")
+
+    try:
+        from modules.errors import PDFProcessingError
+        from modules.events import ProgressReporter
+        from modules.pdf_processor import PDFProcessor
+        from modules.utils import validate_input
+
+        events = []
+        reporter = ProgressReporter(callback=events.append)
+
+        # Validation errors arrive as events instead of UI calls
+        assert not validate_input("too short", min_length=100, reporter=reporter)
+        assert events and events[-1].kind == "error"
+
+        # Core extraction raises structured errors
+        try:
+            PDFProcessor(reporter=reporter).extract(b"not a pdf")
+            raise AssertionError("Invalid PDF was accepted")
+        except PDFProcessingError as e:
+            print(f"✅ Core API works: {e}")
+
+        # Several files fail one by one instead of all together
+        results = PDFProcessor().process_many([b"not a pdf", b"still not a pdf"])
+        assert all(isinstance(result, PDFProcessingError) for result in results)
+
+        return True
+    except Exception as e:
+        print(f"❌ Core API test failed: {e}")
+        return False
+
+
+def test_api_limits():
+    """Test that the HTTP API rejects request bodies over the size limits"""
+    print("\nTesting API Size Limits...")
+
+    try:
+        import asyncio
+        import hashlib
+        import json
+        import tempfile
+
+        from api import SummarizerAPI
+        from modules.pdf_processor import SpooledUpload, UploadedBytes
+
+        def post(api, path, parts, headers=()):
+            """Send a request body in parts; returns status, payload and parts read"""
+            messages = [
+                {"type": "http.request", "body": part, "more_body": True}
+                for part in parts
+            ]
+            sent = []
+
+            async def receive():
+                return messages.pop(0)
+
+            async def send(message):
+                sent.append(message)
+
+            scope = {
+                "type": "http",
+                "method": "POST",
+                "path": path,
+                "query_string": b"",
+                "headers": list(headers),
+            }
+            messages[-1]["more_body"] = False
+            asyncio.run(api(scope, receive, send))
+            payload = json.loads(sent[1]["body"])
+            return sent[0]["status"], payload, len(parts) - len(messages)
+
+        api = SummarizerAPI()
+        api.pdf_processor.max_file_size = 1024
+        body = b"%PDF-" + b"x" * 2048
+
+        # Rejected from Content-Length before any of the body is read
+        headers = [(b"content-length", str(len(body)).encode())]
+        status, _, read = post(api, "/summarize/pdf", [body], headers)
+        assert status == 413 and read == 0
+
+        # Without Content-Length, reading stops once the limit is exceeded
+        parts = [body[:700], body[700:1400], body[1400:]]
+        status, _, read = post(api, "/summarize/pdf", parts)
+        assert status == 413 and read == 2
+
+        request = json.dumps({"text": "x", "incremental": "maybe"}).encode()
+        status, payload, _ = post(api, "/summarize/text", [request])
+        assert status == 422, payload
+
+        # In large-document mode, bodies over max_file_size are spooled to disk
+        with tempfile.TemporaryDirectory() as spool_dir:
+            api.pdf_processor.max_large_file_size = 4096
+            api.pdf_processor.spool_dir = spool_dir
+
+            async def read_pdf(parts):
+                messages = [
+                    {"type": "http.request", "body": part, "more_body": True}
+                    for part in parts
+                ]
+                messages[-1]["more_body"] = False
+
+                async def receive():
+                    return messages.pop(0)
+
+                scope = {"type": "http", "query_string": b"", "headers": []}
+                return await api._read_pdf(scope, receive)
+
+            upload = asyncio.run(read_pdf(parts))
+            assert isinstance(upload, SpooledUpload) and upload.size == len(body)
+            assert upload.sha256 == hashlib.sha256(body).hexdigest()
+            upload.remove()
+            upload = asyncio.run(read_pdf([body[:700]]))
+            assert isinstance(upload, UploadedBytes)
+
+            # Partial files of bodies over max_large_file_size are removed
+            status, _, read = post(api, "/summarize/pdf", parts * 2)
+            assert status == 413 and read == 6
+            assert not os.listdir(spool_dir)
+        api.executor.shutdown()
+        print("✅ API size limits work")
+
+        return True
+    except Exception as e:
+        print(f"❌ API size limit test failed: {e}")
+        return False
+
+
+def test_metrics():
+    """Test stage timings, counters, traces and Prometheus export"""
+    print("\nTesting Metrics...")
+
+    try:
+        import threading
+
+        from modules.metrics import Metrics
+
+        # Disabled metrics record nothing outside a trace
+        metrics = Metrics()
+        with metrics.span("chunk_text"):
+            pass
+        metrics.count("chunks", 3)
+        assert metrics.snapshot() == {"stages": {}, "counters": {}}
+
+        # A trace records even when process-wide metrics are off
+        with metrics.trace() as trace:
+            with metrics.span("chunk_text"):
+                metrics.count("chunks", 3)
+        assert [span["name"] for span in trace.to_dict()["spans"]] == ["chunk_text"]
+        assert trace.counters == {"chunks": 3}
+
+        # Work shared by several requests (e.g. a model batch) is recorded
+        # into every request's trace, even on another thread
+        with metrics.trace() as first:
+            traces = [metrics.current_trace()]
+        with metrics.trace() as second:
+            traces.append(metrics.current_trace())
+
+        def run_batch():
+            with metrics.record_into(traces + [None]):
+                with metrics.span("summarize_batch"):
+                    metrics.count("tokens_in", 10)
+
+        worker = threading.Thread(target=run_batch)
+        worker.start()
+        worker.join()
+        for shared in (first, second):
+            assert [span["name"] for span in shared.spans] == ["summarize_batch"]
+            assert shared.counters == {"tokens_in": 10}
+
+        metrics = Metrics(enabled=True)
+        with metrics.span("chunk_text"):
+            metrics.count("chunks", 3)
+        exposition = metrics.prometheus_text()
+        assert 'summarizer_stage_seconds_count{stage="chunk_text"} 1' in exposition
+        assert "summarizer_chunks_total 3" in exposition
+        print("✅ Metrics work")
+
+        return True
+    except Exception as e:
+        print(f"❌ Metrics test failed: {e}")
+        return False
+
+
+def test_jobs():
+    """Test background jobs, their reports and failures"""
+    print("\nTesting Background Jobs...")
+
+    try:
+        import time
+
+        from modules.jobs import DONE, FAILED, JobExecutor
+
+        def work(reporter):
+            reporter.progress(0.5, "Halfway")
+            reporter.warning("Something looks odd")
+            return "result"
+
+        def fail(reporter):
+            raise ValueError("broken")
+
+        executor = JobExecutor(max_workers=2)
+        ok_id, failed_id = executor.submit("ok", work), executor.submit("fail", fail)
+        while executor.active_count():
+            time.sleep(0.01)
+        executor.shutdown()
+
+        ok_job, failed_job = executor.get(ok_id), executor.get(failed_id)
+        assert ok_job.status == DONE and ok_job.result == "result"
+        assert ok_job.stage == "Halfway" and ok_job.messages[0].kind == "warning"
+        assert failed_job.status == FAILED and failed_job.error == "broken"
+        print("✅ Background jobs work")
+
+        return True
+    except Exception as e:
+        print(f"❌ Background jobs test failed: {e}")
+        return False
+
+
+def test_cpu_scheduler():
+    """Test that generation slots limit concurrency and queue in order"""
+    print("\nTesting CPU Scheduler...")
+
+    try:
+        import threading
+        import time
+
+        from modules.cpu_scheduler import CPUScheduler
+
+        scheduler = CPUScheduler(cores=4, slots=2)
+        assert scheduler.threads_per_slot == 2
+
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def generate():
+            with scheduler.slot():
+                with lock:
+                    running.append(1)
+                    peak.append(len(running))
+                time.sleep(0.02)
+                with lock:
+                    running.pop()
+
+        threads = [threading.Thread(target=generate) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(peak) <= 2 and scheduler.busy == 0 and scheduler.queued == 0
+        print(f"✅ CPU scheduler works: at most {max(peak)} of 6 generations at once")
+
+        return True
+    except Exception as e:
+        print(f"❌ CPU scheduler test failed: {e}")
+        return False
+
+
 def main():
     """Run all tests"""
     print("🧪 Running Basic Tests for AI Notes Summarizer\n")
 
-    tests = [test_imports, test_pdf_processor, test_text_summarizer, test_utils]
+    tests = [
+        test_imports,
+        test_pdf_processor,
+        test_text_summarizer,
+        test_utils,
+        test_summary_cache,
+        test_extraction_cache,
+        test_tokenizer_service,
+        test_token_chunking,
+        test_core_api,
+        test_api_limits,
+        test_metrics,
+        test_jobs,
+        test_cpu_scheduler,
+    ]
 
     passed = 0
     total = len(tests)